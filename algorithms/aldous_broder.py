@@ -1,4 +1,8 @@
+from typing import cast
+
 from algorithms.base_algorithm import Algorithm
+from base.cell import Cell
+from base.directions import random_step
 from base.grid import Grid
 
 
@@ -7,17 +11,24 @@ class AldousBroder(Algorithm):
     Aldous-Broder algorithm works by always choosing a random neighbor of a randomly-selected also cell, and linking
     them if not yet visited ("random walking"), repeating until all cells are visited once.
     Can take long to compute on big grids (slow-to-finish).
+    The walk runs on cell ids and a visited bitmap, cells are only looked up to carve passages.
     """
 
     def on(self, grid: Grid) -> None:
-        current_cell = grid.random_cell()
-        unvisited_count = grid.size - 1
+        size = grid.size
+        columns = grid.columns
+        visited = bytearray(size)
+
+        start = grid.random_cell()
+        current = start.row * columns + start.column
+        visited[current] = 1
+        unvisited_count = size - 1
 
         while unvisited_count > 0:
-            neighbor = current_cell.random_neighbour()
-            if neighbor is None:
-                raise ValueError("Aldous-Broder algorithm needs all cells to have at least one neighbor")
-            if len(neighbor.links) == 0:
-                current_cell += neighbor
+            _, neighbor = random_step(current, columns, size)
+            if not visited[neighbor]:
+                cell = cast(Cell, grid.cell_at(*divmod(current, columns)))
+                cell += cast(Cell, grid.cell_at(*divmod(neighbor, columns)))
+                visited[neighbor] = 1
                 unvisited_count -= 1
-            current_cell = neighbor
+            current = neighbor
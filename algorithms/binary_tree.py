@@ -1,6 +1,9 @@
 from random import choice
+from typing import cast
 
 from algorithms.base_algorithm import Algorithm
+from algorithms.mask_carving import carve_rows, coin_flips, random_generator, row_blocks, supports_masks
+from base.compact_grid import CompactGrid
 from base.grid import Grid
 
 
@@ -8,9 +11,14 @@ class BinaryTree(Algorithm):
     """
     A binary tree visits each cell in the grid and chooses to carve a passage either north or east with a simple random.
     Causes topmost row and rightmost column to always be straight lines.
+    As every choice is independent, compact grids get all of them drawn at once and written as link bitmasks.
     """
 
     def on(self, grid: Grid) -> None:
+        if supports_masks(grid):
+            self._carve_masks(cast(CompactGrid, grid))
+            return
+
         for cell in grid.each_cell():
             neighbors = []
             if cell.north:
@@ -20,3 +28,17 @@ class BinaryTree(Algorithm):
             if len(neighbors) > 0:
                 neighbor = choice(neighbors)
                 cell += neighbor
+
+    @staticmethod
+    def _carve_masks(grid: CompactGrid) -> None:
+        generator = random_generator()
+        for first_row, rows in row_blocks(grid):
+            north = coin_flips(generator, (rows, grid.columns))
+            # the rightmost column can only go north, the topmost row only east
+            north[:, -1] = True
+            if first_row == 0:
+                north[0] = False
+            east = ~north
+            east[:, -1] = False
+            carve_rows(grid, first_row, north, east)
+        grid.masks_changed()
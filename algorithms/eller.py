@@ -0,0 +1,79 @@
+from random import choice, getrandbits
+from typing import cast, Dict, Generator, List, Optional
+
+from algorithms.base_algorithm import Algorithm
+from algorithms.mask_carving import link_rows, supports_masks
+from base.compact_grid import CompactGrid
+from base.directions import EAST, NORTH, SOUTH, WEST
+from base.grid import Grid
+
+
+class Eller(Algorithm):
+    """
+    Eller's algorithm builds the maze one row at a time, only remembering which set (group of cells connected through
+    the rows above) every cell of the current row belongs to. Neighbors of different sets are randomly joined east,
+    then every set carves south at least once so it doesn't get cut off, and the last row joins all remaining sets.
+    As rows are final once carved, rows() streams them with memory proportional to the number of columns, endlessly
+    if needed; exporters can render them as they come (see Exporter.render_rows).
+    """
+
+    def on(self, grid: Grid) -> None:
+        columns = grid.columns
+        if supports_masks(grid):
+            masks = cast(CompactGrid, grid).link_masks()
+            for row, row_masks in enumerate(self.rows(columns, grid.rows)):
+                masks[row * columns:(row + 1) * columns] = row_masks    # type: ignore
+            cast(CompactGrid, grid).masks_changed()
+            return
+
+        link_rows(grid, self.rows(columns, grid.rows))
+
+    def rows(self, columns: int, rows: Optional[int] = None) -> Generator[bytes, None, None]:
+        """
+        Link bitmasks of every row of a maze of the given width, in order, each one as soon as it is done. Endless
+        unless the number of rows is given.
+        """
+        if columns < 2:
+            raise ValueError("Columns must an integer greater than 1")
+        if rows is not None and rows < 1:
+            raise ValueError("Rows must be a positive integer")
+
+        # set of every cell of the current row, and the next unused set
+        sets = list(range(columns))
+        next_set = columns
+        masks = bytearray(columns)
+        row = 0
+        while rows is None or row < rows:
+            last_row = rows is not None and row == rows - 1
+            members: Dict[int, List[int]] = {}
+            for column, cell_set in enumerate(sets):
+                members.setdefault(cell_set, []).append(column)
+
+            for column in range(columns - 1):
+                kept, joined = sets[column], sets[column + 1]
+                if kept != joined and (last_row or getrandbits(1)):
+                    masks[column] |= EAST
+                    masks[column + 1] |= WEST
+                    # the smaller set gets relabeled
+                    if len(members[kept]) < len(members[joined]):
+                        kept, joined = joined, kept
+                    for member in members[joined]:
+                        sets[member] = kept
+                    members[kept].extend(members.pop(joined))
+
+            next_masks = bytearray(columns)
+            if not last_row:
+                for set_columns in members.values():
+                    carved = [column for column in set_columns if getrandbits(1)] or [choice(set_columns)]
+                    for column in carved:
+                        masks[column] |= SOUTH
+                        next_masks[column] = NORTH
+                # cells not carved into from above start sets of their own
+                for column in range(columns):
+                    if not next_masks[column]:
+                        sets[column] = next_set
+                        next_set += 1
+
+            yield bytes(masks)
+            masks = next_masks
+            row += 1
@@ -1,5 +1,6 @@
+from heapq import heappop, heappush
 from random import choice
-from typing import cast, Optional
+from typing import cast, List
 
 from algorithms.base_algorithm import Algorithm
 
@@ -12,26 +13,59 @@ class HuntAndKill(Algorithm):
     Hunt-and-Kill algorithm picks a random starting cell and randomly walks. It cannot walk on an already visited cell,
     and if finds at a dead-end (no more unvisited cells around current one), "hunts" from the northwest corner the
     first cell that is unvisted and has at least one visited neighbor; then starts walking again.
+    Instead of scanning from the corner, hunts take the lowest cell id out of a heap of the cells that got a visited
+    neighbor, which is the same cell, skipping those visited since.
     """
 
     def on(self, grid: Grid) -> None:
-        current_cell: Optional[Cell] = grid.random_cell()
+        columns = grid.columns
+        size = grid.size
+        visited = bytearray(size)
+        # unvisited cell ids next to visited ones, plus some already visited later on (discarded when found)
+        candidates: List[int] = []
 
-        while current_cell is not None:
-            unvisited_neighbors = [neighbor for neighbor in current_cell.neighbors if len(neighbor.links) == 0]
+        start = grid.random_cell()
+        current = start.row * columns + start.column
+        self._visit(current, visited, candidates, columns, size)
+        while True:
+            unvisited_neighbors = [neighbor for neighbor in self._neighbors(current, columns, size)
+                                   if not visited[neighbor]]
             if len(unvisited_neighbors) > 0:
                 # as long as there are unvisited paths, walk them
                 neighbor = choice(unvisited_neighbors)
-                current_cell += neighbor
-                current_cell = neighbor
             else:
                 # enter hunt mode, find first unvisited cell near any visited cell
-                current_cell = None
-
-                for cell in grid.each_cell():
-                    visited_neighbors = [neighbor for neighbor in cell.neighbors if len(neighbor.links) > 0]
-                    if len(cell.links) == 0 and len(visited_neighbors) > 0:
-                        current_cell = cast(Cell, cell)  # outside of Mypy it's a mere assignment
-                        neighbor = choice(visited_neighbors)
-                        current_cell += neighbor
-                        break
+                while candidates and visited[candidates[0]]:
+                    heappop(candidates)
+                if not candidates:
+                    break
+                current = heappop(candidates)
+                neighbor = choice([neighbor for neighbor in self._neighbors(current, columns, size)
+                                   if visited[neighbor]])
+                self._visit(current, visited, candidates, columns, size)
+
+            cell = cast(Cell, grid.cell_at(*divmod(current, columns)))
+            cell += cast(Cell, grid.cell_at(*divmod(neighbor, columns)))
+            if not visited[neighbor]:
+                self._visit(neighbor, visited, candidates, columns, size)
+                current = neighbor
+
+    @staticmethod
+    def _neighbors(index: int, columns: int, size: int) -> List[int]:
+        neighbors = []
+        if index >= columns:
+            neighbors.append(index - columns)
+        if index + columns < size:
+            neighbors.append(index + columns)
+        column = index % columns
+        if column + 1 < columns:
+            neighbors.append(index + 1)
+        if column > 0:
+            neighbors.append(index - 1)
+        return neighbors
+
+    def _visit(self, index: int, visited: bytearray, candidates: List[int], columns: int, size: int) -> None:
+        visited[index] = 1
+        for neighbor in self._neighbors(index, columns, size):
+            if not visited[neighbor]:
+                heappush(candidates, neighbor)
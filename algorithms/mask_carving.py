@@ -0,0 +1,88 @@
+from random import getrandbits
+from typing import cast, Generator, Iterable, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from base.cell import Cell
+from base.compact_grid import CompactGrid
+from base.directions import EAST, NORTH, SOUTH, WEST
+from base.grid import Grid
+from base.grid_view import GridView
+
+
+# Rows are carved in blocks of about this many cells, keeping the temporary arrays small on huge grids
+CHUNK_CELLS = 1 << 22
+
+Carves = NDArray[np.bool_]
+
+
+def supports_masks(grid: Grid) -> bool:
+    """
+    Whether algorithms can write the links of the grid straight into its bitmask storage
+    """
+    return isinstance(grid, CompactGrid) and not isinstance(grid, GridView)
+
+
+def random_generator() -> np.random.Generator:
+    # seeded from the random module, so random.seed() makes runs repeatable like with the cell by cell versions
+    return np.random.default_rng(getrandbits(64))
+
+
+def coin_flips(generator: np.random.Generator, shape: Tuple[int, int]) -> Carves:
+    """
+    One random boolean per cell, drawn as random bytes unpacked to bits
+    """
+    size = shape[0] * shape[1]
+    bits = np.unpackbits(np.frombuffer(generator.bytes((size + 7) // 8), dtype=np.uint8))
+    return bits[:size].view(np.bool_).reshape(shape)
+
+
+def pick_below(generator: np.random.Generator, bounds: NDArray[np.int32]) -> NDArray[np.int32]:
+    """
+    One random integer from 0 up to each bound (excluded), scaling single precision random floats (24 random bits,
+    plenty for bounds as long as a row)
+    """
+    picks = generator.random(len(bounds), dtype=np.float32)
+    picks *= bounds.astype(np.float32)
+    # products close to a bound can round up to it
+    return np.minimum(picks.astype(np.int32), bounds - 1)
+
+
+def row_blocks(grid: Grid) -> Generator[Tuple[int, int], None, None]:
+    """
+    First row and number of rows of every block of rows to carve at once
+    """
+    step = max(CHUNK_CELLS // grid.columns, 1)
+    for first_row in range(0, grid.rows, step):
+        yield first_row, min(step, grid.rows - first_row)
+
+
+def carve_rows(grid: CompactGrid, first_row: int, north: Carves, east: Carves) -> None:
+    """
+    Writes the links of a block of rows starting at first_row, given which cells carve north and which east, along
+    with the opposite links of their neighbors. Rows above must be carved already, rows below are overwritten later.
+    Call grid.masks_changed() once all rows are carved
+    """
+    masks = np.frombuffer(grid.link_masks(), dtype=np.uint8).reshape(grid.rows, grid.columns)
+    block = north * np.uint8(NORTH)
+    block |= east * np.uint8(EAST)
+    block[:-1] |= north[1:] * np.uint8(SOUTH)
+    block[:, 1:] |= east[:, :-1] * np.uint8(WEST)
+    masks[first_row:first_row + len(block)] = block
+    if first_row > 0:
+        masks[first_row - 1] |= north[0] * np.uint8(SOUTH)
+
+
+def link_rows(grid: Grid, rows: Iterable[bytes]) -> None:
+    """
+    Links the cells of any grid following the link bitmasks of each of its rows, for grids whose storage can't be
+    written directly
+    """
+    for row, row_masks in enumerate(rows):
+        for column, mask in enumerate(row_masks):
+            cell = cast(Cell, grid.cell_at(row, column))
+            if mask & EAST:
+                cell += cast(Cell, cell.east)
+            if mask & SOUTH:
+                cell += cast(Cell, cell.south)
@@ -0,0 +1,151 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+import random
+from typing import cast, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from algorithms.base_algorithm import Algorithm
+from algorithms.mask_carving import link_rows, supports_masks
+from base.compact_grid import CompactGrid
+from base.directions import EAST, NORTH, SOUTH, WEST
+from base.grid import Grid
+
+
+DEFAULT_TILE_SIZE = 512
+
+# first row, first column, rows, columns
+Tile = Tuple[int, int, int, int]
+Walls = NDArray[np.uint8]
+
+
+class ParallelTiles(Algorithm):
+    """
+    Runs another algorithm on square tiles of the grid at the same time, one per process of a pool, each one writing
+    the link bitmasks of its tile into a wall array in shared memory. Tiles are then stitched following a random
+    spanning tree over them (randomized Kruskal), opening one passage through the border of every pair of tiles joined
+    by the tree: as each tile is a perfect maze, so is the whole grid.
+    Tiles are carved with seeds drawn from the random module, so random.seed() makes runs repeatable.
+    Only grids whose link bitmasks can be written at once (CompactGrid and its subclasses) get the whole maze without
+    further work. Cells of any other grid are linked one by one in the main process afterwards, which can take longer
+    than carving them serially in the first place.
+    """
+
+    @property
+    def algorithm(self) -> Algorithm:
+        return self._algorithm
+
+    @property
+    def tile_size(self) -> int:
+        return self._tile_size
+
+    @property
+    def name(self) -> str:
+        return "{}({})".format(self.__class__.__name__, self._algorithm.name)
+
+    def __init__(self, algorithm: Algorithm, tile_size: int = DEFAULT_TILE_SIZE, workers: Optional[int] = None) -> None:
+        if tile_size < 2:
+            raise ValueError("Tile size must be an integer greater than 1")
+        self._algorithm = algorithm
+        self._tile_size = tile_size
+        # None uses as many processes as CPUs
+        self._workers = workers
+
+    def on(self, grid: Grid) -> None:
+        row_bounds = self.bounds(grid.rows)
+        column_bounds = self.bounds(grid.columns)
+        if len(row_bounds) == 1 and len(column_bounds) == 1:
+            self._algorithm.on(grid)
+            return
+
+        tiles = [(first_row, first_column, rows, columns)
+                 for first_row, rows in row_bounds for first_column, columns in column_bounds]
+        seeds = [random.getrandbits(64) for _ in tiles]
+        shared = SharedMemory(create=True, size=grid.size)
+        try:
+            with ProcessPoolExecutor(self._workers) as executor:
+                # consumed to raise any error of the workers
+                list(executor.map(carve_tile, repeat(shared.name), repeat(grid.rows), repeat(grid.columns), tiles,
+                                  repeat(self._algorithm), seeds))
+            walls = np.ndarray((grid.rows, grid.columns), dtype=np.uint8, buffer=shared.buf)
+            self._stitch(walls, row_bounds, column_bounds)
+            if supports_masks(grid):
+                compact_grid = cast(CompactGrid, grid)
+                np.frombuffer(compact_grid.link_masks(), dtype=np.uint8)[:] = walls.ravel()
+                compact_grid.masks_changed()
+            else:
+                link_rows(grid, (row.tobytes() for row in walls))
+            del walls
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def bounds(self, length: int) -> List[Tuple[int, int]]:
+        """
+        First position and length of each tile along a side of the grid. A last tile too thin for the algorithm is
+        merged into the previous one
+        """
+        bounds = [(first, min(self._tile_size, length - first)) for first in range(0, length, self._tile_size)]
+        if len(bounds) > 1 and bounds[-1][1] < 2:
+            first, size = bounds[-2]
+            bounds[-2:] = [(first, size + bounds[-1][1])]
+        return bounds
+
+    @staticmethod
+    def _stitch(walls: Walls, row_bounds: List[Tuple[int, int]], column_bounds: List[Tuple[int, int]]) -> None:
+        tile_columns = len(column_bounds)
+        # borders between neighbor tiles, by tile index (tile row * tile columns + tile column)
+        borders = [(index, index + 1) for index in range(len(row_bounds) * tile_columns)
+                   if index % tile_columns < tile_columns - 1]
+        borders += [(index, index + tile_columns) for index in range((len(row_bounds) - 1) * tile_columns)]
+        random.shuffle(borders)
+
+        parents = list(range(len(row_bounds) * tile_columns))
+
+        def find(index: int) -> int:
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+
+        for first, second in borders:
+            first_root, second_root = find(first), find(second)
+            if first_root == second_root:
+                continue
+            parents[first_root] = second_root
+
+            first_row, rows = row_bounds[first // tile_columns]
+            first_column, columns = column_bounds[first % tile_columns]
+            if second == first + 1:
+                row = first_row + random.randrange(rows)
+                column = first_column + columns - 1
+                walls[row, column] |= EAST
+                walls[row, column + 1] |= WEST
+            else:
+                row = first_row + rows - 1
+                column = first_column + random.randrange(columns)
+                walls[row, column] |= SOUTH
+                walls[row + 1, column] |= NORTH
+
+
+def carve_tile(name: str, rows: int, columns: int, tile: Tile, algorithm: Algorithm, seed: int) -> None:
+    """
+    Runs in a worker process: carves a tile as a maze of its own and copies its link bitmasks into the shared wall
+    array of the whole grid. Tiles don't overlap, so workers never write the same bytes
+    """
+    first_row, first_column, tile_rows, tile_columns = tile
+    random.seed(seed)
+    grid = CompactGrid(tile_rows, tile_columns)
+    algorithm.on(grid)
+
+    shared = SharedMemory(name=name)
+    try:
+        walls = np.ndarray((rows, columns), dtype=np.uint8, buffer=shared.buf)
+        walls[first_row:first_row + tile_rows, first_column:first_column + tile_columns] = \
+            np.frombuffer(grid.link_masks(), dtype=np.uint8).reshape(tile_rows, tile_columns)
+        # the view must be gone before closing
+        del walls
+    finally:
+        shared.close()
@@ -17,19 +17,19 @@ class RecursiveBacktracker(Algorithm):
         self.starting_cell = starting_cell
 
     def on(self, grid: Grid) -> None:
-        if self.starting_cell is None:
-            self.starting_cell = grid.random_cell()
-        if not is_cell(self.starting_cell) or self.starting_cell not in grid:
-            ValueError("Starting point of the algorithm must be a valid cell in the grid")
+        # don't keep the random pick, so the instance can be reused on other grids
+        starting_cell = self.starting_cell if self.starting_cell is not None else grid.random_cell()
+        if not is_cell(starting_cell) or starting_cell not in grid:
+            raise ValueError("Starting point of the algorithm must be a valid cell in the grid")
 
         # We'll use the list as a stack to do very easily any backtracking
         walked_path = []
-        walked_path.append(self.starting_cell)
+        walked_path.append(starting_cell)
 
         while walked_path:
             current_cell = walked_path[-1]
 
-            unvisited_neighbors = [neighbor for neighbor in current_cell.neighbors if not neighbor.links]
+            unvisited_neighbors = [neighbor for neighbor in current_cell.neighbors if neighbor.link_count == 0]
             if not unvisited_neighbors:
                 walked_path.pop()
             else:
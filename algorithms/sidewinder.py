@@ -1,7 +1,11 @@
 from random import choice, randint
 from typing import cast
 
+import numpy as np
+
 from algorithms.base_algorithm import Algorithm
+from algorithms.mask_carving import carve_rows, coin_flips, pick_below, random_generator, row_blocks, supports_masks
+from base.compact_grid import CompactGrid
 from base.grid import Grid
 from base.cell import Cell
 
@@ -11,9 +15,15 @@ class Sidewinder(Algorithm):
     A sidewinder visits each cell in the grid and chooses to carve a passage either north or east
     (similar to Binary Tree), but running row by row.
     Causes topmost row to always be a straight line.
+    On compact grids all coin flips are drawn at once, and so is the cell carving north out of every run, as runs are
+    independent from each other. Then they are written as link bitmasks.
     """
 
     def on(self, grid: Grid) -> None:
+        if supports_masks(grid):
+            self._carve_masks(cast(CompactGrid, grid))
+            return
+
         for row in grid.each_row():
             run = []
             for cell in row:
@@ -29,3 +39,24 @@ class Sidewinder(Algorithm):
                     run.clear()
                 else:
                     cell += cast(Cell, cell.east)
+
+    @staticmethod
+    def _carve_masks(grid: CompactGrid) -> None:
+        generator = random_generator()
+        for first_row, rows in row_blocks(grid):
+            close_out = coin_flips(generator, (rows, grid.columns))
+            close_out[:, -1] = True
+            if first_row == 0:
+                close_out[0, :-1] = False
+            east = ~close_out
+
+            # every row closes out at its end, so runs never span two rows
+            ends = np.flatnonzero(close_out).astype(np.int32)
+            lengths = np.diff(ends, prepend=np.int32(-1))
+            north = np.zeros(close_out.shape, dtype=np.bool_)
+            # a random member of every run carves north
+            north.ravel()[ends - pick_below(generator, lengths)] = True
+            if first_row == 0:
+                north[0] = False
+            carve_rows(grid, first_row, north, east)
+        grid.masks_changed()
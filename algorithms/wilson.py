@@ -1,7 +1,11 @@
-from random import choice
+from array import array
+from random import randrange
+from typing import cast, List
 
 from algorithms.base_algorithm import Algorithm
 
+from base.cell import Cell
+from base.directions import EAST, NORTH, random_step, SOUTH, WEST
 from base.grid import Grid
 
 
@@ -10,32 +14,60 @@ class Wilson(Algorithm):
     Wilson algorithm works by choosing a random cell as origin, another as destination, and performs as loop-erased
     random walk towards it using the neighbors. Stores the path until comes to either destination or a "walked" path
     cell, former causing the algorithm to delete the loop until there and keep going.
+    The walk only remembers the direction each cell was last left through: following those from the start of the walk
+    is its loop-erased path, as any loop got overwritten when left for the last time. Together with a visited bitmap
+    and an index of the unvisited cells, every step takes constant time.
     Takes a long to compute on big grids (slow-to-start).
     """
 
     def on(self, grid: Grid) -> None:
-        unvisited = []
-        for cell in grid.each_cell():
-            unvisited.append(cell)
+        visited = bytearray(grid.size)
+        visited[randrange(grid.size)] = 1
+        self.complete(grid, visited)
 
-        first_cell = choice(unvisited)
-        unvisited.remove(first_cell)
+    def complete(self, grid: Grid, visited: bytearray) -> None:
+        """
+        Joins every cell not flagged in the visited bitmap (by cell id) to the visited ones, which must already form a
+        tree, so the whole grid ends up as a spanning tree. Flags them too as they get carved
+        """
+        size = grid.size
+        columns = grid.columns
+        if len(visited) != size or not any(visited):
+            raise ValueError("Visited bitmap must have one byte per cell and at least one visited cell")
+        offsets = {NORTH: -columns, SOUTH: columns, EAST: 1, WEST: -1}
+        # direction each cell of the current walk was last left through
+        exits = bytearray(size)
+        # unvisited cell ids, in no particular order, and the position of each one in that list
+        unvisited = [index for index in range(size) if not visited[index]]
+        positions = array("i", [0]) * size
+        for position, index in enumerate(unvisited):
+            positions[index] = position
 
-        while len(unvisited) > 0:
+        while unvisited:
             # start a walk
-            cell = choice(unvisited)
-            path = [cell]
-
-            while cell in unvisited:
-                cell = cell.random_neighbour()
-                try:
-                    position = path.index(cell)
-                    # already walked, perform loop-erase. e.g. A -> B -> C -> D -> B   becomes A -> B
-                    path = path[:position + 1]
-                except ValueError:
-                    path.append(cell)
+            start = unvisited[randrange(len(unvisited))]
+            index = start
+            while not visited[index]:
+                direction, next_index = random_step(index, columns, size)
+                exits[index] = direction
+                index = next_index
 
             # Passage carving once has found a valid path
-            for index in range(len(path) - 1):
-                path[index] += path[index + 1]
-                unvisited.remove(path[index])
+            index = start
+            cell = cast(Cell, grid.cell_at(*divmod(index, columns)))
+            while not visited[index]:
+                self._visit(index, visited, unvisited, positions)
+                index += offsets[exits[index]]
+                next_cell = cast(Cell, grid.cell_at(*divmod(index, columns)))
+                cell += next_cell
+                cell = next_cell
+
+    @staticmethod
+    def _visit(index: int, visited: bytearray, unvisited: List[int], positions: "array[int]") -> None:
+        visited[index] = 1
+        # swap-remove: the last unvisited cell takes the place of the visited one
+        position = positions[index]
+        last = unvisited.pop()
+        if last != index:
+            unvisited[position] = last
+            positions[last] = position
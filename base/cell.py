@@ -1,15 +1,27 @@
 from random import choice
-from typing import Any, cast, Dict, Hashable, List, Optional
+from typing import Any, cast, Collection, Dict, Hashable, List, Optional, Tuple, TYPE_CHECKING
 import warnings
 
+from base.directions import EAST, NORTH, SOUTH, WEST
 from base.distances import Distances
 
+# Avoid cyclic import, as Grid creates cells
+if TYPE_CHECKING:
+    from base.grid import Grid
+
 Links = Dict["Cell", bool]
 CellList = List["Cell"]
+CellTuple = Tuple["Cell", ...]
 
 
 class Cell:
 
+    # Cells are the most allocated objects, so keep them lean: no per-instance __dict__
+    __slots__ = ("_row", "_column", "_links", "_data", "_north", "_south", "_east", "_west", "_neighbors",
+                 "_grid")
+    _data: Optional[Dict]
+    _grid: Optional["Grid"]
+
     @property
     def row(self) -> int:
         return self._row
@@ -18,34 +30,112 @@ class Cell:
     def column(self) -> int:
         return self._column
 
+    @property
+    def grid(self) -> Optional["Grid"]:
+        """
+        Grid owning this cell, which gets notified of link changes. None if standalone
+        """
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: Optional["Grid"]) -> None:
+        self._grid = grid
+
+    @property
+    def grid_token(self) -> Optional[int]:
+        """
+        Identity token of the grid owning this cell, None if standalone
+        """
+        return self._grid.token if self._grid is not None else None
+
     @property
     def links(self) -> CellList:
         return list(self._links.keys())
 
     @property
-    def neighbors(self) -> CellList:
-        neighbors_list: CellList = []
-        if self.north:
-            neighbors_list.append(self.north)
-        if self.south:
-            neighbors_list.append(self.south)
-        if self.east:
-            neighbors_list.append(self.east)
-        if self.west:
-            neighbors_list.append(self.west)
-        return neighbors_list
+    def linked_cells(self) -> Collection["Cell"]:
+        """
+        Non-copying view of the linked cells, cheaper than `links` when only iterating
+        """
+        return self._links.keys()
+
+    @property
+    def link_count(self) -> int:
+        return len(self._links)
+
+    @property
+    def link_mask(self) -> int:
+        """
+        Links to the neighbor cells as a bitmask of base.directions values
+        """
+        # identity checks over the (at most four) links, hashing cells is comparatively slow
+        mask = 0
+        for cell in self._links:
+            if cell is self._north:
+                mask |= NORTH
+            elif cell is self._south:
+                mask |= SOUTH
+            elif cell is self._east:
+                mask |= EAST
+            elif cell is self._west:
+                mask |= WEST
+        return mask
+
+    @property
+    def neighbors(self) -> CellTuple:
+        return self._neighbors
+
+    @property
+    def north(self) -> Optional["Cell"]:
+        return self._north
+
+    @north.setter
+    def north(self, cell: Optional["Cell"]) -> None:
+        self.set_neighbors(cell, self._south, self._east, self._west)
+
+    @property
+    def south(self) -> Optional["Cell"]:
+        return self._south
+
+    @south.setter
+    def south(self, cell: Optional["Cell"]) -> None:
+        self.set_neighbors(self._north, cell, self._east, self._west)
+
+    @property
+    def east(self) -> Optional["Cell"]:
+        return self._east
+
+    @east.setter
+    def east(self, cell: Optional["Cell"]) -> None:
+        self.set_neighbors(self._north, self._south, cell, self._west)
+
+    @property
+    def west(self) -> Optional["Cell"]:
+        return self._west
+
+    @west.setter
+    def west(self, cell: Optional["Cell"]) -> None:
+        self.set_neighbors(self._north, self._south, self._east, cell)
 
     @property
     def distances(self) -> Distances:
+        """
+        Distances from this cell to every other one it can reach. Cells of a grid share them through the grid distance
+        cache, so they are read-only
+        """
+        if self._grid is not None:
+            return self._grid.distance_cache.distances_from(self)
+
         distances = Distances(self)
         frontier = [self]
 
         while len(frontier) > 0:
             new_frontier = []
             for cell in frontier:
-                for linked_cell in cell.links:
-                    if distances[linked_cell] is None and distances[cell] is not None:
-                        distances[linked_cell] = cast(int, distances[cell]) + 1
+                cell_distance = cast(int, distances[cell])
+                for linked_cell in cell.linked_cells:
+                    if distances[linked_cell] is None:
+                        distances[linked_cell] = cell_distance + 1
                         new_frontier.append(linked_cell)
             frontier = new_frontier
 
@@ -53,9 +143,12 @@ class Cell:
 
     @property
     def data(self) -> Dict:
+        # created on first access, most cells never store anything
+        if self._data is None:
+            self._data = {}
         return self._data
 
-    def __init__(self, row: int, column: int) -> None:
+    def __init__(self, row: int, column: int, grid: Optional["Grid"] = None) -> None:
         if row is None or row < 0:
             raise ValueError("Row must be a positive integer")
         if column is None or column < 0:
@@ -64,11 +157,20 @@ class Cell:
         self._row: int = row
         self._column: int = column
         self._links: Dict[Cell, bool] = {}
-        self._data: Dict = {}
-        self.north: Optional[Cell] = None
-        self.south: Optional[Cell] = None
-        self.east: Optional[Cell] = None
-        self.west: Optional[Cell] = None
+        self._data = None
+        self._grid = grid
+        self.set_neighbors(None, None, None, None)
+
+    def set_neighbors(self, north: Optional["Cell"], south: Optional["Cell"], east: Optional["Cell"],
+                      west: Optional["Cell"]) -> None:
+        """
+        Sets all four neighbors at once, precomputing the immutable neighbors tuple
+        """
+        self._north: Optional[Cell] = north
+        self._south: Optional[Cell] = south
+        self._east: Optional[Cell] = east
+        self._west: Optional[Cell] = west
+        self._neighbors: CellTuple = tuple(cell for cell in (north, south, east, west) if cell is not None)
 
     def link(self, cell: "Cell", bidirectional: bool = True) -> "Cell":
         """
@@ -77,9 +179,17 @@ class Cell:
         if not is_cell(cell):
             raise ValueError("Link can only be made between two cells")
 
+        # comparing lengths rather than testing membership first hashes the cell only once
+        degree = len(self._links)
         self._links[cell] = True
+        grid = self._grid if len(self._links) > degree else None
+        if grid is not None:
+            index = self._grid_index()
+            grid.link_changed(index, degree, degree + 1)
         if bidirectional:
             cell.link(cell=self, bidirectional=False)
+            if grid is not None:
+                grid.passage_changed(index, cell._grid_index(), True)
         return self
 
     def unlink(self, cell: "Cell", bidirectional: bool = True) -> "Cell":
@@ -93,8 +203,13 @@ class Cell:
 
         if self.linked_to(cell):
             del self._links[cell]
+            if self._grid is not None:
+                index = self._grid_index()
+                self._grid.link_changed(index, len(self._links) + 1, len(self._links))
             if bidirectional:
                 cell.unlink(cell=self, bidirectional=False)
+                if self._grid is not None:
+                    self._grid.passage_changed(index, cell._grid_index(), False)
         return self
 
     def linked_to(self, cell: Optional["Cell"]) -> bool:
@@ -106,13 +221,21 @@ class Cell:
             raise ValueError("Attempted to check link with non-cell")
 
     def random_neighbour(self) -> Optional["Cell"]:
-        if len(self.neighbors) == 0:
+        neighbors = self.neighbors
+        if len(neighbors) == 0:
             return None
         else:
-            return choice(self.neighbors)
+            return choice(neighbors)
 
     def has_data(self, key: Hashable) -> bool:
-        return key in self.data.keys()
+        return self._data is not None and key in self._data
+
+    def _grid_index(self) -> int:
+        """
+        Cell id in its grid
+        """
+        assert self._grid is not None
+        return self._row * self._grid.columns + self._column
 
     def __iadd__(self, cell: "Cell") -> "Cell":
         """
@@ -0,0 +1,199 @@
+from collections import OrderedDict
+from hashlib import blake2b
+import random
+import struct
+from typing import Generator, Tuple, TYPE_CHECKING
+
+from base.compact_grid import CompactGrid
+from base.directions import EAST, NORTH, SOUTH, WEST
+
+# Avoid cyclic import, as algorithms work on grids
+if TYPE_CHECKING:
+    from algorithms.base_algorithm import Algorithm
+else:
+    Algorithm = "Algorithm"
+
+
+DEFAULT_CHUNK_SIZE = 64
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+ChunkKey = Tuple[int, int]
+SEED_KEY = struct.Struct("<qqqB")
+# translation tables dropping the links that leave a region through its top or bottom
+CLEAR_NORTH = bytes(mask & ~NORTH for mask in range(256))
+CLEAR_SOUTH = bytes(mask & ~SOUTH for mask in range(256))
+
+
+def derive_seed(seed: int, chunk_row: int, chunk_column: int, purpose: int) -> int:
+    """
+    Stable 64 bit seed for a chunk and purpose (a direction for border passages, 0 for carving), the same on every
+    run and platform, unlike hash()
+    """
+    key = SEED_KEY.pack(seed, chunk_row, chunk_column, purpose)
+    return int.from_bytes(blake2b(key, digest_size=8).digest(), "little")
+
+
+class ChunkedGrid:
+    """
+    Unbounded plane of cells split into square chunks, each one a maze carved on demand by the given algorithm with a
+    seed derived from the world seed and its chunk coordinates, so any chunk comes out the same whenever it is
+    generated again. Every chunk opens one passage to each of its four neighbors, at a position also derived from the
+    seed, which both sides agree on without generating each other: the world is connected, with loops only between
+    chunks.
+    Generated chunks (their link bitmasks, one byte per cell) are kept in a least recently used cache within a memory
+    budget in bytes, so reading any region only generates the chunks it touches that are not cached.
+    """
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def algorithm(self) -> Algorithm:
+        return self._algorithm
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("Memory budget can't be negative")
+        self._max_bytes = value
+        self._evict()
+
+    @property
+    def used_bytes(self) -> int:
+        return len(self._chunks) * self._chunk_size * self._chunk_size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    def __init__(self, algorithm: Algorithm, chunk_size: int = DEFAULT_CHUNK_SIZE, seed: int = 0,
+                 max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if chunk_size < 2:
+            raise ValueError("Chunk size must be an integer greater than 1")
+        self._algorithm = algorithm
+        self._chunk_size = chunk_size
+        self._seed = seed
+        self._chunks: "OrderedDict[ChunkKey, bytes]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.max_bytes = max_bytes
+
+    def chunk_of(self, row: int, column: int) -> ChunkKey:
+        """
+        Coordinates of the chunk containing a cell. Negative cell coordinates are as valid as positive ones
+        """
+        return row // self._chunk_size, column // self._chunk_size
+
+    def chunk_masks(self, chunk_row: int, chunk_column: int) -> bytes:
+        """
+        Link bitmasks of a chunk's cells in row-major order, including the passages to its neighbors
+        """
+        key = (chunk_row, chunk_column)
+        masks = self._chunks.get(key)
+        if masks is not None:
+            self._hits += 1
+            self._chunks.move_to_end(key)
+            return masks
+
+        self._misses += 1
+        masks = self._generate(chunk_row, chunk_column)
+        if len(masks) <= self._max_bytes:
+            self._chunks[key] = masks
+            self._evict()
+        return masks
+
+    def mask_at(self, row: int, column: int) -> int:
+        chunk_row, inner_row = divmod(row, self._chunk_size)
+        chunk_column, inner_column = divmod(column, self._chunk_size)
+        return self.chunk_masks(chunk_row, chunk_column)[inner_row * self._chunk_size + inner_column]
+
+    def each_row_masks(self, row: int, column: int, rows: int, columns: int) -> Generator[bytes, None, None]:
+        """
+        Link bitmasks of every row of a region, without the links leaving it, so they can be rendered like those of a
+        grid (see Exporter.render_rows). Chunks are fetched once per band of rows they cover
+        """
+        if rows < 1 or columns < 1:
+            raise ValueError("Regions must have at least one row and one column")
+        size = self._chunk_size
+        last_row = row + rows - 1
+        first_chunk_column, first_inner_column = divmod(column, size)
+        last_chunk_column = (column + columns - 1) // size
+
+        current = row
+        while current <= last_row:
+            chunk_row, inner_row = divmod(current, size)
+            band = [self.chunk_masks(chunk_row, chunk_column)
+                    for chunk_column in range(first_chunk_column, last_chunk_column + 1)]
+            for inner in range(inner_row, min(size, inner_row + last_row - current + 1)):
+                line = bytearray().join(masks[inner * size:(inner + 1) * size] for masks in band)
+                line = line[first_inner_column:first_inner_column + columns]
+                line[0] &= ~WEST
+                line[-1] &= ~EAST
+                if current == row:
+                    line = line.translate(CLEAR_NORTH)
+                if current == last_row:
+                    line = line.translate(CLEAR_SOUTH)
+                yield bytes(line)
+                current += 1
+
+    def region(self, row: int, column: int, rows: int, columns: int) -> CompactGrid:
+        """
+        Copy of a region as a standalone grid (e.g. to solve or export it), its top left cell being the given one
+        """
+        masks = bytearray().join(self.each_row_masks(row, column, rows, columns))
+        return CompactGrid(rows, columns, masks=masks)
+
+    def clear(self) -> None:
+        self._chunks.clear()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def _generate(self, chunk_row: int, chunk_column: int) -> bytes:
+        size = self._chunk_size
+        grid = CompactGrid(size, size)
+        # algorithms draw from the random module, its state is restored afterwards
+        state = random.getstate()
+        try:
+            random.seed(derive_seed(self._seed, chunk_row, chunk_column, 0))
+            self._algorithm.on(grid)
+        finally:
+            random.setstate(state)
+
+        masks = bytearray(grid.link_masks())
+        # passages through the east and south borders are chosen by this chunk, the west and north ones by the
+        # neighbors sharing them
+        masks[self._border_position(chunk_row, chunk_column, EAST) * size + size - 1] |= EAST
+        masks[self._border_position(chunk_row, chunk_column - 1, EAST) * size] |= WEST
+        masks[(size - 1) * size + self._border_position(chunk_row, chunk_column, SOUTH)] |= SOUTH
+        masks[self._border_position(chunk_row - 1, chunk_column, SOUTH)] |= NORTH
+        return bytes(masks)
+
+    def _border_position(self, chunk_row: int, chunk_column: int, direction: int) -> int:
+        """
+        Row (east border) or column (south border) of the passage through a chunk's border
+        """
+        return derive_seed(self._seed, chunk_row, chunk_column, direction) % self._chunk_size
+
+    def _evict(self) -> None:
+        while self.used_bytes > self._max_bytes and self._chunks:
+            self._chunks.popitem(last=False)
+            self._evictions += 1
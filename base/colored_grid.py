@@ -1,18 +1,26 @@
-from typing import cast, Optional, Tuple
+from colorsys import hsv_to_rgb
+from typing import Optional, Tuple
 
 from base.distance_grid import DistanceGrid
+from base.distances import Regions
 from base.cell import Cell
 
 MAX_DARK = 210                          # Dark meaning farther than or more distant than
 MAX_BRIGHT = round(MAX_DARK / 2)        # And thus, bright means closer than or less distant than
 MAX_BRIGHT_INTENSITY = MAX_BRIGHT - 1
+# Regions get hues spread by the golden ratio of their source cell id, so neighbouring sources rarely look alike
+REGION_HUE_STEP = 0.618033988749895
+REGION_SATURATION = 0.6
+REGION_FADE = 0.6                       # How much darker the farthest cells of a region are than its source
 
 
 class ColoredGrid(DistanceGrid):
 
     def background_color_for(self, cell: Cell) -> Optional[Tuple[int, int, int]]:
-        if self.distances is not None and self.maximum > 0 and self.distances[cell] is not None:
-            distance = cast(int, self.distances[cell])
+        if isinstance(self.distances, Regions):
+            return self._region_color_for(self.distances, cell)
+        distance = self.distances[cell] if self.distances is not None and self.maximum > 0 else None
+        if distance is not None:
             if distance > 0 and distance < self.maximum:
                 intensity = float((self.maximum - distance)) / self.maximum
                 dark = round(MAX_DARK * intensity)
@@ -25,3 +33,14 @@ class ColoredGrid(DistanceGrid):
                 return 0, 148, 255
         else:
             return None
+
+    def _region_color_for(self, regions: Regions, cell: Cell) -> Optional[Tuple[int, int, int]]:
+        # one hue per region (a Voronoi map of the sources), darker farther from its source
+        distance = regions[cell]
+        owner = regions.owner_of(cell)
+        if distance is None or owner is None:
+            return None
+        hue = (owner.row * self.columns + owner.column) * REGION_HUE_STEP % 1
+        value = 1 - REGION_FADE * distance / self.maximum if self.maximum > 0 else 1
+        red, green, blue = hsv_to_rgb(hue, REGION_SATURATION, value)
+        return round(red * 255), round(green * 255), round(blue * 255)
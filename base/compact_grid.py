@@ -0,0 +1,350 @@
+from typing import Collection, Dict, Generator, Hashable, List, Optional, Tuple, Union
+import warnings
+
+import numpy as np
+
+from base.cell import Cell, is_cell
+from base.colored_grid import ColoredGrid
+from base.degrees import Degrees
+from base.directions import DEGREES, DIRECTIONS, OFFSETS, OPPOSITE
+from base.distance_grid import DistanceGrid
+from base.grid import Grid, MaskBuffer
+
+
+CellList = List[Cell]
+CellTuple = Tuple[Cell, ...]
+# Any writable byte buffer works as link storage
+Masks = Union[bytearray, memoryview]
+
+# Bulk scans over the masks go in chunks of this many bytes, to keep memory bounded on huge grids
+SCAN_CHUNK_SIZE = 1 << 20
+
+
+class CompactCell(Cell):
+    """
+    Lightweight handle to a position of a CompactGrid. It holds no link state, all queries and updates go to the
+    grid's bitmask, so instances can be created on demand and thrown away.
+    """
+
+    __slots__ = ()
+    _grid: "CompactGrid"
+
+    @property
+    def north(self) -> Optional[Cell]:
+        return self._grid.cell_at(self._row - 1, self._column)
+
+    @north.setter
+    def north(self, cell: Optional[Cell]) -> None:
+        raise AttributeError("Compact cell neighbors are derived from grid coordinates")
+
+    @property
+    def south(self) -> Optional[Cell]:
+        return self._grid.cell_at(self._row + 1, self._column)
+
+    @south.setter
+    def south(self, cell: Optional[Cell]) -> None:
+        raise AttributeError("Compact cell neighbors are derived from grid coordinates")
+
+    @property
+    def east(self) -> Optional[Cell]:
+        return self._grid.cell_at(self._row, self._column + 1)
+
+    @east.setter
+    def east(self, cell: Optional[Cell]) -> None:
+        raise AttributeError("Compact cell neighbors are derived from grid coordinates")
+
+    @property
+    def west(self) -> Optional[Cell]:
+        return self._grid.cell_at(self._row, self._column - 1)
+
+    @west.setter
+    def west(self, cell: Optional[Cell]) -> None:
+        raise AttributeError("Compact cell neighbors are derived from grid coordinates")
+
+    @property
+    def links(self) -> CellList:
+        return self._grid.links_of(self._row, self._column)
+
+    @property
+    def linked_cells(self) -> Collection[Cell]:
+        return self._grid.links_of(self._row, self._column)
+
+    @property
+    def link_count(self) -> int:
+        return DEGREES[self._grid.mask_at(self._row, self._column)]
+
+    @property
+    def link_mask(self) -> int:
+        return self._grid.mask_at(self._row, self._column)
+
+    @property
+    def neighbors(self) -> CellTuple:
+        return self._grid.neighbors_of(self._row, self._column)
+
+    @property
+    def data(self) -> Dict:
+        return self._grid.data_of(self._row, self._column)
+
+    @property
+    def grid(self) -> "CompactGrid":
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: Optional[Grid]) -> None:
+        raise AttributeError("Compact cells always belong to the grid that created them")
+
+    @property
+    def grid_token(self) -> Optional[int]:
+        return self._grid.token
+
+    def __init__(self, grid: "CompactGrid", row: int, column: int) -> None:
+        # Cell constructor is skipped on purpose, it would allocate the links dict and neighbors this class avoids
+        self._grid = grid
+        self._row = row
+        self._column = column
+
+    def link(self, cell: Cell, bidirectional: bool = True) -> Cell:
+        """
+        Links current cell to specified one, which must be an adjacent cell of the same grid
+        """
+        if not is_cell(cell):
+            raise ValueError("Link can only be made between two cells")
+
+        direction = self._direction_to(cell)
+        if direction is None:
+            raise ValueError("Compact cells can only be linked to adjacent cells of the same grid")
+        self._grid.link_at(self._row, self._column, direction, bidirectional)
+        return self
+
+    def unlink(self, cell: Cell, bidirectional: bool = True) -> Cell:
+        """
+        Unlinks current cell from specified one
+        """
+        if cell is None:
+            warnings.warn("Attempted to remove non-existant link", UserWarning)
+        elif not is_cell(cell):
+            raise ValueError("Link can only be removed between two cells")
+
+        direction = self._direction_to(cell)
+        if direction is not None:
+            self._grid.unlink_at(self._row, self._column, direction, bidirectional)
+        return self
+
+    def linked_to(self, cell: Optional[Cell]) -> bool:
+        if is_cell(cell):
+            direction = self._direction_to(cell)
+            return direction is not None and self._grid.mask_at(self._row, self._column) & direction != 0
+        elif cell is None:
+            return False
+        else:
+            raise ValueError("Attempted to check link with non-cell")
+
+    def has_data(self, key: Hashable) -> bool:
+        return self._grid.has_data_at(self._row, self._column, key)
+
+    def _direction_to(self, cell: Optional[Cell]) -> Optional[int]:
+        if not isinstance(cell, CompactCell) or cell._grid is not self._grid:
+            return None
+        offset = (cell._row - self._row, cell._column - self._column)
+        for direction in DIRECTIONS:
+            if OFFSETS[direction] == offset:
+                return direction
+        return None
+
+
+class CompactGrid(Grid):
+    """
+    Grid that doesn't keep Cell objects. The north/south/east/west links of every cell are stored as a bitmask in a
+    single bytearray indexed by row * columns + column, and cells are handed out as CompactCell handles, so existing
+    algorithms, exporters and pathfinders run unchanged while using one byte per cell.
+    Storage can be provided (e.g. a memoryview over a memory-mapped file), by default a new bytearray is allocated.
+    """
+
+    @property
+    def deadends(self) -> List[Cell]:
+        deadends: List[Cell] = []
+        for offset, degrees in self._scan_degrees():
+            index = degrees.find(1)
+            while index != -1:
+                deadends.append(CompactCell(self, *divmod(offset + index, self.columns)))
+                index = degrees.find(1, index + 1)
+        return deadends
+
+    def __init__(self, rows: int, columns: int, masks: Optional[Masks] = None) -> None:
+        # kept until prepare_grid() runs, as Grid constructor validates the dimensions first
+        self._provided_masks: Optional[Masks] = masks
+        # provided masks are counted on first use, so wrapping existing storage (e.g. opening a maze file) doesn't
+        # read all of it
+        self._degrees_outdated: bool = masks is not None
+        super().__init__(rows, columns)
+
+    def prepare_degrees(self) -> Degrees:
+        # dead-ends are found scanning the bitmasks instead, a set of them would outweigh the grid itself
+        return Degrees(self.size, track_deadends=False)
+
+    def prepare_grid(self) -> List[List[Cell]]:
+        # No cell objects are created, just the link bitmasks
+        self._masks: Masks = self.prepare_masks()
+        self._data: Dict[int, Dict] = {}
+        return []
+
+    def prepare_masks(self) -> Masks:
+        if self._provided_masks is None:
+            return bytearray(self.size)
+        if len(self._provided_masks) != self.size:
+            raise ValueError("Masks storage must have exactly one byte per cell")
+        return self._provided_masks
+
+    def count_degrees(self) -> Degrees:
+        """
+        Rebuilds the degree histogram from the stored masks
+        """
+        histogram = [0] * (max(DEGREES) + 1)
+        # counting every mask value in chunks (NumPy counts through a temporary array of machine integers), then
+        # adding them up by degree
+        counts = np.zeros(len(DEGREES), dtype=np.int64)
+        masks = np.frombuffer(self._masks, dtype=np.uint8)
+        for offset in range(0, self.size, SCAN_CHUNK_SIZE):
+            counts += np.bincount(masks[offset:offset + SCAN_CHUNK_SIZE], minlength=len(DEGREES))
+        for mask, count in enumerate(counts.tolist()):
+            histogram[DEGREES[mask]] += count
+        while len(histogram) > 5 and histogram[-1] == 0:
+            histogram.pop()
+        return Degrees(self.size, track_deadends=False, histogram=histogram)
+
+    def current_degrees(self) -> Degrees:
+        if self._degrees_outdated:
+            self._degrees = self.count_degrees()
+            self._degrees_outdated = False
+        return self._degrees
+
+    def configure_cells(self) -> None:
+        """
+        Nothing to configure, neighbors are derived from grid coordinates
+        """
+
+    def cell_at(self, row: int, column: int) -> Optional[Cell]:
+        if not (0 <= row < self.rows):
+            return None
+        if not (0 <= column < self.columns):
+            return None
+        return CompactCell(self, row, column)
+
+    def set_cell_at(self, row: int, column: int, value: Cell) -> None:
+        """
+        Copies the links of the given cell (which can belong to any kind of grid) into the specified position. Links
+        are made and removed on both sides, like link_at() and unlink_at() do
+        """
+        mask = self._masks[row * self.columns + column]
+        for direction, neighbor in zip(DIRECTIONS, (value.north, value.south, value.east, value.west)):
+            row_offset, column_offset = OFFSETS[direction]
+            if self.cell_at(row + row_offset, column + column_offset) is None:
+                continue
+            if value.linked_to(neighbor):
+                if not mask & direction:
+                    self.link_at(row, column, direction)
+            elif mask & direction:
+                self.unlink_at(row, column, direction)
+
+    def each_row(self) -> Generator[CellList, None, None]:
+        for row in range(self.rows):
+            yield [CompactCell(self, row, column) for column in range(self.columns)]
+
+    def each_cell(self) -> Generator:
+        for row in range(self.rows):
+            for column in range(self.columns):
+                yield CompactCell(self, row, column)
+
+    def each_row_masks(self) -> Generator[bytes, None, None]:
+        for start in range(0, self.size, self.columns):
+            yield bytes(self._masks[start:start + self.columns])
+
+    def link_masks(self) -> MaskBuffer:
+        # the storage itself, no copy
+        return self._masks
+
+    def mask_at(self, row: int, column: int) -> int:
+        return self._masks[row * self.columns + column]
+
+    def link_at(self, row: int, column: int, direction: int, bidirectional: bool = True) -> None:
+        index, neighbor_index = self._pair_indices(row, column, direction)
+        changed = not self._masks[index] & direction
+        self._set_mask(index, self._masks[index] | direction)
+        if bidirectional:
+            self._set_mask(neighbor_index, self._masks[neighbor_index] | OPPOSITE[direction])
+            if changed:
+                self.passage_changed(index, neighbor_index, True)
+
+    def unlink_at(self, row: int, column: int, direction: int, bidirectional: bool = True) -> None:
+        index, neighbor_index = self._pair_indices(row, column, direction)
+        changed = self._masks[index] & direction
+        self._set_mask(index, self._masks[index] & ~direction)
+        if bidirectional:
+            self._set_mask(neighbor_index, self._masks[neighbor_index] & ~OPPOSITE[direction])
+            if changed:
+                self.passage_changed(index, neighbor_index, False)
+
+    def masks_changed(self) -> None:
+        """
+        To be called after writing links straight into the storage returned by link_masks(), e.g. by algorithms
+        carving whole arrays at once: the degree histogram is counted again when next read, and this counts as a change
+        of all links
+        """
+        self._degrees_outdated = True
+        self._version += 1
+
+    def _scan_degrees(self) -> Generator[Tuple[int, bytes], None, None]:
+        """
+        Yields (first cell index, degree of each cell) chunks, sequentially over the storage
+        """
+        for offset in range(0, self.size, SCAN_CHUNK_SIZE):
+            yield offset, bytes(self._masks[offset:offset + SCAN_CHUNK_SIZE]).translate(DEGREES)
+
+    def _pair_indices(self, row: int, column: int, direction: int) -> Tuple[int, int]:
+        """
+        Cell ids of a cell and its neighbor in a direction, both of which must be part of the grid
+        """
+        row_offset, column_offset = OFFSETS[direction]
+        for cell_row, cell_column in ((row, column), (row + row_offset, column + column_offset)):
+            if not (0 <= cell_row < self.rows and 0 <= cell_column < self.columns):
+                raise IndexError("Cell not found at row {} column {}".format(cell_row, cell_column))
+        return row * self.columns + column, (row + row_offset) * self.columns + column + column_offset
+
+    def _set_mask(self, index: int, mask: int) -> None:
+        old_mask = self._masks[index]
+        if old_mask != mask:
+            self._masks[index] = mask
+            if not self._degrees_outdated:
+                self._degrees.shift(DEGREES[old_mask], DEGREES[mask])
+            self._version += 1
+
+    def links_of(self, row: int, column: int) -> CellList:
+        mask = self._masks[row * self.columns + column]
+        return [CompactCell(self, row + OFFSETS[direction][0], column + OFFSETS[direction][1])
+                for direction in DIRECTIONS if mask & direction]
+
+    def neighbors_of(self, row: int, column: int) -> CellTuple:
+        neighbors = (self.cell_at(row + row_offset, column + column_offset)
+                     for row_offset, column_offset in (OFFSETS[direction] for direction in DIRECTIONS))
+        return tuple(neighbor for neighbor in neighbors if neighbor is not None)
+
+    def data_of(self, row: int, column: int) -> Dict:
+        # created on first access, most cells never store anything
+        return self._data.setdefault(row * self.columns + column, {})
+
+    def has_data_at(self, row: int, column: int, key: Hashable) -> bool:
+        data = self._data.get(row * self.columns + column)
+        return data is not None and key in data
+
+    def __contains__(self, other: Cell) -> bool:
+        if not is_cell(other) or other.grid_token != self.token:
+            return False
+        return 0 <= other.row < self.rows and 0 <= other.column < self.columns
+
+
+class CompactDistanceGrid(CompactGrid, DistanceGrid):
+    pass
+
+
+class CompactColoredGrid(CompactGrid, ColoredGrid):
+    pass
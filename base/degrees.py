@@ -0,0 +1,78 @@
+from typing import List, Optional, Set
+
+
+class Degrees:
+    """
+    Histogram of the number of links (degree) of every cell of a grid, updated by the cells each time they get
+    linked or unlinked. Allows reading maze shape statistics without walking the whole grid.
+    Optionally keeps track of the dead-end cells themselves, by cell id (row * columns + column).
+    """
+
+    @property
+    def histogram(self) -> List[int]:
+        """
+        Amount of cells by degree, e.g. histogram[1] is the number of dead-ends
+        """
+        return list(self._histogram)
+
+    @property
+    def deadend_count(self) -> int:
+        return self._histogram[1]
+
+    @property
+    def junction_count(self) -> int:
+        """
+        Cells with three or more links
+        """
+        return sum(self._histogram[3:])
+
+    @property
+    def deadends(self) -> List[int]:
+        """
+        Cell ids of the dead-ends, in no particular order
+        """
+        return list(self._deadends)
+
+    def __init__(self, size: int, track_deadends: bool = True, histogram: Optional[List[int]] = None) -> None:
+        # unless told otherwise, all cells start unlinked
+        self._histogram: List[int] = list(histogram) if histogram is not None else [size, 0, 0, 0, 0]
+        self._track_deadends: bool = track_deadends
+        self._deadends: Set[int] = set()
+
+    def update(self, index: int, old_degree: int, new_degree: int) -> None:
+        histogram = self._histogram
+        # same as shift(), inlined as this runs on every link change
+        histogram[old_degree] -= 1
+        if new_degree >= len(histogram):
+            histogram.extend([0] * (new_degree - len(histogram) + 1))
+        histogram[new_degree] += 1
+        if self._track_deadends:
+            if old_degree == 1:
+                self._deadends.discard(index)
+            if new_degree == 1:
+                self._deadends.add(index)
+
+    def shift(self, old_degree: int, new_degree: int) -> None:
+        """
+        Moves one cell between histogram buckets, without tracking which cell it was
+        """
+        histogram = self._histogram
+        histogram[old_degree] -= 1
+        # cells can be linked beyond their four neighbors
+        if new_degree >= len(histogram):
+            histogram.extend([0] * (new_degree - len(histogram) + 1))
+        histogram[new_degree] += 1
+
+    def add(self, index: int, degree: int) -> None:
+        """
+        Accounts for a cell entering the grid with some links already
+        """
+        self._histogram[0] += 1
+        self.update(index, 0, degree)
+
+    def remove(self, index: int, degree: int) -> None:
+        """
+        Accounts for a cell leaving the grid
+        """
+        self.update(index, degree, 0)
+        self._histogram[0] -= 1
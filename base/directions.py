@@ -0,0 +1,42 @@
+"""
+Link bitmask encoding shared by the compact grids, the maze file format and the array based pathfinding.
+A set bit means there is a passage from the cell towards that direction.
+"""
+from random import getrandbits
+from typing import Tuple
+
+
+NORTH = 1
+SOUTH = 2
+EAST = 4
+WEST = 8
+DIRECTIONS = (NORTH, SOUTH, EAST, WEST)
+OPPOSITE = {NORTH: SOUTH, SOUTH: NORTH, EAST: WEST, WEST: EAST}
+# (row, column) offsets of the cell at each direction
+OFFSETS = {NORTH: (-1, 0), SOUTH: (1, 0), EAST: (0, 1), WEST: (0, -1)}
+
+# Number of links (set bits) of every possible mask, to be used with bytes.translate()
+DEGREES = bytes(bin(mask).count("1") for mask in range(256))
+
+# One letter names, as used by direction strings of paths
+NAMES = {NORTH: "N", SOUTH: "S", EAST: "E", WEST: "W"}
+
+
+def random_step(index: int, columns: int, size: int) -> Tuple[int, int]:
+    """
+    Direction and cell id of a random neighbor of a cell id (row * columns + column) of a grid of the given size,
+    uniform among the neighbors it has, as steps leaving the grid are drawn again
+    """
+    while True:
+        step = getrandbits(2)
+        if step == 0:
+            if index >= columns:
+                return NORTH, index - columns
+        elif step == 1:
+            if index + columns < size:
+                return SOUTH, index + columns
+        elif step == 2:
+            if index % columns != columns - 1:
+                return EAST, index + 1
+        elif index % columns != 0:
+            return WEST, index - 1
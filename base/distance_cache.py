@@ -0,0 +1,106 @@
+from collections import OrderedDict
+from typing import Optional, Tuple, TYPE_CHECKING
+
+from base.distances import ArrayDistances
+
+# Avoid cyclic import, as Grid owns a cache
+if TYPE_CHECKING:
+    from base.cell import Cell
+    from base.grid import Grid
+else:
+    Cell = "Cell"
+    Grid = "Grid"
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class DistanceCache:
+    """
+    Least recently used distance fields of a grid, keyed by root cell id, within a memory budget in bytes. Entries
+    belong to a grid version (see Grid.version): once links change, all of them are dropped on next access.
+    Fields bigger than the whole budget are still calculated, but never cached.
+    """
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("Memory budget can't be negative")
+        self._max_bytes = value
+        self._evict()
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    def __init__(self, grid: Grid, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._grid: Grid = grid
+        self._entries: "OrderedDict[int, Tuple[ArrayDistances, int]]" = OrderedDict()
+        self._version: int = grid.version
+        self._used_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self.max_bytes = max_bytes
+
+    def distances_from(self, root: Cell) -> ArrayDistances:
+        """
+        Distances from the root cell, from the cache if the links didn't change since they were calculated
+        """
+        if self._version != self._grid.version:
+            self.clear()
+            self._version = self._grid.version
+
+        index = root.row * self._grid.columns + root.column
+        entry = self._entries.get(index)
+        if entry is not None:
+            self._hits += 1
+            self._entries.move_to_end(index)
+            return entry[0]
+
+        self._misses += 1
+        distances = self._grid.distances_from(root)
+        size = distances.nbytes
+        if size <= self._max_bytes:
+            self._entries[index] = (distances, size)
+            self._used_bytes += size
+            self._evict()
+        return distances
+
+    def get(self, root: Cell) -> Optional[ArrayDistances]:
+        """
+        Cached distances from the root cell, if any, without calculating them nor counting hits or misses
+        """
+        if self._version != self._grid.version:
+            return None
+        entry = self._entries.get(root.row * self._grid.columns + root.column)
+        return entry[0] if entry is not None else None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._used_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        while self._used_bytes > self._max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._used_bytes -= size
+            self._evictions += 1
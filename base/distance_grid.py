@@ -2,7 +2,9 @@ from typing import Optional     # noqa: F401
 
 from base.grid import Grid
 from base.cell import Cell
-from base.distances import Distances    # noqa: F401
+from base.distance_oracle import DistanceOracle
+from base.distances import ArrayDistances, Distances, Regions    # noqa: F401
+from base.frontier import regions_from
 
 """
 Distance is represented as hexadecimal
@@ -14,6 +16,7 @@ class DistanceGrid(Grid):
     def __init__(self, rows: int, columns: int) -> None:
         super().__init__(rows, columns)
         self._distances: Optional[Distances] = None
+        self._oracle: Optional[DistanceOracle] = None
         self.maximum: int = 0
 
     @property
@@ -26,8 +29,43 @@ class DistanceGrid(Grid):
         if self._distances:
             _, self.maximum = self._distances.max
 
+    @property
+    def oracle(self) -> DistanceOracle:
+        """
+        Index of the distances between any two cells of a perfect maze, rebuilt on first use after links change
+        """
+        if self._oracle is None or self._oracle.version != self.version:
+            self._oracle = DistanceOracle(self)
+        return self._oracle
+
+    def passage_changed(self, first: int, second: int, linked: bool) -> None:
+        """
+        Full distance fields of this grid are updated in place, touching only the cells whose distance changes. Other
+        distances (like paths) are kept as they are
+        """
+        distances = self._distances
+        if not isinstance(distances, ArrayDistances) or distances.grid is not self:
+            return
+        if isinstance(distances, Regions):
+            # owners can move between regions, flooding again is simpler
+            self.distances = regions_from(self, distances.sources)
+            return
+        if not linked and distances.parents is None:
+            # without parents there is no telling which cells depended on the passage
+            self.distances = distances.root.distances
+            return
+        if not distances.writable:
+            # shared with the distance cache, so it gets a copy of its own on first change
+            distances = self._distances = distances.copy()
+        if linked:
+            distances.link_added(first, second)
+        else:
+            distances.link_removed(first, second)
+        _, self.maximum = distances.max
+
     def contents_of(self, cell: Cell) -> str:
-        if self.distances is not None and self.distances[cell] is not None:
-            return format(self.distances[cell], "02X").center(3)
+        distance = self.distances[cell] if self.distances is not None else None
+        if distance is not None:
+            return format(distance, "02X").center(3)
         else:
             return super().contents_of(cell)
@@ -0,0 +1,149 @@
+from typing import List, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from base.directions import EAST, NORTH, SOUTH, WEST
+from base.distances import Path
+
+# Avoid cyclic import, as DistanceGrid builds oracles
+if TYPE_CHECKING:
+    from base.cell import Cell
+    from base.grid import Grid
+else:
+    Cell = "Cell"
+    Grid = "Grid"
+
+
+UNVISITED = -1
+
+
+class DistanceOracle:
+    """
+    Index answering the distance and the path between any two cells of a perfect maze (a spanning tree, or a forest
+    of them) without flooding it. Both go through the lowest common ancestor of the cells in the tree rooted at the
+    first cell of each component: in depth-first preorder, the shallowest cell strictly after one cell and up to
+    the other is a child of their common ancestor, and a sparse table answers that range minimum in O(1).
+    Built in O(n log n) time and memory. It reflects the links at build time, check `version` against the grid's.
+    """
+
+    @property
+    def grid(self) -> Grid:
+        return self._grid
+
+    @property
+    def version(self) -> int:
+        """
+        Version of the grid the index was built for
+        """
+        return self._version
+
+    def __init__(self, grid: Grid) -> None:
+        self._grid: Grid = grid
+        self._version: int = grid.version
+        self._columns: int = grid.columns
+        masks = grid.link_masks()
+        size = len(masks)
+        steps = ((NORTH, -self._columns), (SOUTH, self._columns), (EAST, 1), (WEST, -1))
+
+        parents = np.full(size, UNVISITED, dtype=np.int32)
+        depths = np.zeros(size, dtype=np.int32)
+        components = np.zeros(size, dtype=np.int32)
+        positions = np.zeros(size, dtype=np.int32)
+        preorder = np.zeros(size, dtype=np.int32)
+        # scalar access through memoryviews is far cheaper than through the NumPy arrays
+        parent_values = parents.data
+        depth_values = depths.data
+        component_values = components.data
+        position_values = positions.data
+        preorder_values = preorder.data
+
+        position = 0
+        for root in range(size):
+            if parent_values[root] != UNVISITED:
+                continue
+            # roots are their own parent, so they count as visited
+            parent_values[root] = root
+            component_values[root] = root
+            stack = [root]
+            while stack:
+                index = stack.pop()
+                preorder_values[position] = index
+                position_values[index] = position
+                position += 1
+                mask = masks[index]
+                parent = parent_values[index]
+                for direction, offset in steps:
+                    if mask & direction:
+                        neighbor = index + offset
+                        if neighbor == parent:
+                            continue
+                        if parent_values[neighbor] != UNVISITED:
+                            raise ValueError("Distance oracles need a perfect maze, links have loops")
+                        parent_values[neighbor] = index
+                        depth_values[neighbor] = depth_values[index] + 1
+                        component_values[neighbor] = root
+                        stack.append(neighbor)
+
+        # table k holds the shallowest cell of every preorder range of 2^k cells
+        tables = [preorder]
+        width = 1
+        while width * 2 <= size:
+            previous = tables[-1]
+            left, right = previous[:-width], previous[width:]
+            tables.append(np.where(depths[left] <= depths[right], left, right))
+            width *= 2
+
+        self._parents = parent_values
+        self._depths = depth_values
+        self._components = component_values
+        self._positions = position_values
+        self._tables: List[memoryview] = [table.data for table in tables]
+
+    def distance(self, origin: Cell, destination: Cell) -> Optional[int]:
+        """
+        Number of steps between two cells, None if they are not connected
+        """
+        origin_index = self._index(origin)
+        destination_index = self._index(destination)
+        if self._components[origin_index] != self._components[destination_index]:
+            return None
+        ancestor = self._common_ancestor(origin_index, destination_index)
+        depths = self._depths
+        return depths[origin_index] + depths[destination_index] - 2 * depths[ancestor]
+
+    def path(self, origin: Cell, destination: Cell) -> Path:
+        """
+        Path between two cells, walking up to their common ancestor from both
+        """
+        origin_index = self._index(origin)
+        destination_index = self._index(destination)
+        if self._components[origin_index] != self._components[destination_index]:
+            raise ValueError("Destination is not reachable from origin")
+        ancestor = self._common_ancestor(origin_index, destination_index)
+
+        indices = self._climb(origin_index, ancestor)
+        indices.append(ancestor)
+        indices.extend(reversed(self._climb(destination_index, ancestor)))
+        return Path(self._grid, indices)
+
+    def _common_ancestor(self, first: int, second: int) -> int:
+        if first == second:
+            return first
+        start, end = sorted((self._positions[first], self._positions[second]))
+        # shallowest cell of the preorder range (start, end]
+        level = (end - start).bit_length() - 1
+        table = self._tables[level]
+        left, right = table[start + 1], table[end - (1 << level) + 1]
+        return self._parents[left if self._depths[left] <= self._depths[right] else right]
+
+    def _climb(self, index: int, ancestor: int) -> List[int]:
+        indices = []
+        while index != ancestor:
+            indices.append(index)
+            index = self._parents[index]
+        return indices
+
+    def _index(self, cell: Cell) -> int:
+        if cell not in self._grid:
+            raise IndexError("Cell at row {} column {} is not part of the grid".format(cell.row, cell.column))
+        return cell.row * self._columns + cell.column
@@ -1,13 +1,27 @@
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from array import array
+from heapq import heappop, heappush
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
+
+import numpy as np
+
+from base.directions import DIRECTIONS, NAMES, OFFSETS, OPPOSITE
 
 # Avoid cyclic import, as Cell uses Distances
 if TYPE_CHECKING:
     from base.cell import Cell
+    from base.grid import Grid
 else:
     Cell = "Cell"
+    Grid = "Grid"
 
 
 Cells = Dict[Cell, int]
+# Any int32 buffer, e.g. an array("i") or a memoryview cast to "i"
+DistanceValues = Union["array[int]", memoryview]
+# One direction (see base.directions) per cell, towards the cell it was reached from
+ParentValues = Union[bytearray, memoryview]
+
+UNREACHED = -1
 
 
 class Distances:
@@ -19,20 +33,23 @@ class Distances:
         self.root: Cell = root
         self._cells: Cells = dict()
         self._cells[root] = 0
+        self._max_cell: Cell = root
+        self._max_distance: int = 0
+        # set when the farthest cell gets a shorter distance, so it has to be searched again
+        self._max_stale: bool = False
 
     def __getitem__(self, cell: Cell) -> Optional[int]:
         if not is_cell(cell):
             raise IndexError("Distances must be indexed with a cell")
 
-        if cell in self._cells.keys():
-            return self._cells[cell]
-        return None
+        return self._cells.get(cell)
 
     def __setitem__(self, cell: Cell, distance: int) -> None:
         if not is_cell(cell):
             raise IndexError("Distances must be indexed with a cell")
 
         self._cells[cell] = distance
+        self._track_max(cell, distance)
 
     @property
     def cells(self) -> List[Cell]:
@@ -40,15 +57,15 @@ class Distances:
 
     @property
     def max(self) -> Tuple[Cell, int]:
-        max_distance = 0
-        max_cell = self.root
-
-        for cell in self._cells:
-            if self._cells[cell] > max_distance:
-                max_cell = cell
-                max_distance = self._cells[cell]
+        if self._max_stale:
+            self._max_cell, self._max_distance = self.root, 0
+            for cell in self.cells:
+                distance = self[cell]
+                if distance is not None and distance > self._max_distance:
+                    self._max_cell, self._max_distance = cell, distance
+            self._max_stale = False
 
-        return max_cell, max_distance
+        return self._max_cell, self._max_distance
 
     def path_to(self, destination: Cell) -> "Distances":
         """
@@ -58,19 +75,450 @@ class Distances:
             raise ValueError("Destination must be a cell")
 
         current_cell = destination
+        current_distance = self[current_cell]
+        if current_distance is None:
+            raise ValueError("Destination is not reachable from root")
 
-        breadcrumbs = Distances(self.root)
-        breadcrumbs[current_cell] = self._cells[current_cell]
+        breadcrumbs = self._breadcrumbs()
+        breadcrumbs[current_cell] = current_distance
 
         while current_cell != self.root:
-            for neighbor in current_cell.links:
-                if self._cells[neighbor] < self._cells[current_cell]:
-                    breadcrumbs[neighbor] = self._cells[neighbor]
+            for neighbor in current_cell.linked_cells:
+                neighbor_distance = self[neighbor]
+                if neighbor_distance is not None and neighbor_distance < current_distance:
+                    breadcrumbs[neighbor] = neighbor_distance
                     current_cell = neighbor
+                    current_distance = neighbor_distance
                     break
 
         return breadcrumbs
 
+    def _breadcrumbs(self) -> "Distances":
+        return Distances(self.root)
+
+    def _track_max(self, cell: Cell, distance: int) -> None:
+        if distance > self._max_distance:
+            self._max_cell, self._max_distance = cell, distance
+        elif cell == self._max_cell and distance < self._max_distance:
+            self._max_stale = True
+
+
+class ArrayDistances(Distances):
+    """
+    Distances of the cells of a grid, stored in a flat int32 array indexed by cell id (row * columns + column), with
+    -1 for unreached cells. Reads and writes are a single array access, and the farthest cell is tracked while
+    writing so `max` is O(1).
+    Values can be provided (e.g. mapped from a maze file), then the farthest cell is either provided too or searched
+    on first use. When the parent of each cell is provided too (see base.frontier), paths are walked back directly.
+    """
+
+    @property
+    def grid(self) -> Grid:
+        return self._grid
+
+    @property
+    def values(self) -> DistanceValues:
+        return self._values
+
+    @property
+    def parents(self) -> Optional[ParentValues]:
+        return self._parents
+
+    @property
+    def writable(self) -> bool:
+        """
+        Whether the distances can be modified, shared ones (see base.distance_cache) can't
+        """
+        return not memoryview(self._values).readonly
+
+    @property
+    def max(self) -> Tuple[Cell, int]:
+        if self._max_stale:
+            index = int(np.argmax(np.frombuffer(self._values, dtype=np.int32)))
+            self._max_cell, self._max_distance = self._cell_at(index), self._values[index]
+            self._max_stale = False
+        return self._max_cell, self._max_distance
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory taken by the distance values, and the parents if any
+        """
+        return memoryview(self._values).nbytes + (len(self._parents) if self._parents is not None else 0)
+
+    def __init__(self, root: Cell, grid: Grid, values: Optional[DistanceValues] = None,
+                 farthest: Optional[Tuple[Cell, int]] = None, parents: Optional[ParentValues] = None) -> None:
+        if not is_cell(root):
+            raise ValueError("Root must be a cell")
+
+        self.root = root
+        self._grid: Grid = grid
+        self._columns: int = grid.columns
+        self._size: int = grid.size
+        if values is None:
+            self._values: DistanceValues = array("i", [UNREACHED]) * self._size
+            self._values[self._index(root)] = 0
+        elif len(values) != self._size:
+            raise ValueError("Distance values must have exactly one value per cell")
+        else:
+            self._values = values
+        self._parents: Optional[ParentValues] = parents
+        self._max_cell = root
+        self._max_distance = 0
+        self._max_stale = values is not None
+        if farthest is not None:
+            self._max_cell, self._max_distance = farthest
+            self._max_stale = False
+
+    def __getitem__(self, cell: Cell) -> Optional[int]:
+        index = self._index(cell)
+        if index < 0:
+            return None
+        distance = self._values[index]
+        return distance if distance != UNREACHED else None
+
+    def __setitem__(self, cell: Cell, distance: int) -> None:
+        index = self._index(cell)
+        if index < 0:
+            raise IndexError("Cell at row {} column {} is outside the grid".format(cell.row, cell.column))
+
+        self._values[index] = distance
+        self._track_max(cell, distance)
+        # edited distances may no longer match the recorded parents
+        self._parents = None
+
+    def copy(self) -> "ArrayDistances":
+        """
+        Writable copy of these distances, and of the parents if any
+        """
+        farthest = None if self._max_stale else (self._max_cell, self._max_distance)
+        parents = bytearray(self._parents) if self._parents is not None else None
+        return ArrayDistances(self.root, self._grid, array("i", self._values), farthest, parents)
+
+    def link_added(self, first: int, second: int) -> int:
+        """
+        Updates the distances after opening a passage between two cells (by cell id), relaxing only the cells that
+        get closer to root through it. Returns the number of updated cells
+        """
+        values = self._values
+        updated = 0
+        for origin, target in ((first, second), (second, first)):
+            distance = values[origin]
+            if distance != UNREACHED and (values[target] == UNREACHED or distance + 1 < values[target]):
+                self._assign(target, distance + 1, self._direction(target, origin))
+                updated += self._relax([target])
+        return updated
+
+    def link_removed(self, first: int, second: int) -> int:
+        """
+        Updates the distances after closing the passage between two cells (by cell id). Only when one cell was
+        reached through the other, the cells reached through it (its subtree) get their distances recalculated from
+        the cells around them. Returns the number of updated cells.
+        Needs the parents of the cells, as recorded by base.frontier
+        """
+        parents = self._parents
+        if parents is None:
+            raise ValueError("Updating distances after removing links needs their parents")
+        if parents[second] == self._direction(second, first):
+            child = second
+        elif parents[first] == self._direction(first, second):
+            child = first
+        else:
+            # neither distance depended on the passage
+            return 0
+
+        values = self._values
+        steps = self._steps()
+        subtree = [child]
+        for index in subtree:
+            mask = self._mask_at(index)
+            for direction, offset, back in steps:
+                if mask & direction and parents[index + offset] == back:
+                    subtree.append(index + offset)
+        for index in subtree:
+            self._assign(index, UNREACHED, 0)
+
+        # the cells around the subtree keep their distances, so it can be refilled from them, nearest first
+        candidates: List[Tuple[int, int, int]] = []
+        for index in subtree:
+            mask = self._mask_at(index)
+            for direction, offset, _ in steps:
+                if mask & direction and values[index + offset] != UNREACHED:
+                    heappush(candidates, (values[index + offset] + 1, index, direction))
+        while candidates:
+            distance, index, direction = heappop(candidates)
+            if values[index] != UNREACHED:
+                continue
+            self._assign(index, distance, direction)
+            mask = self._mask_at(index)
+            for neighbor_direction, offset, back in steps:
+                if mask & neighbor_direction and values[index + offset] == UNREACHED:
+                    heappush(candidates, (distance + 1, index + offset, back))
+        return len(subtree)
+
+    @property
+    def cells(self) -> List[Cell]:
+        columns = self._columns
+        return [self._grid[divmod(index, columns)]    # type: ignore
+                for index, distance in enumerate(self._values) if distance != UNREACHED]
+
+    def path_to(self, destination: Cell) -> "Path":
+        """
+        Path from root to destination, following the recorded parents if available, in O(path length) either way
+        """
+        index = self._index(destination)
+        if index < 0 or self._values[index] == UNREACHED:
+            raise ValueError("Destination is not reachable from root")
+
+        indices = [index]
+        parents = self._parents
+        if parents is not None:
+            steps = {direction: row_offset * self._columns + column_offset
+                     for direction, (row_offset, column_offset) in OFFSETS.items()}
+            while parents[index]:
+                index += steps[parents[index]]
+                indices.append(index)
+        else:
+            current_cell = destination
+            current_distance = self._values[index]
+            while current_distance > 0:
+                for neighbor in current_cell.linked_cells:
+                    neighbor_distance = self[neighbor]
+                    if neighbor_distance is not None and neighbor_distance < current_distance:
+                        current_cell, current_distance = neighbor, neighbor_distance
+                        indices.append(self._index(neighbor))
+                        break
+                else:
+                    raise ValueError("No path back to root from row {} column {}".format(
+                        current_cell.row, current_cell.column))
+        indices.reverse()
+        return Path(self._grid, indices)
+
+    def _relax(self, frontier: List[int]) -> int:
+        values = self._values
+        steps = self._steps()
+        updated = 0
+        while frontier:
+            new_frontier = []
+            for index in frontier:
+                updated += 1
+                distance = values[index] + 1
+                mask = self._mask_at(index)
+                for direction, offset, back in steps:
+                    if mask & direction:
+                        neighbor = index + offset
+                        if values[neighbor] == UNREACHED or distance < values[neighbor]:
+                            self._assign(neighbor, distance, back)
+                            new_frontier.append(neighbor)
+            frontier = new_frontier
+        return updated
+
+    def _assign(self, index: int, distance: int, parent: int) -> None:
+        """
+        Sets the distance and parent direction of a cell id, keeping track of the farthest cell
+        """
+        self._values[index] = distance
+        if self._parents is not None:
+            self._parents[index] = parent
+        if distance > self._max_distance:
+            self._max_cell, self._max_distance = self._cell_at(index), distance
+        elif distance < self._max_distance and index == self._index(self._max_cell):
+            self._max_stale = True
+
+    def _steps(self) -> List[Tuple[int, int, int]]:
+        # direction, cell id offset of the neighbor at that direction, direction back from the neighbor
+        return [(direction, OFFSETS[direction][0] * self._columns + OFFSETS[direction][1], OPPOSITE[direction])
+                for direction in DIRECTIONS]
+
+    def _direction(self, origin: int, target: int) -> int:
+        return next(direction for direction, offset, _ in self._steps() if origin + offset == target)
+
+    def _mask_at(self, index: int) -> int:
+        return self._grid.mask_at(*divmod(index, self._columns))
+
+    def _cell_at(self, index: int) -> Cell:
+        cell = self._grid.cell_at(*divmod(index, self._columns))
+        if cell is None:
+            raise IndexError("Cell not found at id {}".format(index))
+        return cell
+
+    def _index(self, cell: Cell) -> int:
+        """
+        Cell id, or -1 if the cell falls outside of the grid
+        """
+        try:
+            row = cell.row
+            column = cell.column
+        except AttributeError:
+            raise IndexError("Distances must be indexed with a cell")
+        if 0 <= column < self._columns:
+            index = row * self._columns + column
+            if 0 <= index < self._size:
+                return index
+        return -1
+
+
+class Regions(ArrayDistances):
+    """
+    Distances from the nearest of several source cells, along with the cell id of that source (its owner) for every
+    cell, which splits the grid into one region per source. The farthest cell is the one farthest from all of them,
+    and paths lead back to the owner of the destination. The first source acts as root.
+    """
+
+    @property
+    def sources(self) -> List[Cell]:
+        return list(self._sources)
+
+    @property
+    def owners(self) -> DistanceValues:
+        """
+        Cell id of the owning source of every cell, UNREACHED for cells no source reaches
+        """
+        return self._owners
+
+    @property
+    def nbytes(self) -> int:
+        return super().nbytes + memoryview(self._owners).nbytes
+
+    def __init__(self, sources: Sequence[Cell], grid: Grid, values: DistanceValues, owners: DistanceValues,
+                 farthest: Optional[Tuple[Cell, int]] = None, parents: Optional[ParentValues] = None) -> None:
+        if not sources:
+            raise ValueError("Regions need at least one source cell")
+        if len(owners) != grid.size:
+            raise ValueError("Owners must have exactly one value per cell")
+        super().__init__(sources[0], grid, values, farthest, parents)
+        self._sources: Tuple[Cell, ...] = tuple(sources)
+        self._owners: DistanceValues = owners
+
+    def owner_of(self, cell: Cell) -> Optional[Cell]:
+        """
+        Nearest source of the cell, None if no source reaches it
+        """
+        index = self._index(cell)
+        if index < 0 or self._owners[index] == UNREACHED:
+            return None
+        return self._cell_at(self._owners[index])
+
+    def copy(self) -> "Regions":
+        farthest = None if self._max_stale else (self._max_cell, self._max_distance)
+        parents = bytearray(self._parents) if self._parents is not None else None
+        return Regions(self._sources, self._grid, array("i", self._values), array("i", self._owners), farthest,
+                       parents)
+
+    def link_added(self, first: int, second: int) -> int:
+        raise ValueError("Regions can't be updated in place, calculate them again")
+
+    def link_removed(self, first: int, second: int) -> int:
+        raise ValueError("Regions can't be updated in place, calculate them again")
+
+
+class Path(Distances):
+    """
+    Cells from the root to an end cell, stored as their cell ids (row * columns + column) in order, so the distance of
+    each cell is its position. Can also be built from a direction string, like "SSEN".
+    """
+
+    @property
+    def grid(self) -> Grid:
+        return self._grid
+
+    @property
+    def indices(self) -> "array[int]":
+        return self._indices
+
+    @property
+    def directions(self) -> str:
+        steps = {OFFSETS[direction][0] * self._columns + OFFSETS[direction][1]: name
+                 for direction, name in NAMES.items()}
+        return "".join(steps[end - start] for start, end in zip(self._indices, self._indices[1:]))
+
+    @property
+    def end(self) -> Cell:
+        return self._cell_at(self._indices[-1])
+
+    @property
+    def cells(self) -> List[Cell]:
+        return [self._cell_at(index) for index in self._indices]
+
+    @property
+    def max(self) -> Tuple[Cell, int]:
+        return self.end, len(self._indices) - 1
+
+    def __init__(self, grid: Grid, indices: Iterable[int]) -> None:
+        self._grid: Grid = grid
+        self._columns: int = grid.columns
+        self._indices: "array[int]" = array("i", indices)
+        if len(self._indices) == 0:
+            raise ValueError("A path needs at least one cell")
+        self._check_steps()
+        # distance of each cell id, only built if cells get looked up
+        self._positions: Optional[Dict[int, int]] = None
+        self.root = self._cell_at(self._indices[0])
+
+    @classmethod
+    def from_directions(cls, grid: Grid, start: Cell, directions: str) -> "Path":
+        steps = {name: OFFSETS[direction] for direction, name in NAMES.items()}
+        row, column = start.row, start.column
+        indices = [row * grid.columns + column]
+        for name in directions:
+            if name not in steps:
+                raise ValueError("Invalid direction {!r}, expected one of {}".format(name, "".join(steps)))
+            row, column = row + steps[name][0], column + steps[name][1]
+            if not (0 <= row < grid.rows and 0 <= column < grid.columns):
+                raise ValueError("Step {} of {!r} leaves the grid".format(len(indices), directions))
+            indices.append(row * grid.columns + column)
+        return cls(grid, indices)
+
+    def __getitem__(self, cell: Cell) -> Optional[int]:
+        if self._positions is None:
+            self._positions = {index: position for position, index in enumerate(self._indices)}
+        try:
+            return self._positions.get(cell.row * self._columns + cell.column)
+        except AttributeError:
+            raise IndexError("Distances must be indexed with a cell")
+
+    def __setitem__(self, cell: Cell, distance: int) -> None:
+        raise TypeError("Paths can't be modified")
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def path_to(self, destination: Cell) -> "Path":
+        position = self[destination]
+        if position is None:
+            raise ValueError("Destination is not part of the path")
+        return Path(self._grid, self._indices[:position + 1])
+
+    def _check_steps(self) -> None:
+        """
+        Every cell id must be part of the grid and next to the previous one (not wrapping around rows)
+        """
+        size = self._grid.size
+        columns = self._columns
+        previous = None
+        for index in self._indices:
+            if not 0 <= index < size:
+                raise ValueError("Cell {} is not part of the grid".format(index))
+            if previous is not None:
+                step = index - previous
+                if not (step in (columns, -columns) or step in (1, -1) and index // columns == previous // columns):
+                    raise ValueError("Cells {} and {} of the path are not adjacent".format(previous, index))
+            previous = index
+
+    def _cell_at(self, index: int) -> Cell:
+        cell = self._grid.cell_at(*divmod(index, self._columns))
+        if cell is None:
+            raise IndexError("Path leaves the grid at cell {}".format(index))
+        return cell
+
+
+_cell_type: Optional[type] = None
+
 
 def is_cell(cell: Cell) -> bool:
-    return type(cell).__name__ == Cell
+    global _cell_type
+    if _cell_type is None:
+        # resolved on first use, as Cell imports this module
+        from base.cell import Cell as CellType
+        _cell_type = CellType
+    return isinstance(cell, _cell_type)
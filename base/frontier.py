@@ -0,0 +1,246 @@
+from array import array
+from heapq import heappop, heappush
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from base.directions import EAST, NORTH, SOUTH, WEST
+from base.distances import ArrayDistances, Regions, UNREACHED
+
+# Avoid cyclic import, as Cell uses the frontier engine
+if TYPE_CHECKING:
+    from base.cell import Cell
+    from base.grid import Grid, MaskBuffer
+else:
+    Cell = "Cell"
+    Grid = "Grid"
+    MaskBuffer = "MaskBuffer"
+
+
+# Frontiers smaller than this are expanded in plain Python, as the fixed cost of each NumPy call would dominate.
+# Perfect mazes mostly grow thin frontiers, open areas and braided mazes grow wide ones.
+VECTORIZE_THRESHOLD = 256
+
+# Weighted floods queue cells in one bucket per distance (Dial's algorithm) while no weight is above this: a ring of
+# max weight + 1 buckets costs O(1) per cell, against O(log n) for a binary heap
+BUCKET_QUEUE_MAX_WEIGHT = 255
+
+DistanceField = NDArray[np.int32]
+# direction from every reached cell towards the one it was reached from, 0 for the start and unreached cells
+ParentField = NDArray[np.uint8]
+# cell id of the source every reached cell was reached from
+OwnerField = NDArray[np.int32]
+# farthest cell id and its distance
+Farthest = Tuple[int, int]
+# Weights of all cells, row-major
+WeightBuffer = Union["array[int]", memoryview]
+# (link direction, cell id offset, direction back)
+Steps = Tuple[Tuple[int, int, int], ...]
+
+
+def breadth_first(masks: MaskBuffer, columns: int, start: int) -> Tuple[DistanceField, ParentField, Farthest]:
+    """
+    Distances from the start cell id to every cell id reachable through the given link bitmasks (UNREACHED for the
+    rest), expanding whole frontiers at once. Also records where each cell was reached from, so paths can be walked
+    back without searching.
+    """
+    distances, parents, _, farthest = _flood(masks, columns, [start], False)
+    return distances, parents, farthest
+
+
+def nearest_sources(masks: MaskBuffer, columns: int,
+                    sources: Sequence[int]) -> Tuple[DistanceField, OwnerField, ParentField, Farthest]:
+    """
+    Distances from the nearest of the source cell ids to every reachable cell id, and the source cell id each one
+    was reached from (its owner), in a single flood seeded with all the sources. Ties between sources go to either.
+    """
+    distances, parents, owners, farthest = _flood(masks, columns, sources, True)
+    assert owners is not None
+    return distances, owners, parents, farthest
+
+
+def cheapest_first(masks: MaskBuffer, weights: WeightBuffer, columns: int, start: int,
+                   bucketed: Optional[bool] = None) -> Tuple[DistanceField, ParentField, Farthest]:
+    """
+    Cheapest total weight from the start cell id to every cell id reachable through the given link bitmasks
+    (UNREACHED for the rest), entering a cell costing its weight (Dijkstra's algorithm). Parents are recorded like
+    breadth_first does. Weights must not be negative; up to BUCKET_QUEUE_MAX_WEIGHT they are queued in buckets,
+    heavier ones in a heap, unless `bucketed` forces either.
+    """
+    distances = np.full(len(masks), UNREACHED, dtype=np.int32)
+    distances[start] = 0
+    parents = np.zeros(len(masks), dtype=np.uint8)
+    steps = ((NORTH, -columns, SOUTH), (SOUTH, columns, NORTH), (EAST, 1, WEST), (WEST, -1, EAST))
+
+    max_weight = int(np.frombuffer(weights, dtype=np.int32).max())
+    if bucketed is None:
+        bucketed = max_weight <= BUCKET_QUEUE_MAX_WEIGHT
+    search = _bucket_search if bucketed else _heap_search
+    values = distances.data
+    farthest = search(masks, weights, steps, values, parents.data, start, max_weight)
+    return distances, parents, (farthest, values[farthest])
+
+
+def distances_from(grid: Grid, root: Cell) -> ArrayDistances:
+    """
+    Distances of every cell of the grid from the root cell. They are read-only, so they can be shared (see
+    base.distance_cache)
+    """
+    columns = grid.columns
+    values, parents, farthest = breadth_first(grid.link_masks(), columns, root.row * columns + root.column)
+    return _read_only(grid, root, values, parents, farthest)
+
+
+def weighted_distances_from(grid: Grid, root: Cell, weights: WeightBuffer) -> ArrayDistances:
+    """
+    Cheapest total weight of every cell of the grid from the root cell, read-only like distances_from
+    """
+    columns = grid.columns
+    values, parents, farthest = cheapest_first(grid.link_masks(), weights, columns, root.row * columns + root.column)
+    return _read_only(grid, root, values, parents, farthest)
+
+
+def regions_from(grid: Grid, sources: Sequence[Cell]) -> Regions:
+    """
+    Distances of every cell of the grid from the nearest of the source cells, and which source that is
+    """
+    columns = grid.columns
+    values, owners, parents, (farthest, distance) = nearest_sources(
+        grid.link_masks(), columns, [source.row * columns + source.column for source in sources])
+    farthest_cell = grid.cell_at(*divmod(farthest, columns))
+    assert farthest_cell is not None
+    return Regions(sources, grid, values.data, owners.data, (farthest_cell, distance), parents.data)
+
+
+def _flood(masks: MaskBuffer, columns: int, starts: Sequence[int],
+           with_owners: bool) -> Tuple[DistanceField, ParentField, Optional[OwnerField], Farthest]:
+    distances = np.full(len(masks), UNREACHED, dtype=np.int32)
+    parents = np.zeros(len(masks), dtype=np.uint8)
+    owners = np.full(len(masks), UNREACHED, dtype=np.int32) if with_owners else None
+    # scalar reads and writes through a memoryview are far cheaper than through the NumPy array
+    values = distances.data
+    parent_values = parents.data
+    owner_values = owners.data if owners is not None else None
+    vector_masks = np.frombuffer(masks, dtype=np.uint8)
+    steps = ((NORTH, -columns, SOUTH), (SOUTH, columns, NORTH), (EAST, 1, WEST), (WEST, -1, EAST))
+
+    seeds = []
+    for start in starts:
+        if values[start] == UNREACHED:
+            values[start] = 0
+            if owner_values is not None:
+                owner_values[start] = start
+            seeds.append(start)
+    if not seeds:
+        raise ValueError("Floods need at least one start cell")
+    frontier: Union[List[int], NDArray[np.intp]] = seeds
+    farthest = seeds[0]
+    distance = 0
+    while len(frontier) > 0:
+        farthest = int(frontier[0])
+        distance += 1
+        if len(frontier) < VECTORIZE_THRESHOLD:
+            new_frontier = []
+            for index in (frontier if isinstance(frontier, list) else frontier.tolist()):
+                mask = masks[index]
+                for direction, offset, back in steps:
+                    if mask & direction:
+                        neighbor = index + offset
+                        if values[neighbor] == UNREACHED:
+                            values[neighbor] = distance
+                            parent_values[neighbor] = back
+                            if owner_values is not None:
+                                owner_values[neighbor] = owner_values[index]
+                            new_frontier.append(neighbor)
+            frontier = new_frontier
+        else:
+            cells = np.asarray(frontier, dtype=np.intp)
+            cell_masks = vector_masks[cells]
+            origin_parts = []
+            candidate_parts = []
+            back_parts = []
+            for direction, offset, back in steps:
+                linked = cells[cell_masks & direction != 0]
+                origin_parts.append(linked)
+                candidate_parts.append(linked + offset)
+                back_parts.append(np.full(len(linked), back, dtype=np.uint8))
+            candidates = np.concatenate(candidate_parts)
+            backs = np.concatenate(back_parts)
+            unreached = distances[candidates] == UNREACHED
+            # a cell can be reached from two frontier cells when there are loops, either one is a valid parent
+            reached, first = np.unique(candidates[unreached], return_index=True)
+            distances[reached] = distance
+            parents[reached] = backs[unreached][first]
+            if owners is not None:
+                owners[reached] = owners[np.concatenate(origin_parts)[unreached][first]]
+            frontier = reached
+
+    return distances, parents, owners, (farthest, distance - 1)
+
+
+def _bucket_search(masks: MaskBuffer, weights: WeightBuffer, steps: Steps, values: memoryview,
+                   parents: memoryview, start: int, max_weight: int) -> int:
+    # pending distances span at most max weight + 1 values, so each bucket of the ring holds a single distance
+    size = max_weight + 1
+    buckets: List[List[int]] = [[] for _ in range(size)]
+    buckets[0].append(start)
+    pending = 1
+    farthest = start
+    distance = 0
+    while pending:
+        bucket = buckets[distance % size]
+        # zero weights queue cells at the current distance, into the bucket being emptied
+        while bucket:
+            index = bucket.pop()
+            pending -= 1
+            if values[index] != distance:
+                # reached cheaper after being queued
+                continue
+            farthest = index
+            mask = masks[index]
+            for direction, offset, back in steps:
+                if mask & direction:
+                    neighbor = index + offset
+                    cost = distance + weights[neighbor]
+                    known_cost = values[neighbor]
+                    if known_cost == UNREACHED or cost < known_cost:
+                        values[neighbor] = cost
+                        parents[neighbor] = back
+                        buckets[cost % size].append(neighbor)
+                        pending += 1
+        distance += 1
+    return farthest
+
+
+def _heap_search(masks: MaskBuffer, weights: WeightBuffer, steps: Steps, values: memoryview,
+                 parents: memoryview, start: int, max_weight: int) -> int:
+    heap = [(0, start)]
+    farthest = start
+    while heap:
+        distance, index = heappop(heap)
+        if values[index] != distance:
+            # reached cheaper after being queued
+            continue
+        farthest = index
+        mask = masks[index]
+        for direction, offset, back in steps:
+            if mask & direction:
+                neighbor = index + offset
+                cost = distance + weights[neighbor]
+                known_cost = values[neighbor]
+                if known_cost == UNREACHED or cost < known_cost:
+                    values[neighbor] = cost
+                    parents[neighbor] = back
+                    heappush(heap, (cost, neighbor))
+    return farthest
+
+
+def _read_only(grid: Grid, root: Cell, values: DistanceField, parents: ParentField,
+               farthest: Farthest) -> ArrayDistances:
+    farthest_index, distance = farthest
+    farthest_cell = grid.cell_at(*divmod(farthest_index, grid.columns))
+    assert farthest_cell is not None
+    values.flags.writeable = False
+    parents.flags.writeable = False
+    return ArrayDistances(root, grid, values.data, (farthest_cell, distance), parents.data)
@@ -1,11 +1,24 @@
+from itertools import count
 from random import randrange
-from typing import cast, Generator, List, Optional, Tuple
+from typing import cast, Generator, List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
 
 from base.cell import Cell, is_cell
+from base.degrees import Degrees
+from base.distance_cache import DistanceCache
+from base.distances import ArrayDistances, Path
+import base.frontier as frontier
+
+if TYPE_CHECKING:
+    from base.colored_grid import ColoredGrid    # noqa: F401
 
 
 Key = Tuple[int, int]
 CellList = List[Cell]
+# Link bitmasks of all cells, row-major
+MaskBuffer = Union[bytes, bytearray, memoryview]
+
+# Source of unique grid identity tokens
+_tokens = count(1)
 
 
 class Grid:
@@ -18,6 +31,27 @@ class Grid:
     def columns(self) -> int:
         return self._columns
 
+    @property
+    def token(self) -> int:
+        """
+        Unique identity of this grid instance, shared by all of its cells
+        """
+        return self._token
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented on every link change, so anything derived from the links can tell whether it is outdated
+        """
+        return self._version
+
+    @property
+    def distance_cache(self) -> DistanceCache:
+        """
+        Distance fields already calculated from cells of this grid, see Cell.distances
+        """
+        return self._distance_cache
+
     @property
     def size(self) -> int:
         return self.rows * self.columns
@@ -28,7 +62,29 @@ class Grid:
 
     @property
     def deadends(self) -> List[Cell]:
-        return [cell for cell in self.each_cell() if len(cell.links) == 1]
+        return [cast(Cell, self.cell_at(*divmod(index, self.columns))) for index in self.current_degrees().deadends]
+
+    @property
+    def deadend_count(self) -> int:
+        return self.current_degrees().deadend_count
+
+    @property
+    def junction_count(self) -> int:
+        return self.current_degrees().junction_count
+
+    @property
+    def passage_count(self) -> int:
+        """
+        Number of links between cells. A connected maze with size - 1 of them is perfect (a spanning tree)
+        """
+        return sum(degree * count for degree, count in enumerate(self.degree_histogram)) // 2
+
+    @property
+    def degree_histogram(self) -> List[int]:
+        """
+        Amount of cells by number of links, kept up to date while linking so can be sampled at any time
+        """
+        return self.current_degrees().histogram
 
     def __init__(self, rows: int, columns: int) -> None:
         if rows is None or rows < 2:
@@ -38,6 +94,10 @@ class Grid:
 
         self._rows: int = rows
         self._columns: int = columns
+        self._token: int = next(_tokens)
+        self._version: int = 0
+        self._distance_cache: DistanceCache = DistanceCache(self)
+        self._degrees: Degrees = self.prepare_degrees()
         self._grid: List[List[Cell]] = self.prepare_grid()
         self.configure_cells()
 
@@ -49,10 +109,26 @@ class Grid:
         return self._grid[row][column]
 
     def set_cell_at(self, row: int, column: int, value: Cell) -> None:
+        old_value = self._grid[row][column]
+        index = row * self.columns + column
+        self._degrees.remove(index, old_value.link_count)
+        self._degrees.add(index, value.link_count)
+        value.grid = self
         self._grid[row][column] = value
+        self._version += 1
+
+    def prepare_degrees(self) -> Degrees:
+        return Degrees(self.size)
+
+    def current_degrees(self) -> Degrees:
+        """
+        Degree histogram the statistics are read from, up to date with the links
+        """
+        return self._degrees
 
     def prepare_grid(self) -> List[List[Cell]]:
-        return [[Cell(row, column) for column in range(self.columns)] for row in range(self.rows)]
+        return [[Cell(row, column, self) for column in range(self.columns)]
+                for row in range(self.rows)]
 
     def configure_cells(self) -> None:
         """
@@ -62,10 +138,28 @@ class Grid:
             row = cell.row
             column = cell.column
 
-            cell.north = self[row - 1, column]
-            cell.south = self[row + 1, column]
-            cell.east = self[row, column + 1]
-            cell.west = self[row, column - 1]
+            cell.set_neighbors(north=self.cell_at(row - 1, column), south=self.cell_at(row + 1, column),
+                               east=self.cell_at(row, column + 1), west=self.cell_at(row, column - 1))
+
+    def link_changed(self, index: int, old_degree: int, new_degree: int) -> None:
+        """
+        Called by the cells of this grid (by cell id) each time they gain or lose a link
+        """
+        self._degrees.update(index, old_degree, new_degree)
+        self._version += 1
+
+    def passage_changed(self, first: int, second: int, linked: bool) -> None:
+        """
+        Called once each time a passage between two cells (by cell id) is opened or closed, after both cells
+        changed. Grids keeping data derived from the links can update it here
+        """
+        pass
+
+    def distances_from(self, root: Cell) -> ArrayDistances:
+        """
+        Distances of every cell from the root cell, calculated on each call. Cell.distances caches them
+        """
+        return frontier.distances_from(self, root)
 
     def random_cell(self) -> Cell:
         row = randrange(0, self.rows)
@@ -81,6 +175,44 @@ class Grid:
             for cell in row:
                 yield cell
 
+    def each_row_masks(self) -> Generator[bytes, None, None]:
+        """
+        Link bitmasks (see base.directions) of every row, one byte per cell
+        """
+        for row in self.each_row():
+            yield bytes(cell.link_mask for cell in row)
+
+    def link_masks(self) -> MaskBuffer:
+        """
+        Link bitmasks of the whole grid, one byte per cell indexed by cell id (row * columns + column)
+        """
+        return b"".join(self.each_row_masks())
+
+    def mask_at(self, row: int, column: int) -> int:
+        """
+        Link bitmask of a single cell
+        """
+        cell = self.cell_at(row, column)
+        if cell is None:
+            raise IndexError("Cell not found at row {} column {}".format(row, column))
+        return cell.link_mask
+
+    def save(self, path: str, solution: Optional[Union[Sequence[Cell], Path]] = None) -> None:
+        """
+        Stores the maze (and distances and solution path, if any) in the binary maze file format
+        """
+        # maze files are handled by grid subclasses, imported here to avoid a cyclic import
+        from base.mapped_grid import save
+        save(self, path, solution)
+
+    @staticmethod
+    def load(path: str) -> "ColoredGrid":
+        """
+        Opens a binary maze file as a read-only memory-mapped grid, without parsing the cells
+        """
+        from base.mapped_grid import load
+        return load(path)
+
     def contents_of(self, cell: Cell) -> str:
         return "   "
 
@@ -103,11 +235,14 @@ class Grid:
         self.set_cell_at(*key, value)
 
     def __contains__(self, other: Cell) -> bool:
-        if is_cell(other):
-            for cell in self.each_cell():
-                if cell == other:
-                    return True
-        return False
+        """
+        O(1) membership: the cell must carry this grid's token and be the very object stored at its coordinates
+        """
+        if not is_cell(other) or other.grid_token != self.token:
+            return False
+        row = other.row
+        column = other.column
+        return 0 <= row < self.rows and 0 <= column < self.columns and self._grid[row][column] is other
 
 
 def is_key(key: Key) -> bool:
@@ -0,0 +1,195 @@
+from typing import Callable, Dict, Generator, Hashable, List, Tuple
+
+from base.cell import Cell
+from base.compact_grid import CellList, CompactCell, CompactGrid
+from base.directions import DIRECTIONS, EAST, OFFSETS, SOUTH
+from base.grid import Grid, MaskBuffer
+
+
+Coordinates = Tuple[int, int]
+# row = origin + row_step * row + column_step * column, same for column
+Affine = Tuple[Coordinates, Coordinates, Coordinates]
+
+
+class GridView(CompactGrid):
+    """
+    Rotated and/or reflected view of another grid, covering the 8 symmetries of a square: the source is first
+    optionally mirrored left to right, then rotated 90 degrees clockwise `rotations` times.
+    Holds no links: coordinates and link directions are remapped to the source grid on each access, so creating a
+    view (or a view of a view, which gets flattened) is O(1). Linking view cells links the source ones.
+    materialize() builds a standalone grid when one is needed (e.g. to calculate distances over it).
+    """
+
+    @property
+    def source(self) -> Grid:
+        return self._source
+
+    @property
+    def rotations(self) -> int:
+        return self._rotations
+
+    @property
+    def reflected(self) -> bool:
+        return self._reflected
+
+    @property
+    def version(self) -> int:
+        # links live in the source
+        return self._source.version
+
+    @property
+    def deadends(self) -> List[Cell]:
+        return [CompactCell(self, *self.from_source(cell.row, cell.column)) for cell in self._source.deadends]
+
+    @property
+    def deadend_count(self) -> int:
+        return self._source.deadend_count
+
+    @property
+    def junction_count(self) -> int:
+        return self._source.junction_count
+
+    @property
+    def degree_histogram(self) -> List[int]:
+        return self._source.degree_histogram
+
+    def __init__(self, source: Grid, rotations: int = 1, reflected: bool = False) -> None:
+        if isinstance(source, GridView):
+            # mirroring after rotating equals rotating backwards after mirroring
+            rotations = rotations - source.rotations if reflected else rotations + source.rotations
+            reflected = reflected != source.reflected
+            source = source.source
+
+        self._source: Grid = source
+        self._rotations: int = rotations % 4
+        self._reflected: bool = reflected
+
+        rows, columns = source.dimensions
+        if self._rotations % 2 == 1:
+            rows, columns = columns, rows
+
+        self._to_source: Affine = self._affine(self._step_to_source, rows, columns)
+        self._to_view: Affine = self._affine(self._step_to_view, source.rows, source.columns)
+        self._source_directions: Dict[int, int] = {
+            direction: self._direction_at(self._to_source, direction) for direction in DIRECTIONS
+        }
+        # view link mask for every possible source link mask
+        self._view_masks: List[int] = [
+            sum(direction for direction in DIRECTIONS if mask & self._source_directions[direction])
+            for mask in range(16)
+        ]
+        super().__init__(rows, columns)
+
+    def prepare_grid(self) -> List[List[Cell]]:
+        # no storage at all, everything is read from the source
+        return []
+
+    def to_source(self, row: int, column: int) -> Coordinates:
+        (row_origin, column_origin), (row_by_row, column_by_row), (row_by_column, column_by_column) = self._to_source
+        return (row_origin + row_by_row * row + row_by_column * column,
+                column_origin + column_by_row * row + column_by_column * column)
+
+    def from_source(self, row: int, column: int) -> Coordinates:
+        (row_origin, column_origin), (row_by_row, column_by_row), (row_by_column, column_by_column) = self._to_view
+        return (row_origin + row_by_row * row + row_by_column * column,
+                column_origin + column_by_row * row + column_by_column * column)
+
+    def source_cell(self, cell: Cell) -> Cell:
+        return self._source_cell_at(cell.row, cell.column)
+
+    def materialize(self) -> Grid:
+        """
+        Builds a new grid, of the same type as the source one, with the links as seen through this view
+        """
+        grid = type(self._source)(rows=self.rows, columns=self.columns)
+        for row in range(self.rows):
+            for column in range(self.columns):
+                mask = self.mask_at(row, column)
+                cell = grid.cell_at(row, column)
+                if cell is None:
+                    raise IndexError("Cell not found at row {} column {}".format(row, column))
+                if mask & SOUTH:
+                    cell.link(grid.cell_at(row + 1, column))    # type: ignore
+                if mask & EAST:
+                    cell.link(grid.cell_at(row, column + 1))    # type: ignore
+        return grid
+
+    def set_cell_at(self, row: int, column: int, value: Cell) -> None:
+        raise TypeError("Grid views can't replace cells, materialize() them first")
+
+    def each_row_masks(self) -> Generator[bytes, None, None]:
+        for row in range(self.rows):
+            yield bytes(self.mask_at(row, column) for column in range(self.columns))
+
+    def link_masks(self) -> MaskBuffer:
+        return b"".join(self.each_row_masks())
+
+    def mask_at(self, row: int, column: int) -> int:
+        return self._view_masks[self._source_cell_at(row, column).link_mask]
+
+    def link_at(self, row: int, column: int, direction: int, bidirectional: bool = True) -> None:
+        cell, neighbor = self._source_pair(row, column, direction)
+        cell.link(neighbor, bidirectional)
+
+    def unlink_at(self, row: int, column: int, direction: int, bidirectional: bool = True) -> None:
+        cell, neighbor = self._source_pair(row, column, direction)
+        cell.unlink(neighbor, bidirectional)
+
+    def links_of(self, row: int, column: int) -> CellList:
+        mask = self.mask_at(row, column)
+        return [CompactCell(self, row + OFFSETS[direction][0], column + OFFSETS[direction][1])
+                for direction in DIRECTIONS if mask & direction]
+
+    def data_of(self, row: int, column: int) -> Dict:
+        return self._source_cell_at(row, column).data
+
+    def has_data_at(self, row: int, column: int, key: Hashable) -> bool:
+        return self._source_cell_at(row, column).has_data(key)
+
+    def contents_of(self, cell: Cell) -> str:
+        return self._source.contents_of(self.source_cell(cell))
+
+    def _source_cell_at(self, row: int, column: int) -> Cell:
+        source_cell = self._source.cell_at(*self.to_source(row, column))
+        if source_cell is None:
+            raise IndexError("Cell not found at row {} column {}".format(row, column))
+        return source_cell
+
+    def _source_pair(self, row: int, column: int, direction: int) -> Tuple[Cell, Cell]:
+        row_offset, column_offset = OFFSETS[direction]
+        return self._source_cell_at(row, column), self._source_cell_at(row + row_offset, column + column_offset)
+
+    def _step_to_source(self, row: int, column: int, rows: int, columns: int) -> Coordinates:
+        # undo the rotations (each swaps dimensions), then the mirroring
+        for _ in range(self._rotations):
+            row, column = columns - 1 - column, row
+            rows, columns = columns, rows
+        if self._reflected:
+            column = columns - 1 - column
+        return row, column
+
+    def _step_to_view(self, row: int, column: int, rows: int, columns: int) -> Coordinates:
+        if self._reflected:
+            column = columns - 1 - column
+        for _ in range(self._rotations):
+            row, column = column, rows - 1 - row
+            rows, columns = columns, rows
+        return row, column
+
+    @staticmethod
+    def _affine(step: Callable[[int, int, int, int], Coordinates], rows: int, columns: int) -> Affine:
+        # the transforms are affine, so three points are enough to know them
+        origin = step(0, 0, rows, columns)
+        by_row = step(1, 0, rows, columns)
+        by_column = step(0, 1, rows, columns)
+        return (origin,
+                (by_row[0] - origin[0], by_row[1] - origin[1]),
+                (by_column[0] - origin[0], by_column[1] - origin[1]))
+
+    @staticmethod
+    def _direction_at(affine: Affine, direction: int) -> int:
+        _, (row_by_row, column_by_row), (row_by_column, column_by_column) = affine
+        row_offset, column_offset = OFFSETS[direction]
+        offset = (row_by_row * row_offset + row_by_column * column_offset,
+                  column_by_row * row_offset + column_by_column * column_offset)
+        return next(candidate for candidate in DIRECTIONS if OFFSETS[candidate] == offset)
@@ -0,0 +1,279 @@
+from array import array
+import mmap
+import struct
+import sys
+import tempfile
+from typing import Any, BinaryIO, cast, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+from base.cell import Cell
+from base.colored_grid import ColoredGrid
+from base.compact_grid import CompactGrid, Masks
+from base.distance_grid import DistanceGrid
+from base.distances import ArrayDistances, Path
+from base.grid import Grid
+
+
+# File layout: fixed-size header, then one link bitmask byte per cell in row-major order, so row sweeps read the
+# file sequentially, then the optional sections. Unused header bytes are zero, reserved for future fields.
+MAGIC = b"MAZE"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")   # magic, version, flags, rows, columns
+HEADER_SIZE = 64
+
+# Optional sections, flagged in the header and located by the section table that follows it:
+# - distances: one little-endian int32 per cell, -1 for unreached cells, plus the farthest cell index and distance
+# - solution: little-endian int32 cell indices (row * columns + column) from start to end
+FLAG_DISTANCES = 1
+FLAG_SOLUTION = 2
+# distances offset, distances root index, solution offset, solution length, farthest index, farthest distance
+SECTIONS = struct.Struct("<QqQQqi")
+SECTION_ALIGNMENT = 8
+UNREACHED = -1
+
+MappedGridType = TypeVar("MappedGridType", bound="MappedGrid")
+Sections = Tuple[int, int, int, int, int, int]
+NO_SECTIONS: Sections = (0, UNREACHED, 0, 0, UNREACHED, 0)
+
+
+def write_header(file: BinaryIO, rows: int, columns: int, flags: int = 0, sections: Sections = NO_SECTIONS) -> None:
+    file.seek(0)
+    header = HEADER.pack(MAGIC, VERSION, flags, rows, columns) + SECTIONS.pack(*sections)
+    file.write(header.ljust(HEADER_SIZE, b"\x00"))
+
+
+def read_header(file: BinaryIO) -> Tuple[int, int, int, Sections]:
+    """
+    Returns the flags, rows, columns and section table of a maze file
+    """
+    file.seek(0)
+    data = file.read(HEADER_SIZE)
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Not a maze file: header too short")
+    magic, version, flags, rows, columns = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a maze file: invalid magic {!r}".format(magic))
+    if version > VERSION:
+        raise ValueError("Unsupported maze file version {}".format(version))
+    return flags, rows, columns, cast(Sections, SECTIONS.unpack_from(data, HEADER.size))
+
+
+class MappedGrid(CompactGrid):
+    """
+    CompactGrid whose link bitmasks live in a memory-mapped file instead of the Python heap, for mazes that don't fit
+    in RAM: the OS page cache decides what stays in memory. Without a path, an anonymous temporary file is used.
+    Existing files are reopened with MappedGrid.open().
+    """
+
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    @property
+    def flags(self) -> int:
+        return self._flags
+
+    @property
+    def sections(self) -> Sections:
+        return self._sections
+
+    @property
+    def solution(self) -> Optional[List[Cell]]:
+        """
+        Cells of the solution path stored in the file, if any
+        """
+        if not self._flags & FLAG_SOLUTION:
+            return None
+        _, _, offset, length, _, _ = self._sections
+        return [cast(Cell, self.cell_at(*divmod(index, self.columns))) for index in self.int32_section(offset, length)]
+
+    def __init__(self, rows: int, columns: int, path: Optional[str] = None) -> None:
+        self._path: Optional[str] = path
+        self._file: Optional[BinaryIO] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._exported: List[memoryview] = []
+        self._flags: int = 0
+        self._sections: Sections = NO_SECTIONS
+        super().__init__(rows, columns)
+
+    @classmethod
+    def open(cls: Type[MappedGridType], path: str, writable: bool = True) -> MappedGridType:
+        """
+        Maps an existing maze file. Read-only grids raise TypeError when trying to link cells
+        """
+        grid = cls.__new__(cls)
+        grid._path = path
+        grid._file = open(path, "r+b" if writable else "rb")
+        grid._mmap = None
+        grid._view = None
+        grid._exported = []
+        try:
+            grid._flags, rows, columns, grid._sections = read_header(grid._file)
+            # provided masks are not read here, the degree histogram is counted on first use
+            CompactGrid.__init__(grid, rows, columns, masks=grid._map(rows * columns, writable))
+        except Exception:
+            # e.g. a truncated file, whose masks are shorter than the header says
+            grid.close()
+            raise
+        return grid
+
+    def prepare_masks(self) -> Masks:
+        if self._file is not None:
+            return super().prepare_masks()
+
+        self._file = open(self._path, "w+b") if self._path is not None else tempfile.TemporaryFile()
+        try:
+            # sparse on most filesystems, untouched pages take neither disk nor memory
+            self._file.truncate(HEADER_SIZE + self.size)
+            write_header(self._file, self.rows, self.columns)
+            self._file.flush()
+            return self._map(self.size, writable=True)
+        except Exception:
+            self.close()
+            raise
+
+    def int32_section(self, offset: int, length: int) -> memoryview:
+        """
+        Zero-copy view of a section of little-endian int32 values, released when the grid is closed
+        """
+        assert self._mmap is not None
+        if sys.byteorder != "little":
+            raise ValueError("Zero-copy int32 sections need a little-endian platform")
+        section = memoryview(self._mmap)[offset:offset + length * 4].cast("i")
+        self._exported.append(section)
+        return section
+
+    def flush(self) -> None:
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Flushes and unmaps the file. The grid is not usable afterwards
+        """
+        for section in self._exported:
+            section.release()
+        self._exported.clear()
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _map(self, size: int, writable: bool) -> memoryview:
+        assert self._file is not None
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)[HEADER_SIZE:HEADER_SIZE + size]
+        return self._view
+
+    def __enter__(self: MappedGridType) -> MappedGridType:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class MappedColoredGrid(MappedGrid, ColoredGrid):
+    pass
+
+
+def save(grid: Grid, path: str, solution: Optional[Union[Sequence[Cell], Path]] = None) -> None:
+    """
+    Writes any grid to a maze file, including its distances if it is a DistanceGrid that has them
+    """
+    flags = 0
+    distances_offset, distances_root, solution_offset, solution_length, farthest_index, farthest_distance = \
+        NO_SECTIONS
+    distances = grid.distances if isinstance(grid, DistanceGrid) else None
+
+    with open(path, "wb") as file:
+        _write_rows(file, grid.each_row_masks(), grid.columns)
+
+        if distances is not None:
+            flags |= FLAG_DISTANCES
+            distances_offset = _align(file)
+            distances_root = _index_of(grid, distances.root)
+            farthest_cell, farthest_distance = distances.max
+            farthest_index = _index_of(grid, farthest_cell)
+            if isinstance(distances, ArrayDistances) and distances.grid is grid:
+                values = array("i", distances.values)
+            else:
+                values = array("i", [UNREACHED]) * grid.size
+                for cell in distances.cells:
+                    values[_index_of(grid, cell)] = cast(int, distances[cell])
+            _write_int32(file, values)
+
+        if solution:
+            flags |= FLAG_SOLUTION
+            solution_offset = _align(file)
+            solution_length = len(solution)
+            if isinstance(solution, Path):
+                _write_int32(file, array("i", solution.indices))
+            else:
+                _write_int32(file, array("i", (_index_of(grid, cell) for cell in solution)))
+
+        write_header(file, grid.rows, grid.columns, flags,
+                     (distances_offset, distances_root, solution_offset, solution_length, farthest_index,
+                      farthest_distance))
+
+
+def save_rows(rows: Iterable[bytes], columns: int, path: str) -> int:
+    """
+    Writes a maze given as a stream of rows of link bitmasks to a maze file, one row at a time, and returns the number
+    of rows. The header is written last, once they are known
+    """
+    with open(path, "wb") as file:
+        rows_count = _write_rows(file, rows, columns)
+        write_header(file, rows_count, columns)
+    return rows_count
+
+
+def load(path: str, writable: bool = False) -> MappedColoredGrid:
+    """
+    Maps a maze file, without reading the link bitmasks. Distances, if stored, are set on the grid as a zero-copy view
+    of the file.
+    """
+    grid = MappedColoredGrid.open(path, writable)
+    if grid.flags & FLAG_DISTANCES:
+        offset, root_index, _, _, farthest_index, farthest_distance = grid.sections
+        root = cast(Cell, grid.cell_at(*divmod(root_index, grid.columns)))
+        farthest = None
+        if farthest_index != UNREACHED:
+            farthest = (cast(Cell, grid.cell_at(*divmod(farthest_index, grid.columns))), farthest_distance)
+        grid.distances = ArrayDistances(root, grid, grid.int32_section(offset, grid.size), farthest)
+    return grid
+
+
+def _index_of(grid: Grid, cell: Cell) -> int:
+    return cell.row * grid.columns + cell.column
+
+
+def _write_rows(file: BinaryIO, rows: Iterable[bytes], columns: int) -> int:
+    file.seek(HEADER_SIZE)
+    rows_count = 0
+    for row_masks in rows:
+        if len(row_masks) != columns:
+            raise ValueError("Row {} has {} masks instead of {}".format(rows_count, len(row_masks), columns))
+        file.write(row_masks)
+        rows_count += 1
+    return rows_count
+
+
+def _align(file: BinaryIO) -> int:
+    offset = file.tell()
+    padding = -offset % SECTION_ALIGNMENT
+    file.write(b"\x00" * padding)
+    return offset + padding
+
+
+def _write_int32(file: BinaryIO, values: "array[int]") -> None:
+    if values.itemsize != 4:
+        raise ValueError("Maze files need 4 byte integers")
+    if sys.byteorder != "little":
+        values.byteswap()
+    file.write(values.tobytes())
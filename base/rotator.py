@@ -1,7 +1,7 @@
-from typing import TYPE_CHECKING, Tuple, Union
+from typing import TYPE_CHECKING, Union
 
 from base.grid import Grid
-from base.cell import Cell
+from base.grid_view import GridView
 
 if TYPE_CHECKING:
     from base.distance_grid import DistanceGrid     # noqa: F401
@@ -16,31 +16,12 @@ class Rotator:
 
     @staticmethod
     def on(grid: Union[Grid, "DistanceGrid", "ColoredGrid"]) -> Union[Grid, "DistanceGrid", "ColoredGrid"]:
-        grid_type = type(grid)
-
-        # row i becomes col n-i when rotating 90 degrees clockwise
-        rotated_grid = grid_type(rows=grid.columns, columns=grid.rows)
-
-        for old_cell in grid.each_cell():
-            row, column = Rotator._rotated_coordinates(old_cell, rotated_grid)
-            new_cell = rotated_grid.cell_at(row, column)
-            if new_cell is None:
-                raise IndexError("Cell not found at row {} column {}".format(row, column))
-            Rotator._rotate_cell_neighbors(new_cell, old_cell, rotated_grid)
-
-        return rotated_grid
-
-    @staticmethod
-    def _rotated_coordinates(cell: Cell, grid: Grid) -> Tuple[int, int]:
-        row = cell.column
-        column = (grid.columns - cell.row - 1)
-        return row, column
+        return Rotator.view(grid).materialize()
 
     @staticmethod
-    def _rotate_cell_neighbors(new_cell: Cell, old_cell: Cell, grid: Grid) -> None:
-        for link in old_cell.links:
-            row, column = Rotator._rotated_coordinates(link, grid)
-            neighbor = grid.cell_at(row, column)
-            if neighbor is None:
-                raise IndexError("Cell not found at row {} column {}".format(row, column))
-            new_cell.link(neighbor)
+    def view(grid: Grid, rotations: int = 1, reflected: bool = False) -> GridView:
+        """
+        O(1) alternative to on(): a view of the grid mirrored (if reflected) and then rotated the given times.
+        Views can be rendered directly, or materialized into a grid of the original type only once.
+        """
+        return GridView(grid, rotations, reflected)
@@ -0,0 +1,76 @@
+from array import array
+from typing import Mapping
+
+from base.cell import Cell
+from base.colored_grid import ColoredGrid
+from base.distance_grid import DistanceGrid
+from base.distances import ArrayDistances, Regions
+from base.frontier import weighted_distances_from
+
+
+DEFAULT_WEIGHT = 1
+
+
+class WeightedGrid(DistanceGrid):
+    """
+    Grid whose cells cost their weight to enter (think of mud or lava), so distances from a cell are the cheapest total
+    weight to reach every other one instead of the number of steps. All weights start at 1, where both are the same.
+    """
+
+    @property
+    def weights(self) -> memoryview:
+        """
+        Weight of every cell by cell id, read-only: set_weight keeps derived distances up to date
+        """
+        return memoryview(self._weights).toreadonly()
+
+    def __init__(self, rows: int, columns: int) -> None:
+        self._weights: "array[int]" = array("i", [DEFAULT_WEIGHT]) * (rows * columns)
+        super().__init__(rows, columns)
+
+    def weight_of(self, cell: Cell) -> int:
+        return self._weights[self._index(cell)]
+
+    def set_weight(self, cell: Cell, weight: int) -> None:
+        self.set_weights({cell: weight})
+
+    def set_weights(self, weights: Mapping[Cell, int]) -> None:
+        """
+        Sets the weight of many cells at once, calculating distances again only once. Nothing changes if any of them
+        is invalid
+        """
+        indices = [(self._index(cell), weight) for cell, weight in weights.items()]
+        if any(weight < 0 for _, weight in indices):
+            raise ValueError("Weights can't be negative")
+        for index, weight in indices:
+            self._weights[index] = weight
+        # cached distances depend on the weights as much as on the links
+        self._version += 1
+        self._refresh()
+
+    def distances_from(self, root: Cell) -> ArrayDistances:
+        return weighted_distances_from(self, root, self._weights)
+
+    def passage_changed(self, first: int, second: int, linked: bool) -> None:
+        """
+        Full distance fields are calculated again, as the in place updates of DistanceGrid count steps
+        """
+        if isinstance(self._distances, Regions):
+            # regions count steps, not weights
+            super().passage_changed(first, second, linked)
+        else:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        distances = self._distances
+        if isinstance(distances, ArrayDistances) and not isinstance(distances, Regions) and distances.grid is self:
+            self.distances = distances.root.distances
+
+    def _index(self, cell: Cell) -> int:
+        if cell not in self:
+            raise IndexError("Cell at row {} column {} is not part of the grid".format(cell.row, cell.column))
+        return cell.row * self.columns + cell.column
+
+
+class WeightedColoredGrid(WeightedGrid, ColoredGrid):
+    pass
@@ -4,6 +4,7 @@ from typing import List, Type
 from algorithms.base_algorithm import Algorithm
 from algorithms.aldous_broder import AldousBroder
 from algorithms.binary_tree import BinaryTree
+from algorithms.eller import Eller
 from algorithms.hunt_and_kill import HuntAndKill
 from algorithms.recursive_backtracker import RecursiveBacktracker
 from algorithms.sidewinder import Sidewinder
@@ -15,7 +16,8 @@ from exporters.unicode_exporter import UnicodeExporter
 from exporters.wolf3d_exporter import Wolf3DExporter
 
 
-ALGORITHMS: List[Type[Algorithm]] = [AldousBroder, BinaryTree, HuntAndKill, RecursiveBacktracker, Sidewinder, Wilson]
+ALGORITHMS: List[Type[Algorithm]] = [AldousBroder, BinaryTree, Eller, HuntAndKill, RecursiveBacktracker, Sidewinder,
+                                     Wilson]
 ALGORITHM_NAMES: List[str] = [x.__name__ for x in ALGORITHMS]
 # TODO: Add PixelExporter
 EXPORTERS: List[Type[Exporter]] = [Wolf3DExporter, PNGExporter, UnicodeExporter, ASCIIExporter]
@@ -5,7 +5,6 @@ from typing import cast
 from base.colored_grid import ColoredGrid
 from exporters.png_exporter import PNGExporter
 from exporters.wolf3d_exporter import Wolf3DExporter
-import pathfinders.dijkstra as Dijkstra
 import pathfinders.longest_path as LongestPath
 
 from demos.demo_utils import ALGORITHM_NAMES, get_algorithm, get_exporter
@@ -17,8 +16,7 @@ AVAILABLE_ALGORITHMS = ALGORITHM_NAMES
 
 
 def store_solution(grid: ColoredGrid) -> ColoredGrid:
-    start, end = LongestPath.calculate(grid)
-    Dijkstra.calculate_distances(grid, start, end)
+    LongestPath.calculate_distances(grid)
     return grid
 
 
@@ -5,7 +5,6 @@ from typing import cast
 from base.colored_grid import ColoredGrid
 from base.rotator import Rotator
 
-import pathfinders.dijkstra as Dijkstra
 import pathfinders.longest_path as LongestPath
 
 from demos.demo_utils import ALGORITHM_NAMES, str2bool, get_algorithm, get_exporter
@@ -45,14 +44,14 @@ if __name__ == "__main__":
 
     algorithm.on(grid)
 
-    for num in range(rotations):
-        grid = cast(ColoredGrid, Rotator().on(grid))
+    if rotations > 0:
+        # a view composes any number of rotations for free, then a single rebuild
+        grid = cast(ColoredGrid, Rotator.view(grid, rotations).materialize())
 
     # here pathfinding first, so if also colored we"ll see the route colored, else if colored will see all maze painted
     if pathfinding:
-        start, end = LongestPath.calculate(grid)
+        start, end = LongestPath.calculate_distances(grid)
         print("Solving maze from row {} column {} to row {} column {}".format(*start, *end))
-        Dijkstra.calculate_distances(grid, start, end)
     elif coloring:
         starting_position = (round(grid.rows / 2), round(grid.columns / 2))
         print("Drawing colored maze with start row {} column {}".format(*starting_position))
@@ -62,4 +61,4 @@ if __name__ == "__main__":
 
     exporter.render(grid, coloring=coloring, filename=filename)
 
-    print("Maze has {} dead-ends".format(len(grid.deadends)))
+    print("Maze has {} dead-ends".format(grid.deadend_count))
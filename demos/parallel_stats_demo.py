@@ -0,0 +1,51 @@
+import argparse
+import time
+
+from typing import List, Type
+
+from algorithms.base_algorithm import Algorithm
+from algorithms.parallel_tiles import DEFAULT_TILE_SIZE, ParallelTiles
+from base.compact_grid import CompactGrid
+from base.grid import Grid
+
+from demos.demo_utils import get_algorithm, ALGORITHM_NAMES, str2bool
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark carving a maze serially against ParallelTiles")
+    parser.add_argument("rows", type=int, help="number of rows")
+    parser.add_argument("columns", type=int, help="number of columns")
+    parser.add_argument("-a", "--algorithm", type=str, default="Wilson",
+                        help="maze generation algorithm ({})".format("|".join(ALGORITHM_NAMES)))
+    parser.add_argument("-t", "--tries", type=int, default=3, help="number of mazes carved each way")
+    parser.add_argument("-s", "--tile-size", type=int, default=DEFAULT_TILE_SIZE, help="side of the tiles")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of processes (default: one per CPU)")
+    parser.add_argument("-c", "--compact", type=str2bool, default=True,
+                        help="whether to carve a CompactGrid (or a Grid, whose cells are linked serially afterwards)")
+    args = parser.parse_args()
+
+    rows = args.rows
+    columns = args.columns
+    grid_class: Type[Grid] = CompactGrid if args.compact else Grid
+    algorithm = get_algorithm(args.algorithm, ALGORITHM_NAMES)
+    carvers: List[Algorithm] = [algorithm, ParallelTiles(algorithm, args.tile_size, args.workers)]
+
+    print("Rows: {}\ncolumns: {}\nGrid: {}\nAlgorithm: {}\nTile size: {}\nWorkers: {}\nTries: {}".format(
+        rows, columns, grid_class.__name__, args.algorithm, args.tile_size, args.workers or "one per CPU",
+        args.tries))
+    print("\nCarving wall time (seconds):")
+    averages = []
+    for carver in carvers:
+        timings: List[float] = []
+        for _ in range(args.tries):
+            grid = grid_class(rows, columns)
+            time_start = time.perf_counter()
+            carver.on(grid)
+            time_end = time.perf_counter()
+            timings.append(time_end - time_start)
+        timings = sorted(timings)
+        averages.append(sum(timings) / len(timings))
+        print(" {:>30}: avg: {:03.6f} min: {:03.6f} max: {:03.6f}".format(
+            carver.name, averages[-1], timings[0], timings[-1]))
+
+    print("\nSpeedup: {:.2f}x".format(averages[0] / averages[1]))
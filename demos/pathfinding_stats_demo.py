@@ -0,0 +1,78 @@
+import argparse
+from random import randrange
+import time
+
+from typing import Callable, Dict, List, Tuple
+
+from base.distance_grid import DistanceGrid
+from base.distances import Path
+
+import pathfinders.astar as AStar
+import pathfinders.dijkstra as Dijkstra
+
+from demos.demo_utils import ALGORITHMS, get_algorithm, ALGORITHM_NAMES
+
+
+Point = Tuple[int, int]
+
+
+def flood(grid: DistanceGrid, start: Point, end: Point) -> Path:
+    start_cell = grid[start]
+    end_cell = grid[end]
+    assert start_cell is not None and end_cell is not None
+    return start_cell.distances.path_to(end_cell)    # type: ignore
+
+
+PATHFINDERS: Dict[str, Callable[[DistanceGrid, Point, Point], Path]] = {
+    "Flood": flood,
+    "Dijkstra": Dijkstra.calculate_path,
+    "AStar": AStar.calculate_path,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the pathfinders solving the same mazes")
+    parser.add_argument("rows", type=int, help="number of rows")
+    parser.add_argument("columns", type=int, help="number of columns")
+    parser.add_argument("-a", "--algorithm", type=str, default=ALGORITHMS[0].__name__,
+                        help="maze generation algorithm ({})".format("|".join(ALGORITHM_NAMES)))
+    parser.add_argument("-t", "--tries", type=int, default=10, help="number of point pairs to solve")
+    parser.add_argument("-d", "--distance", type=int, default=0,
+                        help="max rows and columns between the points of each pair, 0 for anywhere")
+    args = parser.parse_args()
+
+    rows = args.rows
+    columns = args.columns
+    grid = DistanceGrid(rows, columns)
+    get_algorithm(args.algorithm, ALGORITHM_NAMES).on(grid)
+
+    pairs: List[Tuple[Point, Point]] = []
+    for _ in range(args.tries):
+        start = (randrange(rows), randrange(columns))
+        if args.distance > 0:
+            end = (min(max(start[0] + randrange(-args.distance, args.distance + 1), 0), rows - 1),
+                   min(max(start[1] + randrange(-args.distance, args.distance + 1), 0), columns - 1))
+        else:
+            end = (randrange(rows), randrange(columns))
+        pairs.append((start, end))
+
+    print("Rows: {}\ncolumns: {}\nAlgorithm: {}\nPoint pairs: {}".format(rows, columns, args.algorithm, args.tries))
+    lengths: Dict[str, List[int]] = {}
+    print("\nPathfinding speed benchmark (seconds, sorted by average desc):")
+    benchmarks = []
+    for name, pathfinder in PATHFINDERS.items():
+        timings = []
+        lengths[name] = []
+        for start, end in pairs:
+            time_start = time.perf_counter()
+            path = pathfinder(grid, start, end)
+            time_end = time.perf_counter()
+            timings.append(time_end - time_start)
+            lengths[name].append(len(path))
+        timings = sorted(timings)
+        benchmarks.append((name, sum(timings) / len(timings), timings[0], timings[-1]))
+
+    for name, average, minimum, maximum in sorted(benchmarks, key=lambda benchmark: -benchmark[1]):
+        print(" {:>10}: avg: {:03.6f} min: {:03.6f} max: {:03.6f}".format(name, average, minimum, maximum))
+    if len({tuple(path_lengths) for path_lengths in lengths.values()}) != 1:
+        print("\nWarning: pathfinders found paths of different lengths")
@@ -7,7 +7,6 @@ from algorithms.base_algorithm import Algorithm
 from base.grid import Grid
 from base.distance_grid import DistanceGrid
 
-import pathfinders.dijkstra as Dijkstra
 import pathfinders.longest_path as LongestPath
 
 from demos.demo_utils import ALGORITHMS, str2bool
@@ -49,13 +48,12 @@ if __name__ == "__main__":
             algorithm().on(grid)
             time_end = time.perf_counter()
 
-            deadend_counts.append(len(grid.deadends))
+            deadend_counts.append(grid.deadend_count)
             timings.append(time_end - time_start)
 
             if pathfinding:
                 time_start = time.perf_counter()
-                start, end = LongestPath.calculate(cast(DistanceGrid, grid))
-                Dijkstra.calculate_distances(cast(DistanceGrid, grid), start, end)
+                LongestPath.calculate_distances(cast(DistanceGrid, grid))
                 time_end = time.perf_counter()
                 pathfinding_timings.append(time_end - time_start)
 
@@ -0,0 +1,32 @@
+import argparse
+
+from algorithms.eller import Eller
+from base.mapped_grid import save_rows
+
+from demos.demo_utils import get_exporter
+
+
+DEFAULT_EXPORTER = "UnicodeExporter"
+AVAILABLE_EXPORTERS = ["ASCIIExporter", "UnicodeExporter", "PNGExporter", "Wolf3DExporter"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream a maze row by row with Eller's algorithm")
+    parser.add_argument("rows", type=int, help="number of rows")
+    parser.add_argument("columns", type=int, help="number of columns")
+    parser.add_argument("-e", "--exporter", type=str, default=DEFAULT_EXPORTER, help="maze exporter to use")
+    parser.add_argument("-f", "--filename", type=str, default=None,
+                        help="file name to use (PNGExporter, Wolf3DExporter)")
+    parser.add_argument("-m", "--maze-file", type=str, default=None,
+                        help="write a maze file (see Grid.load()) to this path instead of exporting")
+    args = parser.parse_args()
+
+    rows = Eller().rows(args.columns, args.rows)
+    if args.maze_file is not None:
+        print("Rows written: {}".format(save_rows(rows, args.columns, args.maze_file)))
+    else:
+        exporter = get_exporter(args.exporter, AVAILABLE_EXPORTERS)
+        if args.filename:
+            exporter.render_rows(rows, args.columns, filename=args.filename)
+        else:
+            exporter.render_rows(rows, args.columns)
@@ -4,7 +4,6 @@ from typing import cast
 from base.distance_grid import DistanceGrid
 from base.rotator import Rotator
 
-import pathfinders.dijkstra as Dijkstra
 import pathfinders.longest_path as LongestPath
 
 from demos.demo_utils import ALGORITHM_NAMES, str2bool, get_algorithm, get_exporter
@@ -38,14 +37,14 @@ if __name__ == "__main__":
     grid = DistanceGrid(rows, columns)
     algorithm.on(grid)
 
-    for num in range(rotations):
-        grid = cast(DistanceGrid, Rotator().on(grid))
+    if rotations > 0:
+        # a view composes any number of rotations for free, then a single rebuild
+        grid = cast(DistanceGrid, Rotator.view(grid, rotations).materialize())
 
     if pathfinding:
-        start, end = LongestPath.calculate(grid)
+        start, end = LongestPath.calculate_distances(grid)
         print("Solving maze from row {} column {} to row {} column {}".format(*start, *end))
-        Dijkstra.calculate_distances(grid, start, end)
 
     exporter.render(grid)
 
-    print("Maze has {} dead-ends".format(len(grid.deadends)))
+    print("Maze has {} dead-ends".format(grid.deadend_count))
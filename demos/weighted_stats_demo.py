@@ -0,0 +1,64 @@
+import argparse
+from random import randrange
+import time
+
+from typing import Callable, Dict, List
+
+from base.frontier import breadth_first, cheapest_first
+from base.weighted_grid import WeightedGrid
+
+from demos.demo_utils import ALGORITHMS, get_algorithm, ALGORITHM_NAMES
+
+
+def flood(grid: WeightedGrid, start: int) -> None:
+    breadth_first(grid.link_masks(), grid.columns, start)
+
+
+def bucket_queue(grid: WeightedGrid, start: int) -> None:
+    cheapest_first(grid.link_masks(), grid.weights, grid.columns, start, bucketed=True)
+
+
+def heap_queue(grid: WeightedGrid, start: int) -> None:
+    cheapest_first(grid.link_masks(), grid.weights, grid.columns, start, bucketed=False)
+
+
+SEARCHES: Dict[str, Callable[[WeightedGrid, int], None]] = {
+    "BFS": flood,
+    "Buckets": bucket_queue,
+    "Heap": heap_queue,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark weighted distances against plain BFS on the same mazes")
+    parser.add_argument("rows", type=int, help="number of rows")
+    parser.add_argument("columns", type=int, help="number of columns")
+    parser.add_argument("-a", "--algorithm", type=str, default=ALGORITHMS[0].__name__,
+                        help="maze generation algorithm ({})".format("|".join(ALGORITHM_NAMES)))
+    parser.add_argument("-t", "--tries", type=int, default=10, help="number of start cells to flood from")
+    parser.add_argument("-w", "--weight", type=int, default=9, help="max random weight of each cell")
+    args = parser.parse_args()
+
+    rows = args.rows
+    columns = args.columns
+    grid = WeightedGrid(rows, columns)
+    get_algorithm(args.algorithm, ALGORITHM_NAMES).on(grid)
+    grid.set_weights({cell: randrange(1, args.weight + 1) for cell in grid.each_cell()})
+    starts = [randrange(grid.size) for _ in range(args.tries)]
+
+    print("Rows: {}\ncolumns: {}\nAlgorithm: {}\nMax weight: {}\nStart cells: {}".format(
+        rows, columns, args.algorithm, args.weight, args.tries))
+    print("\nWhole grid distances speed benchmark (seconds, sorted by average desc):")
+    benchmarks = []
+    for name, search in SEARCHES.items():
+        timings: List[float] = []
+        for start in starts:
+            time_start = time.perf_counter()
+            search(grid, start)
+            time_end = time.perf_counter()
+            timings.append(time_end - time_start)
+        timings = sorted(timings)
+        benchmarks.append((name, sum(timings) / len(timings), timings[0], timings[-1]))
+
+    for name, average, minimum, maximum in sorted(benchmarks, key=lambda benchmark: -benchmark[1]):
+        print(" {:>10}: avg: {:03.6f} min: {:03.6f} max: {:03.6f}".format(name, average, minimum, maximum))
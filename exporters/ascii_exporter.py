@@ -1,9 +1,13 @@
-from typing import Any
+from typing import Any, Iterable, Sequence
 
 from exporters.base_exporter import Exporter
+from base.directions import EAST, SOUTH
 from base.grid import Grid
 
 
+EMPTY_BODY = "   "
+
+
 class ASCIIExporter(Exporter):
     """
     Renders to stdout an ASCII representation of the maze.
@@ -12,20 +16,31 @@ class ASCIIExporter(Exporter):
     """
 
     def render(self, grid: Grid, **kwargs: Any) -> None:
-        output = "+" + "---+" * grid.columns + "\n"
-
-        for row in grid.each_row():
-            top = "|"
-            bottom = "+"
-            for cell in row:
-                # NOTE: Book here creates dummy (-1,-1) cell. Not doing it until needed
-                body = grid.contents_of(cell)
-                east_boundary = " " if cell.linked_to(cell.east) else "|"
-                top += body + east_boundary
-                south_boundary = "   " if cell.linked_to(cell.south) else "---"
-                corner = "+"
-                bottom += south_boundary + corner
-            output += top + "\n"
-            output += bottom + "\n"
+        output = self._top_line(grid.columns) + "\n"
+
+        for row_masks, row in zip(grid.each_row_masks(), grid.each_row()):
+            # NOTE: Book here creates dummy (-1,-1) cell. Not doing it until needed
+            output += self._row_lines(row_masks, [grid.contents_of(cell) for cell in row]) + "\n"
 
         print(output)
+
+    def render_rows(self, rows: Iterable[bytes], columns: int, **kwargs: Any) -> None:
+        print(self._top_line(columns))
+        for row_masks in rows:
+            print(self._row_lines(row_masks, [EMPTY_BODY] * columns))
+
+    @staticmethod
+    def _top_line(columns: int) -> str:
+        return "+" + "---+" * columns
+
+    @staticmethod
+    def _row_lines(row_masks: bytes, bodies: Sequence[str]) -> str:
+        top = "|"
+        bottom = "+"
+        for mask, body in zip(row_masks, bodies):
+            east_boundary = " " if mask & EAST else "|"
+            top += body + east_boundary
+            south_boundary = "   " if mask & SOUTH else "---"
+            corner = "+"
+            bottom += south_boundary + corner
+        return top + "\n" + bottom
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Any
+from typing import Any, Iterable
 
 from base.grid import Grid
 
@@ -10,6 +10,13 @@ class Exporter(metaclass=ABCMeta):
     def render(self, grid: Grid, ** kwargs: Any) -> None:
         """Base """
 
+    @abstractmethod
+    def render_rows(self, rows: Iterable[bytes], columns: int, **kwargs: Any) -> None:
+        """
+        Renders a maze given as a stream of rows of link bitmasks (see Grid.each_row_masks() or Eller.rows()),
+        consuming them as they come so the whole maze is never held in memory
+        """
+
     @property
     def name(self) -> str:
         return self.__class__.__name__
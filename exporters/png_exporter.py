@@ -1,16 +1,25 @@
+import struct
+import zlib
 from time import gmtime, strftime
-from typing import Any, cast, Tuple
+from typing import Any, BinaryIO, cast, Iterable, Tuple
 
 from PIL import Image, ImageDraw
 from PIL.Image import Image as ImageType
 
 from exporters.base_exporter import Exporter
 from base.colored_grid import ColoredGrid
+from base.directions import EAST, NORTH
 from base.grid import Grid
 
 
 STEP_BACKGROUND = 0
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# compressed image data is written in chunks of about this size
+IDAT_SIZE = 1 << 16
+WALL = 0
+FLOOR = 255
+
 
 class PNGExporter(Exporter):
 
@@ -23,6 +32,75 @@ class PNGExporter(Exporter):
         image.save(output_filename, "PNG", optimize=True)
         print("Filename: {}".format(output_filename))
 
+    def render_rows(self, rows: Iterable[bytes], columns: int, **kwargs: Any) -> None:
+        """
+        Streams a grayscale PNG, compressing the pixel lines of each row as it comes. Rows are counted on the way, so
+        the image height in the header is filled in at the end
+        """
+        filename, cell_size, _ = self._process_kwargs(**kwargs)
+        output_filename = "{}.png".format(filename)
+        with open(output_filename, "wb") as file:
+            self._write_rows(file, rows, columns, cell_size)
+        print("Filename: {}".format(output_filename))
+
+    @staticmethod
+    def _write_rows(file: BinaryIO, rows: Iterable[bytes], columns: int, cell_size: int) -> None:
+        width = cell_size * columns + 1
+        file.write(PNG_SIGNATURE)
+        header_position = file.tell()
+        PNGExporter._write_chunk(file, b"IHDR", PNGExporter._header(width, 0))
+
+        compressor = zlib.compressobj()
+        pending = bytearray()
+
+        def add_line(line: bytearray) -> None:
+            # every line starts with its filter type, none
+            pending.extend(compressor.compress(b"\x00" + line))
+            if len(pending) >= IDAT_SIZE:
+                PNGExporter._write_chunk(file, b"IDAT", bytes(pending))
+                pending.clear()
+
+        height = 1
+        previous_walls = b""
+        for row_masks in rows:
+            # vertical walls run along the west side of each column, plus the east side of the last one
+            walls = bytes([1]) + bytes(not mask & EAST for mask in row_masks[:-1]) + bytes([1])
+            line = bytearray([FLOOR]) * width
+            for column, mask in enumerate(row_masks):
+                if not mask & NORTH:
+                    line[column * cell_size:(column + 1) * cell_size + 1] = bytes([WALL]) * (cell_size + 1)
+            body = bytearray([FLOOR]) * width
+            for column, wall in enumerate(walls):
+                if wall:
+                    body[column * cell_size] = WALL
+                    line[column * cell_size] = WALL
+                elif previous_walls and previous_walls[column]:
+                    # corner where the wall of the row above ends
+                    line[column * cell_size] = WALL
+            add_line(line)
+            for _ in range(cell_size - 1):
+                add_line(body)
+            height += cell_size
+            previous_walls = walls
+        add_line(bytearray([WALL]) * width)
+
+        pending.extend(compressor.flush())
+        PNGExporter._write_chunk(file, b"IDAT", bytes(pending))
+        PNGExporter._write_chunk(file, b"IEND", b"")
+        file.seek(header_position)
+        PNGExporter._write_chunk(file, b"IHDR", PNGExporter._header(width, height))
+        file.seek(0, 2)
+
+    @staticmethod
+    def _header(width: int, height: int) -> bytes:
+        # 8 bit grayscale, no interlacing
+        return struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+
+    @staticmethod
+    def _write_chunk(file: BinaryIO, kind: bytes, data: bytes) -> None:
+        file.write(struct.pack(">I", len(data)) + kind + data)
+        file.write(struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff))
+
     @staticmethod
     def _render(grid: Grid, cell_size: int = 4, coloring: bool = False) -> ImageType:
         wall_color = (0, 0, 0)
@@ -1,14 +1,20 @@
-from typing import Any, cast
+from typing import Any, Generator, Iterable, Iterator, Optional, Sequence, Tuple
 
 from exporters.base_exporter import Exporter
-from base.cell import Cell
+from base import directions
 from base.grid import Grid
 
 
+Row = Tuple[bytes, Sequence[str]]
+
+EMPTY_BODY = "   "
+
+
 class UnicodeExporter(Exporter):
     """
     Renders to stdout a UNICODE representation of the maze.
     Not present in the book but suggested as exercise. And looks better than ASCII mazes :)
+    Works on the link bitmasks of each row, looking one row ahead, so it can render a stream of rows too.
     """
 
     #  if not linked/closed, add that side's value to find position at array:
@@ -22,31 +28,54 @@ class UnicodeExporter(Exporter):
     EAST = 4
     SOUTH = 8
 
+    HORIZONTAL_WALL = "\u2501"
+    VERTICAL_WALL = "\u2503"
+
     def render(self, grid: Grid, **kwargs: Any) -> None:
-        horizontal_wall = "\u2501"
-        vertical_wall = "\u2503"
+        rows = ((row_masks, [grid.contents_of(cell) for cell in row])
+                for row_masks, row in zip(grid.each_row_masks(), grid.each_row()))
+        output = ""
+        for line in self._lines(rows, grid.columns):
+            output += line + "\n"
+
+        print(output)
+
+    def render_rows(self, rows: Iterable[bytes], columns: int, **kwargs: Any) -> None:
+        for line in self._lines(((row_masks, [EMPTY_BODY] * columns) for row_masks in rows), columns):
+            print(line)
+
+    def _lines(self, rows: Iterable[Row], columns: int) -> Generator[str, None, None]:
+        """
+        Lines of the maze, the top wall first and then two per row. Rows are only read one ahead of the one drawn
+        """
+        remaining: Iterator[Row] = iter(rows)
+        current: Optional[Row] = next(remaining, None)
+        if current is None:
+            return
 
         output = self.JUNCTIONS[12]
-        for x in range(grid.columns - 1):
-            output += (horizontal_wall * 3 + self.get_topmost_junction(cast(Cell, grid.cell_at(row=0, column=x))))
-        output += horizontal_wall * 3 + self.JUNCTIONS[10] + "\n"
-
-        for row in grid.each_row():
-            top = vertical_wall
-            bottom = self.get_leftmost_junction(row[0])
-            for cell in row:
-                body = grid.contents_of(cell)
-                east_boundary = " " if cell.linked_to(cell.east) else vertical_wall
+        for column in range(columns - 1):
+            output += self.HORIZONTAL_WALL * 3 + self.get_topmost_junction(current[0][column])
+        yield output + self.HORIZONTAL_WALL * 3 + self.JUNCTIONS[10]
+
+        while current is not None:
+            row_masks, bodies = current
+            following = next(remaining, None)
+            below = following[0] if following is not None else None
+
+            top = self.VERTICAL_WALL
+            bottom = self.get_leftmost_junction(row_masks[0], below is not None)
+            for column, (mask, body) in enumerate(zip(row_masks, bodies)):
+                east_boundary = " " if mask & directions.EAST else self.VERTICAL_WALL
                 top += body + east_boundary
-                south_boundary = "   " if cell.linked_to(cell.south) else horizontal_wall * 3
-                bottom += south_boundary + self.get_south_east_junction(cell)
-            output += top + "\n"
-            output += bottom + "\n"
-
-        print(output)
+                south_boundary = "   " if mask & directions.SOUTH else self.HORIZONTAL_WALL * 3
+                bottom += south_boundary + self.get_south_east_junction(row_masks, below, column)
+            yield top
+            yield bottom
+            current = following
 
     @staticmethod
-    def get_leftmost_junction(cell: Cell) -> str:
+    def get_leftmost_junction(mask: int, has_south: bool) -> str:
         #
         #    [ X ]
         #
@@ -54,9 +83,9 @@ class UnicodeExporter(Exporter):
         #
         junction = UnicodeExporter.NORTH
 
-        if cell.south:
+        if has_south:
             junction += UnicodeExporter.SOUTH
-            if not cell.linked_to(cell.south):
+            if not mask & directions.SOUTH:
                 junction += UnicodeExporter.EAST
         else:
             junction += UnicodeExporter.EAST
@@ -64,20 +93,20 @@ class UnicodeExporter(Exporter):
         return UnicodeExporter.JUNCTIONS[junction]
 
     @staticmethod
-    def get_topmost_junction(cell: Cell) -> str:
+    def get_topmost_junction(mask: int) -> str:
         # special case for 1st row's junctions
         #
         #    [ X ]      [X-east]
         #
         junction = UnicodeExporter.EAST + UnicodeExporter.WEST
 
-        if not cell.linked_to(cast(Cell, cell.east)):
+        if not mask & directions.EAST:
             junction += UnicodeExporter.SOUTH
 
         return UnicodeExporter.JUNCTIONS[junction]
 
     @staticmethod
-    def get_south_east_junction(cell: Cell) -> str:
+    def get_south_east_junction(row_masks: bytes, below: Optional[bytes], column: int) -> str:
         # Taking advantage that we always go forward east and south, just need to calculate available posibilities
         #
         #    [ X ]      [X-east]
@@ -85,28 +114,29 @@ class UnicodeExporter(Exporter):
         #  [ X-south] [X-southeast]
         #
         junction = 0
+        mask = row_masks[column]
+        has_east = column + 1 < len(row_masks)
 
-        if cell.east:
-            if not cell.linked_to(cell.east):
+        if has_east:
+            if not mask & directions.EAST:
                 junction += UnicodeExporter.NORTH
-            if not cell.east.south:
+            if below is None:
                 junction += UnicodeExporter.EAST
         else:
             junction += UnicodeExporter.NORTH
 
-        if cell.south:
-            if not cell.linked_to(cell.south):
+        if below is not None:
+            if not mask & directions.SOUTH:
                 junction += UnicodeExporter.WEST
-            if not cell.south.east:
+            if not has_east:
                 junction += UnicodeExporter.SOUTH
         else:
             junction += UnicodeExporter.WEST
 
-        if cell.east and cell.south:
-            south_east_cell = cast(Cell, cell.south.east)
-            if not cell.east.linked_to(south_east_cell):
+        if has_east and below is not None:
+            if not row_masks[column + 1] & directions.SOUTH:
                 junction += UnicodeExporter.EAST
-            if not cell.south.linked_to(south_east_cell):
+            if not below[column] & directions.EAST:
                 junction += UnicodeExporter.SOUTH
         try:
             return UnicodeExporter.JUNCTIONS[junction]
@@ -1,12 +1,13 @@
+from itertools import islice
 from time import gmtime, strftime
 
-from typing import Any, cast, List, Optional, Union
+from typing import Any, cast, Iterable, List, Optional, Union
 
 from base.cell import Cell
 from base.grid import Grid
 from base.colored_grid import ColoredGrid
+from base.compact_grid import CompactColoredGrid
 from exporters.base_exporter import Exporter
-import pathfinders.dijkstra as Dijkstra
 import pathfinders.longest_path as LongestPath
 
 
@@ -105,6 +106,20 @@ class Wolf3DExporter(Exporter):
 
         self._write_data(filename, walls, objects)
 
+    def render_rows(self, rows: Iterable[bytes], columns: int, **kwargs: Any) -> None:
+        """
+        Maps are small enough (and need the whole maze to place the exit) to be rendered from a grid of the rows
+        """
+        if columns > self.MAP_MAX_COLUMNS:
+            raise ValueError("Wolfenstein3D NMap only allows maps with {} columns maximum".format(self.MAP_MAX_COLUMNS))
+        # one more row than allowed is read, to tell apart streams that are too long (even endless ones)
+        masks = bytearray()
+        for row_masks in islice(rows, self.MAP_MAX_ROWS + 1):
+            masks += row_masks
+        if len(masks) > self.MAP_MAX_ROWS * columns:
+            raise ValueError("Wolfenstein3D NMap only allows maps with {} rows maximum".format(self.MAP_MAX_ROWS))
+        self.render(CompactColoredGrid(len(masks) // columns, columns, masks=masks), **kwargs)
+
     @staticmethod
     def is_valid(grid: ColoredGrid) -> bool:
         """
@@ -120,15 +135,18 @@ class Wolf3DExporter(Exporter):
 
     @staticmethod
     def _expand(grid: ColoredGrid, rows: int, columns: int) -> ColoredGrid:
+        # links are copied into cells of the new grid, as cells of some grids (e.g. compact ones) can't be moved
         new_grid = ColoredGrid(rows, columns)
         for cell in grid.each_cell():
-            new_grid.set_cell_at(cell.row, cell.column, cell)
+            new_cell = cast(Cell, new_grid.cell_at(cell.row, cell.column))
+            for neighbor in (cell.east, cell.south):
+                if neighbor is not None and cell.linked_to(neighbor):
+                    new_cell += cast(Cell, new_grid.cell_at(neighbor.row, neighbor.column))
         return new_grid
 
     @staticmethod
     def _store_solution(grid: ColoredGrid) -> ColoredGrid:
-        start, end = LongestPath.calculate(grid)
-        Dijkstra.calculate_distances(grid, start, end)
+        LongestPath.calculate_distances(grid)
         return grid
 
     @staticmethod
@@ -156,7 +174,7 @@ class Wolf3DExporter(Exporter):
             return None
 
     def _wall_for(self, cell: Cell, grid: ColoredGrid) -> List[int]:
-        wall = [self.WALL_EMPTY_CELL, self.HEX_FILL] if len(cell.links) > 0 else [self.WALL_STONE, self.HEX_FILL]
+        wall = [self.WALL_EMPTY_CELL, self.HEX_FILL] if cell.link_count > 0 else [self.WALL_STONE, self.HEX_FILL]
         distance = self._cell_distance(cell, grid)
         if distance is not None and distance == grid.maximum:
             return [self.WALL_ELEVATOR_EXIT_EW, self.HEX_FILL]
@@ -186,7 +204,7 @@ class Wolf3DExporter(Exporter):
             return self._cell_contents(cell)
 
     def _cell_contents(self, cell: Cell) -> List[int]:
-        if len(cell.links) == 1 and self.enemies_count < self.MAX_ENEMIES:
+        if cell.link_count == 1 and self.enemies_count < self.MAX_ENEMIES:
             # dead-end
             self._enemies_count += 1
             linked_neighbor = cell.links[0]
@@ -0,0 +1,77 @@
+from array import array
+from heapq import heappop, heappush
+from typing import List, Tuple
+
+from base.directions import OFFSETS, OPPOSITE
+from base.distance_grid import DistanceGrid
+from base.distances import ArrayDistances, Path, UNREACHED
+from base.grid import Grid
+
+
+Point = Tuple[int, int]
+# (estimated total distance, estimated remaining distance, cell id)
+Entry = Tuple[int, int, int]
+
+
+def calculate_distances(grid: DistanceGrid, start: Point, end: Point) -> None:
+    """
+    Calculate the path from start to end using A*, keeping it in the grid distances like pathfinders.dijkstra does
+    """
+    grid.distances = calculate_path(grid, start, end)
+
+
+def calculate_path(grid: Grid, start: Point, end: Point) -> Path:
+    """
+    Shortest path between two cells, expanding first the cells that look closer to the end by Manhattan distance.
+    Being 4-connected with unit steps, the heuristic never overestimates, so the path is a shortest one.
+    """
+    start_cell = grid[start]
+    end_cell = grid[end]
+    if start_cell is None:
+        raise IndexError("Invalid start cell {} column {}".format(*start))
+    if end_cell is None:
+        raise IndexError("Invalid destination cell row {} column {}".format(*end))
+
+    columns = grid.columns
+    end_row, end_column = end
+    start_index = start[0] * columns + start[1]
+    end_index = end_row * columns + end_column
+    steps = [(direction, row_offset, column_offset, row_offset * columns + column_offset, OPPOSITE[direction])
+             for direction, (row_offset, column_offset) in OFFSETS.items()]
+
+    # bookkeeping by cell id: distance from start, and direction towards the cell each one was reached from
+    costs = array("i", [UNREACHED]) * grid.size
+    parents = bytearray(grid.size)
+    costs[start_index] = 0
+    heuristic = manhattan(start, end)
+    # ties go to the cell closer to the end, which avoids expanding whole equally promising areas
+    heap: List[Entry] = [(heuristic, heuristic, start_index)]
+
+    while heap:
+        estimate, heuristic, index = heappop(heap)
+        if index == end_index:
+            break
+        cost = costs[index]
+        if estimate - heuristic > cost:
+            # a shorter way to this cell was found after queuing this entry
+            continue
+
+        row, column = divmod(index, columns)
+        mask = grid.mask_at(row, column)
+        for direction, row_offset, column_offset, offset, back in steps:
+            if mask & direction:
+                neighbor = index + offset
+                known_cost = costs[neighbor]
+                if known_cost == UNREACHED or cost + 1 < known_cost:
+                    costs[neighbor] = cost + 1
+                    parents[neighbor] = back
+                    heuristic = abs(end_row - row - row_offset) + abs(end_column - column - column_offset)
+                    heappush(heap, (cost + 1 + heuristic, heuristic, neighbor))
+    else:
+        raise ValueError("Destination is not reachable from start")
+
+    return ArrayDistances(start_cell, grid, costs, parents=parents).path_to(end_cell)
+
+
+def manhattan(origin: Point, destination: Point) -> int:
+    return abs(destination[0] - origin[0]) + abs(destination[1] - origin[1])
@@ -1,18 +1,103 @@
-from typing import Tuple
+from typing import Dict, List, Tuple
 
+from base.directions import OFFSETS
 from base.distance_grid import DistanceGrid
+from base.distances import Path
+from base.grid import Grid
+from base.weighted_grid import WeightedGrid
 
 
 Point = Tuple[int, int]
+# cell id -> (cell id it was reached from, distance)
+Reached = Dict[int, Tuple[int, int]]
+
+# parent of the cell each search starts from
+ORIGIN = -1
+NO_MEETING = -1
 
 
 def calculate_distances(grid: DistanceGrid, start: Point, end: Point) -> None:
     """
-    Calculate the distances in the grid using Dijkstra's algorithm
+    Calculate the distances in the grid using Dijkstra's algorithm, keeping the path from start to end as a
+    base.distances.Path
+    """
+    grid.distances = calculate_path(grid, start, end)
+
+
+def calculate_path(grid: Grid, start: Point, end: Point) -> Path:
     """
-    if grid[start] is None:
+    Shortest path between two cells, searching from both of them at once until the searches meet, so the cost depends
+    on the region between the cells instead of the whole maze. On a WeightedGrid it is the cheapest path instead,
+    out of the (cached) weighted distances from start
+    """
+    start_cell = grid[start]
+    end_cell = grid[end]
+    if start_cell is None:
         raise IndexError("Invalid start cell {} column {}".format(*start))
-    if grid[end] is None:
+    if end_cell is None:
         raise IndexError("Invalid destination cell row {} column {}".format(*end))
+    if isinstance(grid, WeightedGrid):
+        return grid.distance_cache.distances_from(start_cell).path_to(end_cell)
+
+    columns = grid.columns
+    start_index = start[0] * columns + start[1]
+    end_index = end[0] * columns + end[1]
+    forward: Reached = {start_index: (ORIGIN, 0)}
+    backward: Reached = {end_index: (ORIGIN, 0)}
+    forward_frontier = [start_index]
+    backward_frontier = [end_index]
+    # perfect mazes have a single path between any two cells, so the first meeting is the one
+    first_meeting = grid.passage_count == grid.size - 1
+
+    meeting = start_index if start_index == end_index else NO_MEETING
+    while meeting == NO_MEETING and forward_frontier and backward_frontier:
+        # grow the smaller frontier, keeping both searches balanced
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = _expand(grid, forward, forward_frontier, backward, first_meeting)
+        else:
+            backward_frontier, meeting = _expand(grid, backward, backward_frontier, forward, first_meeting)
+    if meeting == NO_MEETING:
+        raise ValueError("Destination is not reachable from start")
+
+    indices = _walk_back(forward, meeting)
+    indices.reverse()
+    indices.extend(_walk_back(backward, backward[meeting][0]))
+    return Path(grid, indices)
+
+
+def _expand(grid: Grid, reached: Reached, frontier: List[int], other: Reached,
+            first_meeting: bool) -> Tuple[List[int], int]:
+    """
+    Expands a whole frontier one step, returning the new frontier and the cell where it met the other search with the
+    shortest total distance, if any
+    """
+    columns = grid.columns
+    steps = [(direction, row_offset * columns + column_offset)
+             for direction, (row_offset, column_offset) in OFFSETS.items()]
+    new_frontier = []
+    meeting = NO_MEETING
+    shortest = 0
+    for index in frontier:
+        mask = grid.mask_at(*divmod(index, columns))
+        distance = reached[index][1] + 1
+        for direction, offset in steps:
+            if mask & direction:
+                neighbor = index + offset
+                if neighbor not in reached:
+                    reached[neighbor] = (index, distance)
+                    new_frontier.append(neighbor)
+                    if neighbor in other:
+                        total = distance + other[neighbor][1]
+                        if meeting == NO_MEETING or total < shortest:
+                            meeting, shortest = neighbor, total
+                        if first_meeting:
+                            return new_frontier, meeting
+    return new_frontier, meeting
+
 
-    grid.distances = grid[start].distances.path_to(grid[end])  # type: ignore
+def _walk_back(reached: Reached, index: int) -> List[int]:
+    indices = []
+    while index != ORIGIN:
+        indices.append(index)
+        index = reached[index][0]
+    return indices
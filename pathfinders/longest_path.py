@@ -1,21 +1,127 @@
-from typing import Tuple
+from array import array
+from typing import List, Optional, Tuple
 
+from base.directions import EAST, NORTH, SOUTH, WEST
 from base.distance_grid import DistanceGrid
+from base.distances import ArrayDistances, Path
+from base.frontier import breadth_first
+from base.grid import Grid, MaskBuffer
 
 
 Point = Tuple[int, int]
 
+UNVISITED = -1
 
-def calculate(grid: DistanceGrid) -> Tuple[Point, Point]:
+
+def calculate(grid: Grid) -> Tuple[Point, Point]:
+    """
+    Calculates the endpoints of a longest path inside a maze
+    """
+    return _endpoints(calculate_path(grid))
+
+
+def calculate_distances(grid: DistanceGrid) -> Tuple[Point, Point]:
     """
-    Calculates a longest path inside a maze, by calculating the longest past from nortwest corner,
-    then using that point as the actual start and calculating its most distant cell.
+    Keeps a longest path inside the maze as the grid distances, returning its endpoints
+    """
+    path = calculate_path(grid)
+    grid.distances = path
+    return _endpoints(path)
+
+
+def calculate_path(grid: Grid) -> Path:
+    """
+    Calculates a longest path inside a maze, the one containing the northwest corner.
+    Perfect mazes are trees, so it's their diameter, found in a single depth-first pass. Otherwise it is approximated
+    by calculating the most distant cell from the northwest corner, then using that cell as the actual start and
+    calculating its most distant cell.
     """
     start_cell = grid[0, 0]
     if start_cell is None:
         raise IndexError("Invalid start cell row {} column {}".format(0, 0))
 
-    new_start_cell, distance = start_cell.distances.max
-    goal_cell, distance = new_start_cell.distances.max
+    masks = grid.link_masks()
+    if grid.passage_count == grid.size - 1:
+        indices = tree_diameter(masks, grid.columns, 0)
+        if indices is not None:
+            return Path(grid, indices)
+
+    # both sweeps flood the same link bitmasks, fetched only once
+    _, _, (new_start, _) = breadth_first(masks, grid.columns, 0)
+    values, parents, (goal, _) = breadth_first(masks, grid.columns, new_start)
+    new_start_cell = grid.cell_at(*divmod(new_start, grid.columns))
+    goal_cell = grid.cell_at(*divmod(goal, grid.columns))
+    assert new_start_cell is not None and goal_cell is not None
+    return ArrayDistances(new_start_cell, grid, values.data, parents=parents.data).path_to(goal_cell)
+
+
+def tree_diameter(masks: MaskBuffer, columns: int, start: int) -> Optional[List[int]]:
+    """
+    Cell ids of a longest path in the tree of links containing the start cell id, or None if the links have loops.
+    Any longest path goes down the two deepest subtrees of one of its cells, so after one iterative depth-first
+    traversal, the tree heights are summed up from the leaves, keeping the two deepest subtrees of every cell.
+    """
+    parents = array("i", [UNVISITED]) * len(masks)
+    steps = ((NORTH, -columns), (SOUTH, columns), (EAST, 1), (WEST, -1))
+
+    # the start is its own parent, so it counts as visited
+    parents[start] = start
+    order = [start]
+    stack = [start]
+    while stack:
+        index = stack.pop()
+        mask = masks[index]
+        parent = parents[index]
+        for direction, offset in steps:
+            if mask & direction:
+                neighbor = index + offset
+                if neighbor == parent:
+                    continue
+                if parents[neighbor] != UNVISITED:
+                    return None
+                parents[neighbor] = index
+                order.append(neighbor)
+                stack.append(neighbor)
+
+    # every cell comes after its parent in the traversal order, so backwards all children come first
+    heights = array("i", [0]) * len(masks)
+    second_heights = array("i", [0]) * len(masks)
+    longest, top = 0, start
+    for index in reversed(order):
+        height = heights[index]
+        if height + second_heights[index] > longest:
+            longest, top = height + second_heights[index], index
+        if index != start:
+            parent = parents[index]
+            height += 1
+            if height > heights[parent]:
+                second_heights[parent] = heights[parent]
+                heights[parent] = height
+            elif height > second_heights[parent]:
+                second_heights[parent] = height
+
+    children = [top + offset for direction, offset in steps
+                if masks[top] & direction and top + offset != parents[top]]
+    children.sort(key=lambda child: heights[child], reverse=True)
+    branches = [_descend(masks, parents, heights, steps, child) for child in children[:2]]
+    indices = branches[0][::-1] if branches else []
+    indices.append(top)
+    if len(branches) > 1:
+        indices.extend(branches[1])
+    return indices
+
+
+def _endpoints(path: Path) -> Tuple[Point, Point]:
+    return (path.root.row, path.root.column), (path.end.row, path.end.column)
+
 
-    return (new_start_cell.row, new_start_cell.column), (goal_cell.row, goal_cell.column)
+def _descend(masks: MaskBuffer, parents: "array[int]", heights: "array[int]", steps: Tuple[Tuple[int, int], ...],
+             index: int) -> List[int]:
+    # follows the deepest subtree down to a leaf
+    indices = [index]
+    while heights[index] > 0:
+        index = next(index + offset for direction, offset in steps
+                     if masks[index] & direction and index + offset != parents[index] and
+                     heights[index + offset] == heights[index] - 1)
+        indices.append(index)
+    return indices
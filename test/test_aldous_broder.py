@@ -0,0 +1,18 @@
+from random import seed
+
+from algorithms.aldous_broder import AldousBroder
+from base.compact_grid import CompactGrid
+from test.uniformity import CHI_SQUARE_LIMIT, spanning_trees_chi_square
+
+
+def test_uniform_spanning_trees() -> None:
+    seed(7)
+    assert spanning_trees_chi_square(AldousBroder(), 15000) < CHI_SQUARE_LIMIT
+
+
+def test_perfect_maze() -> None:
+    grid = CompactGrid(20, 20)
+    AldousBroder().on(grid)
+
+    assert grid.passage_count == grid.size - 1
+    assert len(grid[0, 0].distances.cells) == grid.size    # type: ignore
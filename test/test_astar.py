@@ -0,0 +1,45 @@
+from random import randrange, seed
+from typing import cast
+
+from algorithms.wilson import Wilson
+from base.cell import Cell
+from base.colored_grid import ColoredGrid
+from base.compact_grid import CompactGrid
+from base.directions import EAST, SOUTH
+import pathfinders.astar as AStar
+import pathfinders.dijkstra as Dijkstra
+
+
+def test_fills_grid_distances_with_path() -> None:
+    grid = ColoredGrid(8, 8)
+    Wilson().on(grid)
+
+    AStar.calculate_distances(grid, (0, 0), (7, 7))
+
+    assert grid.distances is not None
+    assert grid.distances.cells == Dijkstra.calculate_path(grid, (0, 0), (7, 7)).cells
+    assert grid.maximum == len(grid.distances.cells) - 1
+
+
+def test_shortest_path_with_loops() -> None:
+    seed(11)
+    grid = CompactGrid(20, 20)
+    Wilson().on(grid)
+    for _ in range(60):
+        grid.link_at(randrange(grid.rows - 1), randrange(grid.columns - 1), SOUTH if randrange(2) else EAST)
+
+    for start, end in (((0, 0), (19, 19)), ((5, 17), (12, 2)), ((3, 3), (3, 4))):
+        path = AStar.calculate_path(grid, start, end)
+        assert path.max[1] == cast(Cell, grid[start]).distances[cast(Cell, grid[end])]
+        for cell, next_cell in zip(path.cells, path.cells[1:]):
+            assert cell.linked_to(next_cell)
+
+
+def test_unreachable_destination() -> None:
+    grid = CompactGrid(2, 2)
+
+    try:
+        AStar.calculate_path(grid, (0, 0), (1, 1))
+        assert False
+    except ValueError:
+        pass
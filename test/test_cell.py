@@ -96,7 +96,7 @@ def test_links_listing() -> None:
 
 
 def test_has_no_neighbors() -> None:
-    assert Cell(1, 1).neighbors == []
+    assert Cell(1, 1).neighbors == ()
 
 
 def test_has_neighbors() -> None:
@@ -134,3 +134,32 @@ def test_distances() -> None:
     assert distances[a_cell] == 0
     assert distances[another_cell] == 1
     assert distances[yet_another_cell] == 2
+
+
+def test_link_count_and_linked_cells() -> None:
+    a_cell = Cell(1, 1)
+    another_cell = Cell(1, 2)
+    assert a_cell.link_count == 0
+
+    a_cell += another_cell
+
+    assert a_cell.link_count == 1
+    assert list(a_cell.linked_cells) == [another_cell]
+
+
+def test_neighbors_are_updated_when_set() -> None:
+    a_cell = Cell(1, 1)
+    another_cell = Cell(0, 1)
+    a_cell.north = another_cell
+    assert a_cell.neighbors == (another_cell,)
+
+    a_cell.north = None
+    assert a_cell.neighbors == ()
+
+
+def test_data_created_on_demand() -> None:
+    a_cell = Cell(1, 1)
+    assert a_cell.has_data("key") is False
+
+    a_cell.data["key"] = "value"
+    assert a_cell.has_data("key") is True
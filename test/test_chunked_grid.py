@@ -0,0 +1,90 @@
+from random import random, seed
+
+import pytest
+
+from algorithms.binary_tree import BinaryTree
+from algorithms.wilson import Wilson
+from base.chunked_grid import ChunkedGrid
+from base.directions import EAST, NORTH, SOUTH, WEST
+
+
+def test_chunks_are_deterministic() -> None:
+    world = ChunkedGrid(Wilson(), chunk_size=8, seed=3)
+    other_world = ChunkedGrid(Wilson(), chunk_size=8, seed=3)
+
+    # order of generation and the random module state don't matter
+    seed(1)
+    masks = world.chunk_masks(-2, 5)
+    after = random()
+    other_world.chunk_masks(0, 0)
+    assert other_world.chunk_masks(-2, 5) == masks
+    seed(1)
+    assert random() == after
+    assert ChunkedGrid(Wilson(), chunk_size=8, seed=4).chunk_masks(-2, 5) != masks
+
+
+def test_neighbor_chunks_connect() -> None:
+    world = ChunkedGrid(Wilson(), chunk_size=6, seed=9)
+
+    for row in range(-12, 12):
+        for column in range(-12, 12):
+            mask = world.mask_at(row, column)
+            assert bool(mask & EAST) == bool(world.mask_at(row, column + 1) & WEST)
+            assert bool(mask & SOUTH) == bool(world.mask_at(row + 1, column) & NORTH)
+    # one passage through every border
+    assert sum(bool(world.mask_at(row, 5) & EAST) for row in range(6)) == 1
+    assert sum(bool(world.mask_at(-1, column) & SOUTH) for column in range(-6, 0)) == 1
+
+
+def test_aligned_region_is_connected() -> None:
+    world = ChunkedGrid(BinaryTree(), chunk_size=10, seed=1)
+    grid = world.region(-10, 20, 30, 30)
+
+    assert len(grid[0, 0].distances.cells) == grid.size    # type: ignore
+    # 3x3 perfect chunks joined through 12 borders, 4 more than a spanning tree needs
+    assert grid.passage_count == grid.size - 1 + 4
+    assert not any(mask & NORTH for mask in next(grid.each_row_masks()))
+
+
+def test_region_matches_mask_at() -> None:
+    world = ChunkedGrid(Wilson(), chunk_size=7, seed=2)
+    rows = list(world.each_row_masks(-5, -9, 12, 20))
+
+    assert len(rows) == 12
+    assert rows[3][4] == world.mask_at(-2, -5)
+    assert rows[0][0] == world.mask_at(-5, -9) & ~(NORTH | WEST)
+    assert rows[-1][-1] == world.mask_at(6, 10) & ~(SOUTH | EAST)
+    single_row = next(world.each_row_masks(0, 0, 1, 3))
+    expected = [world.mask_at(0, 0) & EAST, world.mask_at(0, 1) & (EAST | WEST), world.mask_at(0, 2) & WEST]
+    assert [mask & (EAST | WEST) for mask in single_row] == expected
+    assert not any(mask & (NORTH | SOUTH) for mask in single_row)
+
+
+def test_least_recently_used_chunks_are_evicted() -> None:
+    world = ChunkedGrid(Wilson(), chunk_size=4, max_bytes=3 * 16)
+
+    first = world.chunk_masks(0, 0)
+    world.chunk_masks(0, 1)
+    world.chunk_masks(0, 2)
+    world.chunk_masks(0, 0)
+    world.chunk_masks(0, 3)
+
+    assert (len(world), world.used_bytes, world.evictions) == (3, 48, 1)
+    assert (world.hits, world.misses) == (1, 4)
+    # (0, 1) was the least recently used
+    world.chunk_masks(0, 1)
+    assert world.misses == 5
+    assert world.chunk_masks(0, 0) == first
+
+    world.max_bytes = 0
+    assert len(world) == 0
+    with pytest.raises(ValueError):
+        world.max_bytes = -1
+
+
+def test_region_only_generates_touched_chunks() -> None:
+    world = ChunkedGrid(Wilson(), chunk_size=8)
+    world.region(4, 4, 8, 8)
+
+    # fetched once per band of rows
+    assert (world.misses, world.hits) == (4, 0)
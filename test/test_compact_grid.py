@@ -0,0 +1,159 @@
+
+from typing import cast, List, Tuple
+
+from algorithms.aldous_broder import AldousBroder
+from algorithms.binary_tree import BinaryTree
+from algorithms.hunt_and_kill import HuntAndKill
+from algorithms.recursive_backtracker import RecursiveBacktracker
+from algorithms.sidewinder import Sidewinder
+from algorithms.wilson import Wilson
+from base.cell import Cell
+from base.compact_grid import CompactColoredGrid, CompactGrid
+from base.directions import EAST, NORTH, SOUTH, WEST
+from base.grid import Grid
+import pathfinders.dijkstra as Dijkstra
+import pathfinders.longest_path as LongestPath
+
+
+def test_cell_access() -> None:
+    grid = CompactGrid(2, 2)
+
+    assert grid[0, 0] == Cell(0, 0)
+    assert grid[1, 1] == Cell(1, 1)
+    assert grid[-1, 0] is None
+    assert grid[0, 4] is None
+
+
+def test_neighbors() -> None:
+    grid = CompactGrid(2, 2)
+
+    assert grid[0, 0].north is None        # type: ignore
+    assert grid[0, 0].south == Cell(1, 0)  # type: ignore
+    assert grid[0, 0].east == Cell(0, 1)   # type: ignore
+    assert grid[0, 0].west is None         # type: ignore
+    assert set(grid[1, 1].neighbors) == {Cell(0, 1), Cell(1, 0)}     # type: ignore
+
+
+def test_linking() -> None:
+    grid = CompactGrid(2, 2)
+    a_cell = cast(Cell, grid[0, 0])
+    another_cell = cast(Cell, grid[0, 1])
+    yet_another_cell = cast(Cell, grid[1, 1])
+
+    a_cell += another_cell
+
+    assert a_cell.linked_to(another_cell) is True
+    assert another_cell.linked_to(a_cell) is True
+    assert a_cell.linked_to(yet_another_cell) is False
+    assert another_cell.links == [a_cell]
+
+    a_cell -= another_cell
+
+    assert a_cell.linked_to(another_cell) is False
+    assert another_cell.links == []
+
+
+def test_linking_only_adjacent_cells() -> None:
+    grid = CompactGrid(2, 2)
+
+    try:
+        grid[0, 0].link(grid[1, 1])                     # type: ignore
+        assert False
+    except ValueError:
+        pass
+
+    try:
+        grid[0, 0].link(CompactGrid(2, 2)[0, 1])        # type: ignore
+        assert False
+    except ValueError:
+        pass
+
+
+def test_linking_outside_the_grid() -> None:
+    grid = CompactGrid(3, 3)
+
+    for row, column, direction in [(0, 2, EAST), (0, 1, NORTH), (2, 0, SOUTH), (1, 0, WEST), (3, 0, NORTH)]:
+        for operation in (grid.link_at, grid.unlink_at):
+            try:
+                operation(row, column, direction)
+                assert False
+            except IndexError:
+                pass
+
+    assert bytes(grid.link_masks()) == bytes(grid.size)
+    assert grid.passage_count == 0
+
+
+def test_set_cell_at_links_both_sides() -> None:
+    class RecordingGrid(CompactGrid):
+        def __init__(self, rows: int, columns: int) -> None:
+            self.passages: List[Tuple[int, int, bool]] = []
+            super().__init__(rows, columns)
+
+        def passage_changed(self, first: int, second: int, linked: bool) -> None:
+            self.passages.append((first, second, linked))
+
+    source = Grid(3, 3)
+    source[1, 1].link(source[1, 2])        # type: ignore
+    source[1, 1].link(source[0, 1])        # type: ignore
+    grid = RecordingGrid(3, 3)
+    grid.link_at(1, 1, WEST)
+    grid.passages.clear()
+    version = grid.version
+
+    grid.set_cell_at(1, 1, cast(Cell, source[1, 1]))
+
+    assert grid.mask_at(1, 1) == NORTH | EAST
+    assert grid.mask_at(0, 1) == SOUTH
+    assert grid.mask_at(1, 2) == WEST
+    assert grid.mask_at(1, 0) == 0
+    assert grid.degree_histogram == grid.count_degrees().histogram
+    assert grid.version > version
+    assert sorted(grid.passages) == [(4, 1, True), (4, 3, False), (4, 5, True)]
+
+
+def test_deadends() -> None:
+    grid = CompactGrid(2, 2)
+    grid[0, 0].link(grid[0, 1])        # type: ignore
+    grid[0, 1].link(grid[1, 1])        # type: ignore
+
+    assert grid.deadends == [Cell(0, 0), Cell(1, 1)]
+
+
+def test_algorithms_generate_perfect_mazes() -> None:
+    for algorithm in [AldousBroder, BinaryTree, HuntAndKill, RecursiveBacktracker, Sidewinder, Wilson]:
+        grid = CompactGrid(6, 7)
+        algorithm().on(grid)
+        links_count = sum(len(cell.links) for cell in grid.each_cell())
+        assert links_count == (grid.size - 1) * 2
+
+
+def test_pathfinding() -> None:
+    grid = CompactColoredGrid(5, 5)
+    BinaryTree().on(grid)
+
+    start, end = LongestPath.calculate(grid)
+    Dijkstra.calculate_distances(grid, start, end)
+
+    assert grid.distances is not None
+    assert grid.distances[grid[start]] == 0     # type: ignore
+    assert grid.distances[grid[end]] == grid.maximum    # type: ignore
+
+
+def test_contains() -> None:
+    grid = CompactGrid(2, 2)
+
+    assert grid[0, 0] in grid     # type: ignore
+    assert Cell(0, 0) not in grid
+    assert CompactGrid(2, 2)[0, 0] not in grid     # type: ignore
+
+
+def test_degree_counters() -> None:
+    grid = CompactGrid(3, 3)
+    Sidewinder().on(grid)
+
+    histogram = [0] * 5
+    for cell in grid.each_cell():
+        histogram[len(cell.links)] += 1
+    assert grid.degree_histogram == histogram
+    assert grid.deadend_count == len(grid.deadends)
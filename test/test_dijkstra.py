@@ -0,0 +1,50 @@
+from random import randrange, seed
+from typing import cast
+
+from algorithms.wilson import Wilson
+from base.cell import Cell
+from base.colored_grid import ColoredGrid
+from base.compact_grid import CompactGrid
+from base.directions import EAST, SOUTH
+import pathfinders.dijkstra as Dijkstra
+
+
+def test_path_matches_full_flood() -> None:
+    grid = ColoredGrid(10, 12)
+    Wilson().on(grid)
+    start, end = (2, 3), (9, 11)
+    flood_path = cast(Cell, grid[start]).distances.path_to(cast(Cell, grid[end]))
+
+    Dijkstra.calculate_distances(grid, start, end)
+
+    assert grid.distances is not None
+    assert grid.distances.cells == flood_path.cells
+    assert grid.maximum == flood_path.max[1]
+
+
+def test_shortest_path_with_loops() -> None:
+    seed(7)
+    grid = CompactGrid(15, 15)
+    Wilson().on(grid)
+    for _ in range(40):
+        grid.link_at(randrange(grid.rows - 1), randrange(grid.columns - 1), SOUTH if randrange(2) else EAST)
+    start, end = (0, 0), (14, 14)
+
+    path = Dijkstra.calculate_path(grid, start, end)
+
+    assert path.max[1] == cast(Cell, grid[start]).distances[cast(Cell, grid[end])]
+    for cell, next_cell in zip(path.cells, path.cells[1:]):
+        assert cell.linked_to(next_cell)
+
+
+def test_same_and_unreachable_cells() -> None:
+    grid = CompactGrid(2, 2)
+    grid.link_at(0, 0, EAST)
+
+    assert Dijkstra.calculate_path(grid, (0, 1), (0, 1)).indices.tolist() == [1]
+    assert Dijkstra.calculate_path(grid, (0, 1), (0, 0)).directions == "W"
+    try:
+        Dijkstra.calculate_path(grid, (0, 0), (1, 1))
+        assert False
+    except ValueError:
+        pass
@@ -0,0 +1,70 @@
+from typing import cast
+
+from algorithms.binary_tree import BinaryTree
+from base.cell import Cell
+from base.compact_grid import CompactGrid
+from base.distances import ArrayDistances
+from base.grid import Grid
+
+
+def test_hits_and_misses() -> None:
+    grid = Grid(5, 5)
+    BinaryTree().on(grid)
+    cache = grid.distance_cache
+    cell = cast(Cell, grid[2, 2])
+
+    distances = cell.distances
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+    assert cell.distances is distances
+    assert cast(Cell, grid[2, 2]).distances is distances
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.get(cell) is distances
+    assert cache.used_bytes == cast(ArrayDistances, distances).nbytes
+
+
+def test_link_changes_invalidate() -> None:
+    grid = CompactGrid(4, 4)
+    BinaryTree().on(grid)
+    cell = cast(Cell, grid[0, 0])
+    distances = cell.distances
+
+    cell.unlink(cell.links[0])
+
+    assert grid.distance_cache.get(cell) is None
+    assert cell.distances is not distances
+    assert grid.distance_cache.misses == 2
+    assert len(grid.distance_cache) == 1
+
+
+def test_least_recently_used_are_evicted() -> None:
+    grid = Grid(4, 4)
+    BinaryTree().on(grid)
+    cache = grid.distance_cache
+    cells = [cast(Cell, grid[0, column]) for column in range(4)]
+    entry_size = cast(ArrayDistances, cells[0].distances).nbytes
+    cache.max_bytes = entry_size * 2
+
+    cells[1].distances
+    cells[0].distances
+    cells[2].distances
+
+    assert cache.evictions == 1
+    assert cache.get(cells[1]) is None
+    assert cache.get(cells[0]) is not None and cache.get(cells[2]) is not None
+
+    cache.max_bytes = entry_size - 1
+    assert len(cache) == 0 and cache.used_bytes == 0
+    cells[3].distances
+    assert len(cache) == 0
+
+
+def test_cached_distances_are_read_only() -> None:
+    grid = Grid(3, 3)
+    cell = cast(Cell, grid[0, 0])
+
+    try:
+        cell.distances[cell] = 5
+        assert False
+    except TypeError:
+        pass
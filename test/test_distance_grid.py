@@ -0,0 +1,63 @@
+from random import choice, randrange, seed
+from typing import cast
+
+from algorithms.wilson import Wilson
+from base.cell import Cell
+from base.colored_grid import ColoredGrid
+from base.compact_grid import CompactColoredGrid, CompactGrid
+from base.directions import EAST, SOUTH
+from base.distances import ArrayDistances
+from base.frontier import breadth_first
+
+
+def assert_matches_full_flood(grid: ColoredGrid) -> None:
+    distances = cast(ArrayDistances, grid.distances)
+    root = distances.root
+    values, _, (_, farthest_distance) = breadth_first(grid.link_masks(), grid.columns,
+                                                      root.row * grid.columns + root.column)
+    assert list(distances.values) == values.tolist()
+    assert grid.maximum == farthest_distance
+    for cell in grid.each_cell():
+        if distances[cell]:
+            # parents must lead back to root
+            assert distances.path_to(cell).max[1] == distances[cell]
+
+
+def test_link_and_unlink_updates() -> None:
+    seed(5)
+    for grid in (ColoredGrid(8, 9), CompactColoredGrid(9, 8)):
+        Wilson().on(grid)
+        grid.distances = cast(Cell, grid[4, 4]).distances
+
+        for _ in range(60):
+            cell = cast(Cell, grid[randrange(grid.rows), randrange(grid.columns)])
+            if cell.links and randrange(2):
+                cell.unlink(choice(cell.links))
+            else:
+                cell.link(choice(cell.neighbors))
+            assert_matches_full_flood(grid)
+
+
+def test_updates_touch_only_affected_cells() -> None:
+    # single winding passage: east along even rows, west along odd ones
+    grid = CompactGrid(4, 5)
+    for row in range(4):
+        for column in range(4):
+            grid.link_at(row, column, EAST)
+        if row < 3:
+            grid.link_at(row, 4 if row % 2 == 0 else 0, SOUTH)
+    distances = cast(ArrayDistances, cast(Cell, grid[0, 0]).distances).copy()
+    assert distances.max[1] == 19
+
+    grid.link_at(0, 0, SOUTH)
+    assert distances.link_added(0, 5) == 14
+    assert [distances.values[index] for index in range(5, 10)] == [1, 2, 3, 4, 5]
+    assert distances.max[1] == 11
+
+    grid.unlink_at(1, 3, EAST)
+    assert distances.link_removed(8, 9) == 0
+
+    grid.unlink_at(2, 4, SOUTH)
+    assert distances.link_removed(14, 19) == 5
+    assert distances[cast(Cell, grid[3, 0])] is None
+    assert distances.max[1] == 6
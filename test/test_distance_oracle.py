@@ -0,0 +1,62 @@
+from itertools import product
+from typing import cast
+
+from algorithms.recursive_backtracker import RecursiveBacktracker
+from algorithms.wilson import Wilson
+from base.cell import Cell
+from base.compact_grid import CompactDistanceGrid
+from base.directions import EAST, SOUTH
+from base.distance_grid import DistanceGrid
+from base.distance_oracle import DistanceOracle
+
+
+def distances_between(origin: Cell, destination: Cell) -> int:
+    return cast(int, origin.distances[destination])
+
+
+def test_distances_and_paths_between_all_cells() -> None:
+    grid = DistanceGrid(6, 7)
+    Wilson().on(grid)
+    cells = [cast(Cell, cell) for cell in grid.each_cell()]
+
+    for origin in cells:
+        distances = origin.distances
+        for destination in cells:
+            assert grid.oracle.distance(origin, destination) == distances[destination]
+    for origin, destination in product(cells[::5], cells[::3]):
+        path = grid.oracle.path(origin, destination)
+        assert path.root == origin and path.end == destination
+        assert path.max[1] == distances_between(origin, destination)
+        for cell, next_cell in zip(path.cells, path.cells[1:]):
+            assert cell.linked_to(next_cell)
+
+
+def test_rebuilt_after_link_changes() -> None:
+    grid = CompactDistanceGrid(8, 8)
+    RecursiveBacktracker().on(grid)
+    oracle = grid.oracle
+    assert grid.oracle is oracle
+
+    cell = cast(Cell, grid[3, 3])
+    cell.unlink(cell.links[0])
+
+    assert grid.oracle is not oracle
+    assert grid.oracle.version == grid.version
+
+
+def test_disconnected_cells_and_loops() -> None:
+    grid = CompactDistanceGrid(2, 2)
+    grid.link_at(0, 0, EAST)
+    oracle = DistanceOracle(grid)
+
+    assert oracle.distance(cast(Cell, grid[0, 0]), cast(Cell, grid[0, 1])) == 1
+    assert oracle.distance(cast(Cell, grid[0, 0]), cast(Cell, grid[1, 1])) is None
+
+    grid.link_at(0, 0, SOUTH)
+    grid.link_at(1, 0, EAST)
+    grid.link_at(0, 1, SOUTH)
+    try:
+        DistanceOracle(grid)
+        assert False
+    except ValueError:
+        pass
@@ -1,5 +1,12 @@
-from base.distances import Distances
+from typing import cast
+
+import pytest
+
+from algorithms.binary_tree import BinaryTree
+from algorithms.recursive_backtracker import RecursiveBacktracker
+from base.distances import ArrayDistances, Distances, Path
 from base.cell import Cell
+from base.grid import Grid
 
 
 def test_index_access() -> None:
@@ -33,3 +40,117 @@ def test_max_distance() -> None:
     distances[cell_4] = distance_from_4_to_1
 
     assert distances.max == (cell_4, distance_from_4_to_1,)
+
+
+def test_max_distance_lowered() -> None:
+    cell_1 = Cell(0, 0)
+    distances = Distances(cell_1)
+    cell_2 = Cell(0, 1)
+    cell_3 = Cell(0, 2)
+    distances[cell_2] = 3
+    distances[cell_3] = 7
+
+    distances[cell_3] = 1
+
+    assert distances.max == (cell_2, 3)
+
+
+def test_array_distances() -> None:
+    grid = Grid(3, 4)
+    root = cast(Cell, grid[1, 1])
+    distances = ArrayDistances(root, grid)
+
+    assert distances[root] == 0
+    assert distances[cast(Cell, grid[2, 3])] is None
+    assert distances[Cell(5, 5)] is None
+
+    distances[cast(Cell, grid[2, 3])] = 3
+    distances[cast(Cell, grid[0, 0])] = 2
+
+    assert distances.max == (grid[2, 3], 3)
+    assert distances.cells == [grid[0, 0], root, grid[2, 3]]
+    assert list(distances.values[:4]) == [2, -1, -1, -1]
+    try:
+        distances[Cell(3, 0)] = 1
+        assert False
+    except IndexError:
+        pass
+
+
+def test_array_distances_of_grid_cells() -> None:
+    grid = Grid(4, 4)
+    BinaryTree().on(grid)
+    root = cast(Cell, grid[3, 0])
+
+    distances = root.distances
+
+    assert isinstance(distances, ArrayDistances)
+    for cell in grid.each_cell():
+        assert distances[cell] is not None
+    farthest, distance = distances.max
+    path = distances.path_to(farthest)
+    assert len(path.cells) == distance + 1
+    assert path[root] == 0
+
+
+def test_path_follows_recorded_parents() -> None:
+    grid = Grid(6, 6)
+    RecursiveBacktracker().on(grid)
+    root = cast(Cell, grid[0, 0])
+    distances = root.distances
+    destination, distance = distances.max
+
+    path = distances.path_to(destination)
+
+    assert isinstance(path, Path)
+    assert len(path) == distance + 1
+    assert path.root is root and path.end is destination
+    for position, cell in enumerate(path.cells):
+        assert path[cell] == position == distances[cell]
+    for cell, next_cell in zip(path.cells, path.cells[1:]):
+        assert cell.linked_to(next_cell)
+    assert Path.from_directions(grid, root, path.directions).indices == path.indices
+
+
+def test_path_without_parents() -> None:
+    grid = Grid(2, 4)
+    cells = [cast(Cell, grid[0, column]) for column in range(4)]
+    for cell, next_cell in zip(cells, cells[1:]):
+        cell.link(next_cell)
+    distances = ArrayDistances(cells[3], grid)
+    for distance, cell in enumerate(reversed(cells)):
+        distances[cell] = distance
+
+    path = distances.path_to(cells[0])
+
+    assert path.cells == list(reversed(cells))
+    assert path.directions == "WWW"
+    assert path.max == (cells[0], 3)
+    assert path[Cell(3, 3)] is None
+
+
+def test_path_from_directions() -> None:
+    grid = Grid(3, 3)
+
+    path = Path.from_directions(grid, cast(Cell, grid[0, 0]), "SSEN")
+
+    assert list(path.indices) == [0, 3, 6, 7, 4]
+    assert path.path_to(cast(Cell, grid[2, 0])).directions == "SS"
+    try:
+        Path.from_directions(grid, cast(Cell, grid[0, 0]), "NX")
+        assert False
+    except ValueError:
+        pass
+
+
+def test_path_rejects_steps_off_the_grid() -> None:
+    grid = Grid(3, 3)
+
+    for start, directions in [((0, 2), "E"), ((1, 0), "W"), ((0, 1), "N"), ((2, 1), "ES")]:
+        with pytest.raises(ValueError):
+            Path.from_directions(grid, cast(Cell, grid[start]), directions)
+    # ids wrapping around rows, skipping cells or outside of the grid
+    for indices in [[2, 3], [0, 2], [0, 4], [8, 9], [-1, 0]]:
+        with pytest.raises(ValueError):
+            Path(grid, indices)
+    assert list(Path(grid, [5, 4, 1]).indices) == [5, 4, 1]
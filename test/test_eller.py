@@ -0,0 +1,108 @@
+import contextlib
+import io
+from itertools import islice
+from pathlib import Path
+from random import seed
+from typing import cast
+
+import pytest
+from PIL import Image
+
+from algorithms.eller import Eller
+from base.compact_grid import CompactGrid
+from base.directions import EAST, NORTH, SOUTH, WEST
+from base.grid import Grid
+from base.mapped_grid import MappedColoredGrid, save_rows
+from exporters.ascii_exporter import ASCIIExporter
+from exporters.base_exporter import Exporter
+from exporters.png_exporter import PNGExporter
+from exporters.unicode_exporter import UnicodeExporter
+
+
+@pytest.mark.parametrize("grid", [Grid(25, 30), CompactGrid(40, 35)])
+def test_perfect_maze(grid: Grid) -> None:
+    Eller().on(grid)
+
+    assert grid.passage_count == grid.size - 1
+    assert len(grid[0, 0].distances.cells) == grid.size    # type: ignore
+    assert 0.25 < grid.deadend_count / grid.size < 0.35
+
+
+def test_rows_match_grid() -> None:
+    seed(7)
+    rows = list(Eller().rows(12, 9))
+    seed(7)
+    grid = Grid(9, 12)
+    Eller().on(grid)
+
+    assert list(grid.each_row_masks()) == rows
+    assert not rows[0][0] & (NORTH | WEST)
+    assert not any(mask & SOUTH for mask in rows[-1])
+
+
+def test_endless_rows_stay_consistent() -> None:
+    previous = None
+    for row_masks in islice(Eller().rows(20), 500):
+        assert len(row_masks) == 20
+        for column in range(19):
+            assert bool(row_masks[column] & EAST) == bool(row_masks[column + 1] & WEST)
+        if previous is not None:
+            assert all(bool(above & SOUTH) == bool(below & NORTH) for above, below in zip(previous, row_masks))
+            # every cell of a row above reaches the rows below
+            assert any(mask & SOUTH for mask in previous)
+        previous = row_masks
+
+
+def test_invalid_sizes() -> None:
+    with pytest.raises(ValueError):
+        next(Eller().rows(1))
+    with pytest.raises(ValueError):
+        next(Eller().rows(5, 0))
+
+
+@pytest.mark.parametrize("exporter", [ASCIIExporter(), UnicodeExporter()])
+def test_render_rows_as_grid(exporter: Exporter) -> None:
+    seed(11)
+    grid = Grid(6, 8)
+    Eller().on(grid)
+
+    rendered = io.StringIO()
+    with contextlib.redirect_stdout(rendered):
+        exporter.render(grid)
+    streamed = io.StringIO()
+    with contextlib.redirect_stdout(streamed):
+        exporter.render_rows(iter(grid.each_row_masks()), grid.columns)
+
+    # rendering whole grids prints an extra empty line
+    assert streamed.getvalue() + "\n" == rendered.getvalue()
+
+
+def test_png_render_rows_as_grid(tmp_path: Path) -> None:
+    seed(5)
+    grid = Grid(7, 9)
+    Eller().on(grid)
+
+    filename = str(tmp_path / "maze")
+    with contextlib.redirect_stdout(io.StringIO()):
+        PNGExporter().render_rows(iter(grid.each_row_masks()), grid.columns, filename=filename, cell_size=6)
+
+    with Image.open(filename + ".png") as image:
+        streamed = image.convert("L").tobytes()
+    assert streamed == PNGExporter._render(grid, 6).convert("L").tobytes()
+
+
+def test_save_rows(tmp_path: Path) -> None:
+    path = str(tmp_path / "maze.bin")
+    seed(3)
+    assert save_rows(Eller().rows(10, 15), 10, path) == 15
+    seed(3)
+    grid = Grid(15, 10)
+    Eller().on(grid)
+
+    loaded = Grid.load(path)
+    assert (loaded.rows, loaded.columns) == (15, 10)
+    assert list(loaded.each_row_masks()) == list(grid.each_row_masks())
+    cast(MappedColoredGrid, loaded).close()
+
+    with pytest.raises(ValueError):
+        save_rows(iter([bytes(3)]), 10, path)
@@ -0,0 +1,123 @@
+from typing import cast, Dict
+
+from algorithms.recursive_backtracker import RecursiveBacktracker
+from base.cell import Cell
+from base.compact_grid import CompactGrid
+from base.directions import EAST, SOUTH
+from base.distances import Regions, UNREACHED
+from base.colored_grid import ColoredGrid
+from base.frontier import breadth_first, nearest_sources, regions_from, VECTORIZE_THRESHOLD
+from base.grid import Grid
+
+
+def reference_distances(root: Cell) -> Dict[Cell, int]:
+    distances = {root: 0}
+    frontier = [root]
+    while frontier:
+        new_frontier = []
+        for cell in frontier:
+            for linked_cell in cell.linked_cells:
+                if linked_cell not in distances:
+                    distances[linked_cell] = distances[cell] + 1
+                    new_frontier.append(linked_cell)
+        frontier = new_frontier
+    return distances
+
+
+def test_same_distances_as_cell_by_cell_search() -> None:
+    grid = Grid(12, 9)
+    RecursiveBacktracker().on(grid)
+    root = cast(Cell, grid[5, 4])
+
+    distances = root.distances
+    expected = reference_distances(root)
+
+    for cell in grid.each_cell():
+        assert distances[cell] == expected[cell]
+    assert distances.max[1] == max(expected.values())
+
+
+def test_wide_frontiers_are_vectorized() -> None:
+    size = VECTORIZE_THRESHOLD
+    grid = CompactGrid(size, size)
+    for row in range(size):
+        for column in range(size):
+            if row + 1 < size:
+                grid.link_at(row, column, SOUTH)
+            if column + 1 < size:
+                grid.link_at(row, column, EAST)
+
+    values, _, (farthest, distance) = breadth_first(grid.link_masks(), size, 0)
+
+    assert values.tolist() == [row + column for row in range(size) for column in range(size)]
+    assert (farthest, distance) == (size * size - 1, 2 * size - 2)
+
+
+def test_unreachable_cells() -> None:
+    grid = CompactGrid(2, 3)
+    grid.link_at(0, 0, EAST)
+
+    values, _, farthest = breadth_first(grid.link_masks(), grid.columns, 0)
+
+    assert values.tolist() == [0, 1, UNREACHED, UNREACHED, UNREACHED, UNREACHED]
+    assert farthest == (1, 1)
+    assert grid[0, 0].distances[grid[1, 1]] is None    # type: ignore
+
+
+def test_nearest_sources_in_one_flood() -> None:
+    size = VECTORIZE_THRESHOLD
+    grid = CompactGrid(size, size)
+    for row in range(size):
+        for column in range(size):
+            if row + 1 < size:
+                grid.link_at(row, column, SOUTH)
+            if column + 1 < size:
+                grid.link_at(row, column, EAST)
+    # one source on each side, so frontiers get wide enough to be vectorized
+    sources = [0, size * size - 1]
+
+    values, owners, _, (farthest, distance) = nearest_sources(grid.link_masks(), size, sources)
+
+    for index in range(size * size):
+        row, column = divmod(index, size)
+        to_first, to_last = row + column, 2 * size - 2 - row - column
+        assert values[index] == min(to_first, to_last)
+        if to_first != to_last:
+            assert owners[index] == (sources[0] if to_first < to_last else sources[1])
+    assert distance == size - 1
+
+
+def test_regions_render_one_hue_per_source() -> None:
+    grid = ColoredGrid(3, 4)
+    RecursiveBacktracker().on(grid)
+    sources = [cast(Cell, grid[0, 0]), cast(Cell, grid[2, 3])]
+
+    regions = regions_from(grid, sources)
+    grid.distances = regions
+
+    for cell in grid.each_cell():
+        owner = regions.owner_of(cell)
+        assert owner in sources
+        assert regions[cell] == min(cast(int, source.distances[cell]) for source in sources)
+        assert regions.path_to(cell).root == owner
+    assert grid.background_color_for(sources[0]) != grid.background_color_for(sources[1])
+
+
+def test_regions_follow_link_changes() -> None:
+    # a corridor along the first row, then back along the second one
+    grid = ColoredGrid(2, 4)
+    for column in range(3):
+        cast(Cell, grid[0, column]).link(cast(Cell, grid[0, column + 1]))
+        cast(Cell, grid[1, column]).link(cast(Cell, grid[1, column + 1]))
+    cast(Cell, grid[0, 3]).link(cast(Cell, grid[1, 3]))
+    sources = [cast(Cell, grid[0, 0]), cast(Cell, grid[1, 0])]
+    grid.distances = regions_from(grid, sources)
+    assert grid.maximum == 3
+
+    sources[0].unlink(cast(Cell, grid[0, 1]))
+
+    regions = grid.distances
+    assert isinstance(regions, Regions)
+    assert regions.owner_of(cast(Cell, grid[0, 1])) == sources[1]
+    assert regions[cast(Cell, grid[0, 1])] == 6
+    assert grid.maximum == 6
@@ -76,3 +76,45 @@ def test_size() -> None:
     assert Grid(2, 2).size == 4
     assert Grid(3, 3).size == 9
     assert Grid(4, 4).size == 16
+
+
+def test_contains() -> None:
+    grid = Grid(2, 2)
+    same_shape_grid = Grid(2, 2)
+
+    assert grid[0, 0] in grid     # type: ignore
+    assert grid[1, 1] in grid     # type: ignore
+    assert Cell(0, 0) not in grid
+    assert same_shape_grid[0, 0] not in grid     # type: ignore
+    assert "not a cell" not in grid     # type: ignore
+
+
+def test_tokens_are_unique() -> None:
+    grid = Grid(2, 2)
+    another_grid = Grid(2, 2)
+
+    assert grid.token != another_grid.token
+    assert grid[0, 0].grid_token == grid.token     # type: ignore
+
+
+def test_degree_counters() -> None:
+    grid = Grid(2, 2)
+    assert grid.degree_histogram == [4, 0, 0, 0, 0]
+    assert grid.deadend_count == 0
+
+    grid[0, 0].link(grid[0, 1])     # type: ignore
+    grid[0, 0].link(grid[1, 0])     # type: ignore
+    grid[0, 0].link(grid[0, 1])     # type: ignore
+
+    assert grid.degree_histogram == [1, 2, 1, 0, 0]
+    assert grid.deadend_count == 2
+    assert set(grid.deadends) == {Cell(0, 1), Cell(1, 0)}
+
+    grid[0, 0].link(grid[1, 1])     # type: ignore
+
+    assert grid.junction_count == 1
+
+    grid[0, 1].unlink(grid[0, 0])     # type: ignore
+
+    assert grid.degree_histogram == [1, 2, 1, 0, 0]
+    assert set(grid.deadends) == {Cell(1, 1), Cell(1, 0)}
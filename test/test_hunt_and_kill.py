@@ -0,0 +1,39 @@
+from random import choice, seed
+from typing import cast, Optional
+
+from algorithms.hunt_and_kill import HuntAndKill
+from base.cell import Cell
+from base.compact_grid import CompactGrid
+from base.grid import Grid
+
+
+def rescanning_hunt_and_kill(grid: Grid) -> None:
+    # hunts from the northwest corner every time
+    current_cell: Optional[Cell] = grid.random_cell()
+    while current_cell is not None:
+        unvisited_neighbors = [neighbor for neighbor in current_cell.neighbors if neighbor.link_count == 0]
+        if len(unvisited_neighbors) > 0:
+            neighbor = choice(unvisited_neighbors)
+            current_cell += neighbor
+            current_cell = neighbor
+        else:
+            current_cell = None
+            for cell in grid.each_cell():
+                visited_neighbors = [neighbor for neighbor in cell.neighbors if neighbor.link_count > 0]
+                if cell.link_count == 0 and len(visited_neighbors) > 0:
+                    current_cell = cast(Cell, cell)
+                    current_cell += choice(visited_neighbors)
+                    break
+
+
+def test_hunts_the_same_cells_as_rescanning() -> None:
+    for run in range(5):
+        expected = CompactGrid(12, 15)
+        seed(run)
+        rescanning_hunt_and_kill(expected)
+
+        grid = CompactGrid(12, 15)
+        seed(run)
+        HuntAndKill().on(grid)
+
+        assert grid.link_masks() == expected.link_masks()
@@ -0,0 +1,66 @@
+from random import randrange, seed
+from typing import cast, List
+
+from algorithms.binary_tree import BinaryTree
+from algorithms.recursive_backtracker import RecursiveBacktracker
+from algorithms.wilson import Wilson
+from base.cell import Cell
+from base.colored_grid import ColoredGrid
+from base.compact_grid import CompactGrid
+from base.directions import EAST, SOUTH
+from base.grid import Grid
+import pathfinders.longest_path as LongestPath
+
+
+def longest_distance(grid: Grid) -> int:
+    return max(cast(Cell, cell).distances.max[1] for cell in grid.each_cell())
+
+
+def assert_is_path(cells: List[Cell]) -> None:
+    assert len(set(cells)) == len(cells)
+    for cell, next_cell in zip(cells, cells[1:]):
+        assert cell.linked_to(next_cell)
+
+
+def test_diameter_of_perfect_mazes() -> None:
+    for algorithm in (BinaryTree, RecursiveBacktracker, Wilson):
+        grid = Grid(7, 9)
+        algorithm().on(grid)
+
+        path = LongestPath.calculate_path(grid)
+
+        assert path.max[1] == longest_distance(grid)
+        assert_is_path(path.cells)
+
+
+def test_stores_path_as_distances() -> None:
+    grid = ColoredGrid(6, 6)
+    Wilson().on(grid)
+
+    start, end = LongestPath.calculate_distances(grid)
+
+    assert grid.distances is not None
+    assert grid.distances[cast(Cell, grid[start])] == 0
+    assert grid.distances[cast(Cell, grid[end])] == grid.maximum == longest_distance(grid)
+    assert LongestPath.calculate(grid) == (start, end)
+
+
+def test_mazes_with_loops_fall_back_to_sweeps() -> None:
+    seed(3)
+    grid = CompactGrid(10, 10)
+    Wilson().on(grid)
+    for _ in range(10):
+        grid.link_at(randrange(grid.rows - 1), randrange(grid.columns - 1), SOUTH if randrange(2) else EAST)
+
+    assert LongestPath.tree_diameter(grid.link_masks(), grid.columns, 0) is None
+    path = LongestPath.calculate_path(grid)
+    assert path.max[1] == path.root.distances.max[1]
+    assert_is_path(path.cells)
+
+
+def test_single_passage() -> None:
+    grid = CompactGrid(2, 2)
+    grid.link_at(0, 0, EAST)
+
+    assert LongestPath.tree_diameter(grid.link_masks(), grid.columns, 0) == [1, 0]
+    assert LongestPath.tree_diameter(grid.link_masks(), grid.columns, 3) == [3]
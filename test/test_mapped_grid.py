@@ -0,0 +1,135 @@
+from pathlib import Path
+from typing import cast
+
+from algorithms.binary_tree import BinaryTree
+from algorithms.wilson import Wilson
+from base.cell import Cell
+from base.colored_grid import ColoredGrid
+from base.compact_grid import CompactGrid
+from base.directions import EAST
+from base.grid import Grid
+from base.mapped_grid import MappedColoredGrid, MappedGrid
+import pathfinders.dijkstra as Dijkstra
+import pathfinders.longest_path as LongestPath
+
+
+def test_links_are_persisted(tmp_path: Path) -> None:
+    path = str(tmp_path / "maze.bin")
+    with MappedGrid(4, 5, path) as grid:
+        BinaryTree().on(grid)
+        links = [[cell.linked_to(cell.east) for cell in row] for row in grid.each_row()]
+        histogram = grid.degree_histogram
+
+    with MappedGrid.open(path) as grid:
+        assert grid.dimensions == (4, 5)
+        assert [[cell.linked_to(cell.east) for cell in row] for row in grid.each_row()] == links
+        assert grid.degree_histogram == histogram
+
+
+def test_anonymous_file() -> None:
+    grid = MappedGrid(3, 3)
+    grid[0, 0].link(grid[0, 1])     # type: ignore
+
+    assert grid[0, 1].linked_to(grid[0, 0])     # type: ignore
+    assert grid.deadend_count == 2
+    grid.close()
+
+
+def test_read_only(tmp_path: Path) -> None:
+    path = str(tmp_path / "maze.bin")
+    MappedGrid(2, 2, path).close()
+
+    with MappedGrid.open(path, writable=False) as grid:
+        try:
+            grid[0, 0].link(grid[0, 1])     # type: ignore
+            assert False
+        except TypeError:
+            pass
+
+
+def test_invalid_file(tmp_path: Path) -> None:
+    path = tmp_path / "maze.bin"
+    path.write_bytes(b"not a maze")
+
+    try:
+        MappedGrid.open(str(path))
+        assert False
+    except ValueError:
+        pass
+
+
+def test_truncated_file_is_closed(tmp_path: Path) -> None:
+    class ClosedGrid(MappedGrid):
+        closed = False
+
+        def close(self) -> None:
+            super().close()
+            ClosedGrid.closed = True
+
+    path = tmp_path / "maze.bin"
+    MappedGrid(3, 3, str(path)).close()
+    path.write_bytes(path.read_bytes()[:-1])
+
+    try:
+        ClosedGrid.open(str(path))
+        assert False
+    except ValueError:
+        pass
+    assert ClosedGrid.closed
+
+
+def test_degrees_counted_on_first_use(tmp_path: Path) -> None:
+    path = str(tmp_path / "maze.bin")
+    with MappedGrid(4, 5, path) as grid:
+        BinaryTree().on(grid)
+
+    with MappedGrid.open(path) as grid:
+        grid.unlink_at(0, 0, EAST)
+        assert grid.degree_histogram == grid.count_degrees().histogram
+        grid.link_at(0, 0, EAST)
+        assert grid.degree_histogram == grid.count_degrees().histogram
+        assert grid.passage_count == grid.size - 1
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    path = str(tmp_path / "maze.bin")
+    grid = Grid(4, 6)
+    Wilson().on(grid)
+    grid.save(path)
+
+    loaded_grid = Grid.load(path)
+
+    assert loaded_grid.dimensions == grid.dimensions
+    assert list(loaded_grid.each_row_masks()) == list(grid.each_row_masks())
+    assert loaded_grid.distances is None
+    cast(MappedColoredGrid, loaded_grid).close()
+
+
+def test_save_and_load_distances_and_solution(tmp_path: Path) -> None:
+    path = str(tmp_path / "maze.bin")
+    grid = ColoredGrid(5, 5)
+    Wilson().on(grid)
+    start, end = LongestPath.calculate(grid)
+    Dijkstra.calculate_distances(grid, start, end)
+    assert grid.distances is not None
+    solution = sorted(grid.distances.cells, key=lambda cell: cast(int, grid.distances[cell]))    # type: ignore
+    grid.save(path, solution)
+
+    with cast(MappedColoredGrid, Grid.load(path)) as loaded_grid:
+        assert loaded_grid.distances is not None
+        assert loaded_grid.distances.root == grid.distances.root
+        assert loaded_grid.maximum == grid.maximum
+        for cell in grid.distances.cells:
+            assert loaded_grid.distances[cast(Cell, loaded_grid[cell.row, cell.column])] == grid.distances[cell]
+        assert loaded_grid.solution == solution
+
+
+def test_save_compact_grid(tmp_path: Path) -> None:
+    path = str(tmp_path / "maze.bin")
+    grid = CompactGrid(3, 7)
+    BinaryTree().on(grid)
+    grid.save(path)
+
+    with MappedGrid.open(path) as loaded_grid:
+        assert list(loaded_grid.each_row_masks()) == list(grid.each_row_masks())
+        assert loaded_grid.solution is None
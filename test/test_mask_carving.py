@@ -0,0 +1,53 @@
+from random import seed
+
+import pytest
+
+from algorithms.base_algorithm import Algorithm
+from algorithms.binary_tree import BinaryTree
+from algorithms.sidewinder import Sidewinder
+from base.compact_grid import CompactGrid
+from base.directions import EAST, NORTH, WEST
+from base.grid import Grid
+
+
+@pytest.mark.parametrize("algorithm, deadend_ratio", [(BinaryTree(), 0.25), (Sidewinder(), 0.278)])
+def test_same_texture_as_cell_by_cell(algorithm: Algorithm, deadend_ratio: float) -> None:
+    grid = CompactGrid(120, 150)
+    algorithm.on(grid)
+    cell_grid = Grid(60, 60)
+    algorithm.on(cell_grid)
+
+    assert grid.passage_count == grid.size - 1
+    assert len(grid[0, 0].distances.cells) == grid.size    # type: ignore
+    assert grid.degree_histogram == grid.count_degrees().histogram
+    assert abs(grid.deadend_count / grid.size - deadend_ratio) < 0.01
+    assert abs(cell_grid.deadend_count / cell_grid.size - deadend_ratio) < 0.03
+    # both leave the topmost row as a straight line
+    assert all(grid.mask_at(0, column) & EAST for column in range(grid.columns - 1))
+
+
+def test_binary_tree_carves_north_or_east() -> None:
+    grid = CompactGrid(30, 40)
+    BinaryTree().on(grid)
+
+    for row in range(grid.rows):
+        for column in range(grid.columns):
+            carved = grid.mask_at(row, column) & (NORTH | EAST)
+            if (row, column) == (0, grid.columns - 1):
+                assert carved == 0
+            else:
+                assert carved in (NORTH, EAST)
+            if column > 0:
+                assert bool(grid.mask_at(row, column) & WEST) == bool(grid.mask_at(row, column - 1) & EAST)
+
+
+@pytest.mark.parametrize("algorithm", [BinaryTree(), Sidewinder()])
+def test_repeatable_with_seed(algorithm: Algorithm) -> None:
+    grids = []
+    for _ in range(2):
+        seed(42)
+        grid = CompactGrid(20, 30)
+        algorithm.on(grid)
+        grids.append(bytes(grid.link_masks()))
+
+    assert grids[0] == grids[1]
@@ -0,0 +1,55 @@
+from random import seed
+from typing import Type
+
+import pytest
+
+from algorithms.base_algorithm import Algorithm
+from algorithms.binary_tree import BinaryTree
+from algorithms.parallel_tiles import ParallelTiles
+from algorithms.recursive_backtracker import RecursiveBacktracker
+from algorithms.wilson import Wilson
+from base.compact_grid import CompactGrid
+from base.directions import EAST, SOUTH
+from base.grid import Grid
+
+
+@pytest.mark.parametrize("algorithm", [Wilson(), BinaryTree(), RecursiveBacktracker()])
+@pytest.mark.parametrize("grid_class", [Grid, CompactGrid])
+def test_perfect_maze(algorithm: Algorithm, grid_class: Type[Grid]) -> None:
+    grid = grid_class(23, 31)
+    ParallelTiles(algorithm, tile_size=8, workers=2).on(grid)
+
+    assert grid.passage_count == grid.size - 1
+    assert len(grid[0, 0].distances.cells) == grid.size    # type: ignore
+
+
+def test_tiles_are_stitched_once() -> None:
+    grid = CompactGrid(20, 30)
+    ParallelTiles(Wilson(), tile_size=10, workers=2).on(grid)
+
+    # one passage through a border per edge of the spanning tree over the 2x3 tiles
+    crossings = sum(1 for row in range(20) for column in (9, 19) if grid.mask_at(row, column) & EAST)
+    crossings += sum(1 for column in range(30) if grid.mask_at(9, column) & SOUTH)
+    assert crossings == 5
+
+
+def test_repeatable_with_seed() -> None:
+    grids = []
+    for _ in range(2):
+        seed(8)
+        grid = CompactGrid(30, 30)
+        ParallelTiles(Wilson(), tile_size=12).on(grid)
+        grids.append(bytes(grid.link_masks()))
+
+    assert grids[0] == grids[1]
+
+
+def test_bounds() -> None:
+    tiles = ParallelTiles(Wilson(), tile_size=10)
+
+    assert tiles.bounds(25) == [(0, 10), (10, 10), (20, 5)]
+    # a single row or column left over can't be a maze of its own
+    assert tiles.bounds(21) == [(0, 10), (10, 11)]
+    assert tiles.bounds(7) == [(0, 7)]
+    with pytest.raises(ValueError):
+        ParallelTiles(Wilson(), tile_size=1)
@@ -0,0 +1,81 @@
+from typing import List
+
+from algorithms.wilson import Wilson
+from base.cell import Cell
+from base.compact_grid import CompactGrid
+from base.directions import EAST, WEST
+from base.grid import Grid
+from base.grid_view import GridView
+from base.rotator import Rotator
+
+
+def masks(grid: Grid) -> List[bytes]:
+    return list(grid.each_row_masks())
+
+
+def maze(rows: int = 4, columns: int = 6) -> Grid:
+    grid = Grid(rows, columns)
+    Wilson().on(grid)
+    return grid
+
+
+def test_rotation_is_clockwise() -> None:
+    grid = maze()
+    rotated_grid = Rotator.on(grid)
+
+    assert type(rotated_grid) is Grid
+    assert rotated_grid.dimensions == (grid.columns, grid.rows)
+    for cell in grid.each_cell():
+        rotated_cell = rotated_grid[cell.column, grid.rows - cell.row - 1]
+        assert rotated_cell.linked_to(rotated_cell.south) == cell.linked_to(cell.east)     # type: ignore
+        assert rotated_cell.linked_to(rotated_cell.east) == cell.linked_to(cell.north)     # type: ignore
+
+
+def test_views_match_materialized_rotations() -> None:
+    grid = maze()
+    rotated_grid = grid
+    for rotations in range(1, 5):
+        rotated_grid = Rotator.on(rotated_grid)
+        assert masks(Rotator.view(grid, rotations)) == masks(rotated_grid)
+    assert masks(rotated_grid) == masks(grid)
+
+
+def test_views_of_views_are_flattened() -> None:
+    grid = maze()
+    view = Rotator.view(Rotator.view(Rotator.view(grid, 1, reflected=True), 3), 2, reflected=True)
+
+    assert view.source is grid
+    assert masks(view) == masks(Rotator.view(grid, 2))
+    assert masks(Rotator.view(Rotator.view(grid, 0, reflected=True), 0, reflected=True)) == masks(grid)
+
+
+def test_reflection() -> None:
+    grid = maze()
+    view = Rotator.view(grid, 0, reflected=True)
+
+    for row_masks, view_row_masks in zip(masks(grid), masks(view)):
+        swapped = [mask & ~(EAST | WEST) | (EAST if mask & WEST else 0) | (WEST if mask & EAST else 0)
+                   for mask in reversed(row_masks)]
+        assert list(view_row_masks) == swapped
+
+
+def test_all_symmetries_are_distinct_mazes_of_same_shape() -> None:
+    grid = maze(5, 5)
+    views = [GridView(grid, rotations, reflected) for rotations in range(4) for reflected in (False, True)]
+
+    assert len({tuple(masks(view)) for view in views}) == 8
+    for view in views:
+        assert view.deadend_count == grid.deadend_count
+        assert sorted(view.source_cell(cell).link_count for cell in view.deadends) == [1] * grid.deadend_count
+
+
+def test_linking_through_view_links_source() -> None:
+    grid = CompactGrid(3, 4)
+    view = Rotator.view(grid, 1)
+
+    view[0, 0].link(view[0, 1])     # type: ignore
+
+    # view top-left is source bottom-left, view east is source north
+    assert grid[2, 0].linked_to(grid[1, 0])     # type: ignore
+    assert view[0, 0] in view     # type: ignore
+    assert Cell(0, 0) not in view
@@ -0,0 +1,97 @@
+from random import randrange, seed
+from typing import cast
+
+import pytest
+
+from algorithms.wilson import Wilson
+from base.cell import Cell
+from base.distances import ArrayDistances
+from base.frontier import breadth_first, cheapest_first
+from base.weighted_grid import WeightedColoredGrid, WeightedGrid
+import pathfinders.dijkstra as Dijkstra
+
+
+def test_unit_weights_match_breadth_first() -> None:
+    grid = WeightedGrid(10, 10)
+    Wilson().on(grid)
+
+    distances = cast(ArrayDistances, cast(Cell, grid[0, 0]).distances)
+    expected, _, (_, farthest_distance) = breadth_first(grid.link_masks(), grid.columns, 0)
+
+    assert list(distances.values) == expected.tolist()
+    assert distances.max[1] == farthest_distance
+
+
+def test_bucket_and_heap_queues_agree() -> None:
+    seed(5)
+    grid = WeightedGrid(15, 15)
+    Wilson().on(grid)
+    for _ in range(40):
+        cell = cast(Cell, grid[randrange(grid.rows - 1), randrange(grid.columns - 1)])
+        cell.link(cast(Cell, cell.south if randrange(2) else cell.east))
+    grid.set_weights({cell: randrange(6) for cell in grid.each_cell()})
+
+    masks = grid.link_masks()
+    bucket_values, _, (_, bucket_farthest) = cheapest_first(masks, grid.weights, grid.columns, 0, bucketed=True)
+    heap_values, _, (_, heap_farthest) = cheapest_first(masks, grid.weights, grid.columns, 0, bucketed=False)
+
+    assert bucket_values.tolist() == heap_values.tolist()
+    assert bucket_farthest == heap_farthest == max(heap_values.tolist())
+
+
+def test_cheapest_path_avoids_heavy_cells() -> None:
+    grid = WeightedColoredGrid(3, 3)
+    for cell in grid.each_cell():
+        for neighbor in cell.neighbors:
+            cell.link(neighbor)
+    # the straight way goes through the middle cell
+    grid.set_weight(cast(Cell, grid[1, 1]), 50)
+
+    path = Dijkstra.calculate_path(grid, (1, 0), (1, 2))
+
+    assert cast(Cell, grid[1, 1]) not in path.cells
+    assert len(path.cells) == 5
+    distances = cast(Cell, grid[1, 0]).distances
+    assert distances[cast(Cell, grid[1, 2])] == 4
+    assert distances[cast(Cell, grid[1, 1])] == 50
+
+
+def test_distances_follow_weight_changes() -> None:
+    grid = WeightedColoredGrid(2, 4)
+    for column in range(3):
+        cast(Cell, grid[0, column]).link(cast(Cell, grid[0, column + 1]))
+    grid.distances = cast(Cell, grid[0, 0]).distances
+    assert grid.maximum == 3
+
+    grid.set_weight(cast(Cell, grid[0, 2]), 10)
+
+    assert grid.maximum == 12
+    assert grid.background_color_for(cast(Cell, grid[0, 3])) == (128, 0, 0)
+
+    cast(Cell, grid[0, 2]).unlink(cast(Cell, grid[0, 3]))
+
+    assert grid.maximum == 11
+
+
+def test_negative_weight() -> None:
+    grid = WeightedGrid(2, 2)
+
+    with pytest.raises(ValueError):
+        grid.set_weight(cast(Cell, grid[0, 0]), -1)
+
+
+def test_set_weights_at_once() -> None:
+    grid = WeightedColoredGrid(2, 4)
+    for column in range(3):
+        cast(Cell, grid[0, column]).link(cast(Cell, grid[0, column + 1]))
+    grid.distances = cast(Cell, grid[0, 0]).distances
+    version = grid.version
+
+    grid.set_weights({cast(Cell, grid[0, 1]): 4, cast(Cell, grid[0, 2]): 10})
+
+    assert grid.version == version + 1
+    assert grid.maximum == 15
+    with pytest.raises(ValueError):
+        grid.set_weights({cast(Cell, grid[0, 1]): 1, cast(Cell, grid[0, 3]): -1})
+    assert grid.weight_of(cast(Cell, grid[0, 1])) == 4
+    assert grid.maximum == 15
@@ -0,0 +1,19 @@
+from random import seed
+
+from algorithms.wilson import Wilson
+from base.compact_grid import CompactGrid
+from test.uniformity import CHI_SQUARE_LIMIT, spanning_trees_chi_square
+
+
+def test_uniform_spanning_trees() -> None:
+    seed(3)
+    assert spanning_trees_chi_square(Wilson(), 15000) < CHI_SQUARE_LIMIT
+
+
+def test_perfect_maze_on_wide_grid() -> None:
+    grid = CompactGrid(3, 200)
+    Wilson().on(grid)
+
+    assert grid.passage_count == grid.size - 1
+    assert grid.deadend_count > 0
+    assert len(grid[0, 0].distances.cells) == grid.size    # type: ignore
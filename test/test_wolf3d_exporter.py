@@ -0,0 +1,54 @@
+import contextlib
+import io
+from pathlib import Path
+from random import seed
+
+import pytest
+
+from algorithms.eller import Eller
+from algorithms.recursive_backtracker import RecursiveBacktracker
+from base.colored_grid import ColoredGrid
+from base.compact_grid import CompactColoredGrid
+from base.mapped_grid import MappedColoredGrid
+from exporters.wolf3d_exporter import Wolf3DExporter
+
+
+def _render(grid: ColoredGrid, path: Path) -> bytes:
+    with contextlib.redirect_stdout(io.StringIO()):
+        Wolf3DExporter().render(grid, filename=str(path))
+    return path.read_bytes()
+
+
+def test_compact_grids_render_like_cell_grids(tmp_path: Path) -> None:
+    seed(5)
+    grid = ColoredGrid(12, 14)
+    RecursiveBacktracker().on(grid)
+    compact_grid = CompactColoredGrid(12, 14)
+    mapped_grid = MappedColoredGrid(12, 14)
+    for cell in grid.each_cell():
+        for target in (compact_grid, mapped_grid):
+            target.set_cell_at(cell.row, cell.column, cell)
+
+    expected = _render(grid, tmp_path / "grid.map")
+    assert len(expected) > 0
+    assert _render(compact_grid, tmp_path / "compact.map") == expected
+    assert _render(mapped_grid, tmp_path / "mapped.map") == expected
+    mapped_grid.close()
+
+
+def test_render_rows_as_grid(tmp_path: Path) -> None:
+    seed(9)
+    grid = ColoredGrid(10, 12)
+    Eller().on(grid)
+
+    streamed_path = tmp_path / "streamed.map"
+    with contextlib.redirect_stdout(io.StringIO()):
+        Wolf3DExporter().render_rows(grid.each_row_masks(), grid.columns, filename=str(streamed_path))
+    assert streamed_path.read_bytes() == _render(grid, tmp_path / "grid.map")
+
+
+def test_render_rows_too_big(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        Wolf3DExporter().render_rows(Eller().rows(10), 10, filename=str(tmp_path / "endless.map"))
+    with pytest.raises(ValueError):
+        Wolf3DExporter().render_rows(Eller().rows(40, 10), 40, filename=str(tmp_path / "wide.map"))
@@ -0,0 +1,25 @@
+from collections import Counter
+
+from algorithms.base_algorithm import Algorithm
+from base.compact_grid import CompactGrid
+
+
+# 2x3 cells have 15 spanning trees; chi-square critical value for their 14 degrees of freedom at p = 0.001
+SPANNING_TREES = 15
+CHI_SQUARE_LIMIT = 36.12
+
+
+def spanning_trees_chi_square(algorithm: Algorithm, runs: int) -> float:
+    """
+    Chi-square statistic of how often the algorithm carves each spanning tree of a 2x3 grid, against all of them being
+    equally likely
+    """
+    trees: Counter = Counter()
+    for _ in range(runs):
+        grid = CompactGrid(2, 3)
+        algorithm.on(grid)
+        trees[bytes(grid.link_masks())] += 1
+
+    assert len(trees) == SPANNING_TREES
+    expected = runs / SPANNING_TREES
+    return sum((count - expected) ** 2 / expected for count in trees.values())